@@ -1,4 +1,10 @@
 """
 Manage top-level imports
 """
+import django
+
+
 __version__ = "0.1.0"
+
+if django.VERSION < (3, 2):  # pragma: no cover
+    default_app_config = "fastview.apps.FastviewConfig"
@@ -0,0 +1,18 @@
+"""
+Django app config
+"""
+from django.apps import AppConfig
+from django.core import checks
+
+
+class FastviewConfig(AppConfig):
+    name = "fastview"
+    verbose_name = "Fastview"
+    default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        from .cache import watch_pending
+        from .checks import check_indexes
+
+        checks.register(check_indexes, "fastview")
+        watch_pending()
@@ -0,0 +1,247 @@
+"""
+Cache support
+
+Fastview cache entries are invalidated by generation: each watched model has a
+generation counter in the cache, which is bumped when an instance is saved or deleted,
+or its many-to-many relationships change. Cache keys include the generations of the
+models they depend on, so when a model changes its old entries are never read again,
+and expire naturally.
+
+To cache something in a fastview component, build its key with :func:`make_key` and
+make sure the models it depends on are watched with :func:`watch_model`::
+
+    watch_model(Entry)
+    key = make_key("entry-summary", entry.pk, models=[Entry, Comment])
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any, Iterable, List, Set, Type, Union
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+    from django.db.models import Model
+    from django.dispatch import Signal
+    from django.http import HttpRequest, QueryDict
+
+    from .views.mixins import AbstractFastView
+
+
+#: Prefix for all fastview cache keys
+KEY_PREFIX = "fastview"
+
+# Models which bump their generation when changed
+_watched: Set[Type[Model]] = set()
+
+# Through models which bump the generations of both sides when changed
+_watched_through: Set[Type[Model]] = set()
+
+# Models and views which were watched before the app registry was ready
+_pending_models: List[Union[str, Type[Model]]] = []
+_pending_views: List[Type[AbstractFastView]] = []
+
+
+def get_cache() -> BaseCache:
+    """
+    Return the cache used by fastview, set by ``settings.FASTVIEW_CACHE``
+    """
+    return caches[getattr(settings, "FASTVIEW_CACHE", "default")]
+
+
+def get_generation_key(model: Type[Model]) -> str:
+    return f"{KEY_PREFIX}:generation:{model._meta.label_lower}"
+
+
+def _initial_generation() -> int:
+    """
+    Start new counters from the clock, so a counter which has been evicted from the
+    cache won't restart at a value which has been used before
+    """
+    return int(time.time() * 1000)
+
+
+def get_generations(models: Iterable[Type[Model]]) -> List[int]:
+    """
+    Return the current generation of each model
+    """
+    cache = get_cache()
+    keys = [get_generation_key(model) for model in models]
+    found = cache.get_many(keys)
+    generations = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, _initial_generation(), timeout=None)
+            found[key] = cache.get(key)
+        generations.append(found[key])
+    return generations
+
+
+def bump_generation(model: Union[str, Type[Model]]):
+    """
+    Invalidate all cache entries which depend on the model
+
+    This is called automatically for watched models, but should be called after any
+    changes which don't send signals, such as ``QuerySet.update()``.
+    """
+    model = resolve_model(model)
+    cache = get_cache()
+    key = get_generation_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No counter yet, so nothing has been cached against it
+        cache.add(key, _initial_generation(), timeout=None)
+
+
+def make_key(*parts: Any, models: Iterable[Union[str, Type[Model]]] = ()) -> str:
+    """
+    Build a cache key from the given parts and the generations of the given models
+
+    The parts are converted to strings, so should be simple values which identify the
+    entry. The key will change when any of the models is changed, as long as they are
+    watched.
+    """
+    resolved = sorted(
+        {resolve_model(model) for model in models},
+        key=lambda model: model._meta.label_lower,
+    )
+    generations = get_generations(resolved)
+    raw = "|".join(str(part) for part in [*parts, *generations])
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{digest}"
+
+
+def get_canonical_query(params: QueryDict) -> str:
+    """
+    Return the query string for the params with keys and values in a stable order
+    """
+    return urlencode(
+        sorted((key, value) for key, values in params.lists() for value in values)
+    )
+
+
+def get_canonical_url(request: HttpRequest) -> str:
+    """
+    Return the absolute URL of the request with the query string in a stable order
+    """
+    url = request.build_absolute_uri(request.path)
+    query = get_canonical_query(request.GET)
+    if query:
+        url = f"{url}?{query}"
+    return url
+
+
+def resolve_model(model: Union[str, Type[Model]]) -> Type[Model]:
+    """
+    Return the model class for a model or ``"app_label.ModelName"`` string
+    """
+    if isinstance(model, str):
+        return apps.get_model(model)
+    return model
+
+
+def _bump_sender(sender: Type[Model], **kwargs):
+    bump_generation(sender)
+
+
+def _bump_m2m(sender: Type[Model], instance: Model, action: str, model, **kwargs):
+    if not action.startswith("post_"):
+        return
+    bump_generation(type(instance))
+    bump_generation(model)
+    bump_generation(sender)
+
+
+def watch_model(model: Union[str, Type[Model]]):
+    """
+    Bump the model's generation whenever an instance is saved or deleted, or its
+    many-to-many relationships change
+
+    Models watched before the app registry is ready will be watched by
+    ``FastviewConfig.ready()``
+    """
+    if not apps.models_ready:
+        _pending_models.append(model)
+        return
+
+    model = resolve_model(model)
+    if model in _watched:
+        return
+    _watched.add(model)
+    post_save.connect(_bump_sender, sender=model, weak=False)
+    post_delete.connect(_bump_sender, sender=model, weak=False)
+
+    for field in model._meta.get_fields(include_hidden=True):
+        if not field.many_to_many:
+            continue
+        through = getattr(field, "through", None) or field.remote_field.through
+        if through in _watched_through:
+            continue
+        _watched_through.add(through)
+        m2m_changed.connect(_bump_m2m, sender=through, weak=False)
+
+
+def has_receivers(signal: Signal, sender: Type[Model]) -> bool:
+    """
+    Return ``True`` if the signal has receivers for the sender, other than the
+    receivers connected by :func:`watch_model`
+    """
+    if not signal.has_listeners(sender):
+        return False
+    receivers = signal._live_receivers(sender)
+    if isinstance(receivers, tuple):
+        # Django 5.0+ returns sync and async receivers separately
+        receivers = [*receivers[0], *receivers[1]]
+    return any(receiver not in (_bump_sender, _bump_m2m) for receiver in receivers)
+
+
+def watch_view(view_cls: Type[AbstractFastView]):
+    """
+    Watch the models which a view's cache entries depend on
+
+    Views defined before the app registry is ready will be watched by
+    ``FastviewConfig.ready()``
+    """
+    if not apps.models_ready:
+        _pending_views.append(view_cls)
+        return
+
+    for model in view_cls().get_cache_models():
+        watch_model(model)
+
+
+def watch_pending():
+    """
+    Watch the models and views which were registered before the app registry was
+    ready
+    """
+    while _pending_models:
+        watch_model(_pending_models.pop())
+    while _pending_views:
+        watch_view(_pending_views.pop())
+
+
+def get_path_models(model: Type[Model], path: str) -> List[Type[Model]]:
+    """
+    Return the related models followed by a lookup path, eg ``author__profile__name``
+    """
+    models = []
+    for part in path.split("__"):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        model = field.related_model
+        models.append(model)
+    return models
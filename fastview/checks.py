@@ -0,0 +1,401 @@
+"""
+System checks
+
+The index advisor walks the fastviews in the URLconf, collects the model fields they
+filter, search and order by, and compares them with the indexes defined on the models.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router
+from django.db.models import Index
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.views.generic.list import MultipleObjectMixin
+
+from .permissions import Owner, Permission
+from .views.autocomplete import AutocompleteView
+from .views.filters import DateHierarchyFilter
+from .views.mixins import AbstractFastView, DisplayFieldMixin
+
+
+if TYPE_CHECKING:
+    from django.db.models import Field, Model
+
+
+#: Check ID for a field with no index
+W_MISSING_INDEX = "fastview.W001"
+
+#: Check ID for a field which is only indexed as part of a composite index
+W_NOT_LEADING = "fastview.W002"
+
+#: Check ID for a text search which a btree index cannot serve
+W_NO_TRIGRAM = "fastview.W003"
+
+#: Check ID for a view which could not be inspected
+W_VIEW_ERROR = "fastview.W004"
+
+#: Lookups which need a trigram index to avoid a full table scan on PostgreSQL
+TRIGRAM_LOOKUPS = ["contains", "icontains", "istartswith", "endswith", "iendswith"]
+
+
+class FieldUsage:
+    """
+    A model field which a fastview will use in a query
+    """
+
+    model: Type[Model]
+    field: Field
+    lookup: str
+    source: str
+
+    def __init__(self, model: Type[Model], field: Field, lookup: str, source: str):
+        self.model = model
+        self.field = field
+        self.lookup = lookup
+        self.source = source
+
+
+class IndexIssue:
+    """
+    A missing or mismatched index, and the views which need it
+    """
+
+    id: str
+    model: Type[Model]
+    field: Field
+    sources: Set[str]
+
+    messages = {
+        W_MISSING_INDEX: "{label} is used by fastviews but has no database index.",
+        W_NOT_LEADING: (
+            "{label} is used by fastviews but is not the leading column of an index."
+        ),
+        W_NO_TRIGRAM: (
+            "{label} is searched by fastviews with a substring lookup, which a btree "
+            "index cannot serve."
+        ),
+    }
+
+    hints = {
+        W_MISSING_INDEX: "Set db_index=True on the field or add it to Meta.indexes.",
+        W_NOT_LEADING: "Add an index with this field first.",
+        W_NO_TRIGRAM: "Add a GinIndex with opclasses=['gin_trgm_ops'].",
+    }
+
+    def __init__(self, id: str, model: Type[Model], field: Field):
+        self.id = id
+        self.model = model
+        self.field = field
+        self.sources = set()
+
+    @property
+    def label(self) -> str:
+        return f"{self.model._meta.label}.{self.field.name}"
+
+    @property
+    def message(self) -> str:
+        return self.messages[self.id].format(label=self.label)
+
+    @property
+    def hint(self) -> str:
+        used_by = ", ".join(sorted(self.sources))
+        return f"{self.hints[self.id]} Used by {used_by}."
+
+    def as_warning(self) -> checks.Warning:
+        return checks.Warning(self.message, hint=self.hint, obj=self.model, id=self.id)
+
+    def get_index(self) -> Index:
+        """
+        Return an index which would resolve this issue, for a migration stub
+        """
+        if self.id == W_NO_TRIGRAM:
+            from django.contrib.postgres.indexes import GinIndex
+
+            named = GinIndex(fields=[self.field.name])
+            named.set_name_with_model(self.model)
+            return GinIndex(
+                fields=[self.field.name], name=named.name, opclasses=["gin_trgm_ops"]
+            )
+
+        index = Index(fields=[self.field.name])
+        index.set_name_with_model(self.model)
+        return index
+
+
+def iter_fastviews(
+    patterns: Optional[List] = None,
+) -> Iterator[Type[AbstractFastView]]:
+    """
+    Find all fastview classes served by the URLconf
+    """
+    if patterns is None:
+        if not getattr(settings, "ROOT_URLCONF", None):
+            return
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_fastviews(pattern.url_patterns)
+
+        elif isinstance(pattern, URLPattern):
+            view_cls = getattr(pattern.callback, "view_class", None)
+            if view_cls and issubclass(view_cls, AbstractFastView):
+                yield view_cls
+
+
+def iter_permissions(permission: Optional[Permission]) -> Iterator[Permission]:
+    """
+    Walk a permission and any permissions it combines
+    """
+    if permission is None:
+        return
+    yield permission
+    for attr in ("left", "right", "permission"):
+        child = getattr(permission, attr, None)
+        if isinstance(child, Permission):
+            yield from iter_permissions(child)
+
+
+def resolve_field_path(
+    model: Type[Model], path: str
+) -> Optional[Tuple[Type[Model], Field, str]]:
+    """
+    Follow a lookup path such as ``author__username__icontains`` to its final field
+
+    Returns:
+        A tuple of ``(model, field, lookup)`` for the final field, or ``None`` if the
+        path does not end on a model field
+    """
+    parts = path.split("__")
+    current = model
+    field: Optional[Field] = None
+    for index, part in enumerate(parts):
+        is_last = index == len(parts) - 1
+        if field is not None:
+            if not field.is_relation or field.related_model is None:
+                return (field.model, field, part) if is_last else None
+            current = field.related_model
+
+        name = current._meta.pk.name if part == "pk" else part
+        try:
+            next_field = current._meta.get_field(name)
+        except FieldDoesNotExist:
+            if field is not None and is_last:
+                return field.model, field, part
+            return None
+        field = next_field
+
+    if field is None:
+        return None
+    return field.model, field, "exact"
+
+
+def get_view_label(view_cls: Type[AbstractFastView]) -> str:
+    """
+    Return a name to identify the view in the report
+    """
+    if view_cls.viewgroup:
+        return f"{type(view_cls.viewgroup).__name__}.{getattr(view_cls, 'action')}"
+    return f"{view_cls.__module__}.{view_cls.__qualname__}"
+
+
+def get_view_field_usage(view_cls: Type[AbstractFastView]) -> Iterator[FieldUsage]:
+    """
+    Collect the model fields which the view will use in queries
+    """
+    model = getattr(view_cls, "model", None)
+    if model is None:
+        return
+
+    view = view_cls()
+    label = get_view_label(view_cls)
+    paths: List[Tuple[str, str]] = []
+
+    # Filters
+    if hasattr(view, "get_filters"):
+        for filter_obj in view.get_filters().values():
+            kind = "date" if isinstance(filter_obj, DateHierarchyFilter) else "filter"
+            paths.append((filter_obj.field_name, kind))
+
+    # Search
+    if hasattr(view, "get_search_rule"):
+        for search_field in getattr(view, "search_fields", None) or []:
+            paths.append((view.get_search_rule(search_field), "search"))
+
+    # Autocomplete search on related models
+    if isinstance(view, AutocompleteView):
+        for field_name, search_fields in (view.autocomplete_fields or {}).items():
+            for search_field in search_fields:
+                path = f"{field_name}__{search_field}__{view.lookup}"
+                paths.append((path, "autocomplete"))
+
+    # Ordering by display values
+    if isinstance(view, DisplayFieldMixin) and isinstance(view, MultipleObjectMixin):
+        for display_value in view.get_fields():
+            try:
+                order_by = display_value.get_order_by(view)
+            except (AttributeError, NotImplementedError):
+                continue
+            paths.append((order_by.lstrip("-"), "order"))
+
+    # Owner permissions
+    for permission in [
+        *iter_permissions(view_cls.get_permission()),
+        *iter_permissions(getattr(view_cls, "row_permission", None)),
+    ]:
+        if isinstance(permission, Owner):
+            paths.append((permission.owner_field, "owner"))
+
+    for path, kind in paths:
+        resolved = resolve_field_path(model, path)
+        if resolved is None:
+            continue
+        field_model, field, lookup = resolved
+        if not field.concrete or field.many_to_many:
+            continue
+        yield FieldUsage(field_model, field, lookup, f"{label} ({kind})")
+
+
+def get_index_field_lists(model: Type[Model]) -> Iterator[Tuple[List[str], str]]:
+    """
+    Return ``(field names, opclass)`` for each multi-purpose index on the model
+
+    The opclass is the opclass of the leading field, or an empty string for a btree.
+    Partial and expression indexes are ignored.
+    """
+    opts = model._meta
+    for index in opts.indexes:
+        if index.condition or not index.fields:
+            continue
+        fields = [name.lstrip("-") for name in index.fields]
+        opclass = index.opclasses[0] if index.opclasses else ""
+        if type(index) is Index or type(index).__name__ == "BTreeIndex":
+            yield fields, opclass
+        elif opclass in ("gin_trgm_ops", "gist_trgm_ops"):
+            yield fields, opclass
+
+    for fields in [*opts.index_together, *opts.unique_together]:
+        yield list(fields), ""
+
+    for constraint in opts.constraints:
+        if getattr(constraint, "condition", None) or not getattr(
+            constraint, "fields", None
+        ):
+            continue
+        yield list(constraint.fields), ""
+
+
+def check_field_usage(usage: FieldUsage) -> Optional[str]:
+    """
+    Check whether the field has an index which serves this usage
+
+    Returns:
+        The ID of the issue, or ``None`` if the field is suitably indexed
+    """
+    field = usage.field
+    index_lists = list(get_index_field_lists(usage.model))
+
+    if usage.lookup in TRIGRAM_LOOKUPS:
+        database = router.db_for_read(usage.model)
+        if connections[database].vendor != "postgresql":
+            # Nothing an index can do about it
+            return None
+
+        for fields, opclass in index_lists:
+            if field.name in fields and opclass.endswith("_trgm_ops"):
+                return None
+        return W_NO_TRIGRAM
+
+    if field.primary_key or field.unique or field.db_index:
+        return None
+
+    is_in_composite = False
+    for fields, opclass in index_lists:
+        if opclass.endswith("_trgm_ops"):
+            continue
+        if fields[0] == field.name:
+            return None
+        if field.name in fields:
+            is_in_composite = True
+
+    if is_in_composite:
+        return W_NOT_LEADING
+    return W_MISSING_INDEX
+
+
+def find_index_issues(
+    views: Optional[List[Type[AbstractFastView]]] = None,
+    view_warnings: Optional[List[checks.Warning]] = None,
+) -> List[IndexIssue]:
+    """
+    Return a list of index issues for the given views, or all views in the URLconf
+
+    Views which raise an exception when inspected, such as a filter on a field which
+    does not exist, are skipped; if a ``view_warnings`` list is given, a warning is
+    added to it for each one.
+    """
+    if views is None:
+        views = list(iter_fastviews())
+
+    issues: Dict[Tuple[str, Type[Model], str], IndexIssue] = {}
+    seen: Set[Type[AbstractFastView]] = set()
+    for view_cls in views:
+        if view_cls in seen:
+            continue
+        seen.add(view_cls)
+
+        # A misconfigured view must not stop every management command from running
+        try:
+            usages = list(get_view_field_usage(view_cls))
+        except Exception as error:
+            if view_warnings is not None:
+                view_warnings.append(get_view_warning(view_cls, error))
+            continue
+
+        for usage in usages:
+            issue_id = check_field_usage(usage)
+            if issue_id is None:
+                continue
+            key = (issue_id, usage.model, usage.field.name)
+            if key not in issues:
+                issues[key] = IndexIssue(issue_id, usage.model, usage.field)
+            issues[key].sources.add(usage.source)
+
+    return sorted(issues.values(), key=lambda issue: (issue.label, issue.id))
+
+
+def get_view_warning(
+    view_cls: Type[AbstractFastView], error: Exception
+) -> checks.Warning:
+    """
+    Return a check warning for a view which could not be inspected
+    """
+    return checks.Warning(
+        f"{get_view_label(view_cls)} could not be checked for indexes: {error}",
+        hint="Check the view's filters, search fields and display fields.",
+        obj=view_cls,
+        id=W_VIEW_ERROR,
+    )
+
+
+def check_indexes(app_configs=None, **kwargs) -> List[checks.CheckMessage]:
+    """
+    System check to warn about fields used by fastviews which are not indexed
+    """
+    view_warnings: List[checks.Warning] = []
+    issues = find_index_issues(view_warnings=view_warnings)
+    if app_configs is not None:
+        issues = [
+            issue for issue in issues if issue.model._meta.app_config in app_configs
+        ]
+        view_warnings = [
+            warning
+            for warning in view_warnings
+            if getattr(warning.obj, "model", None) is None
+            or warning.obj.model._meta.app_config in app_configs
+        ]
+    return [*view_warnings, *(issue.as_warning() for issue in issues)]
@@ -1,6 +1,10 @@
 VIEW_SUFFIX = "_view"
 INDEX_VIEW = "index"
 OBJECT_VIEW = "detail"
+CREATE_VIEW = "create"
+UPDATE_VIEW = "update"
+DELETE_VIEW = "delete"
+AUTOCOMPLETE_VIEW = "autocomplete"
 
 # Path slug for view template fragments
 TEMPLATE_FRAGMENT_SLUG = "fragments"
@@ -10,3 +14,8 @@ PARAM_ORDER = "o"
 PARAM_PAGE = "p"
 PARAM_LIMIT = "l"
 PARAM_SEARCH = "q"
+
+# List bulk action form keys
+PARAM_ACTION = "action"
+PARAM_SELECTED = "selected"
+PARAM_SELECT_ALL = "select_all"
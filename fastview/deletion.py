@@ -0,0 +1,142 @@
+"""
+Delete objects with large cascades in chunks, outside the request
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Type
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Model
+
+from .cache import bump_generation
+from .models import DeletionJob
+from .views.cascade import get_cascade
+
+
+#: Run deletion jobs in a thread pool in the web process
+RUNNER_THREAD = "thread"
+
+#: Leave deletion jobs for the ``fastview_delete_worker`` management command
+RUNNER_COMMAND = "command"
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool for deletion jobs, with ``FASTVIEW_DELETION_WORKERS``
+    threads (default 1)
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "FASTVIEW_DELETION_WORKERS", 1),
+            thread_name_prefix="fastview-deletion",
+        )
+    return _executor
+
+
+def start_deletion(
+    obj: Model, batch_size: int = 1000, runner: str = RUNNER_THREAD
+) -> DeletionJob:
+    """
+    Create a job to delete the object and its related objects in the background
+
+    If using the thread runner, the job is started once the current transaction commits.
+    """
+    job = DeletionJob.objects.create(
+        model_label=obj._meta.label,
+        object_pk=str(obj.pk),
+        object_repr=str(obj)[:255],
+        batch_size=batch_size,
+    )
+    if runner == RUNNER_THREAD:
+        transaction.on_commit(lambda: get_executor().submit(_run_in_thread, job.pk))
+
+    # Cached pages and lists which hide the object need to be rebuilt
+    bump_generation(type(obj))
+    return job
+
+
+def get_deleting_pks(model: Type[Model]) -> List[Any]:
+    """
+    Return the primary keys of the model's objects which have a deletion job which has
+    not finished
+    """
+    pk_field = model._meta.pk
+    object_pks = DeletionJob.objects.filter(
+        model_label=model._meta.label,
+        status__in=[DeletionJob.STATUS_PENDING, DeletionJob.STATUS_RUNNING],
+    ).values_list("object_pk", flat=True)
+    return [pk_field.to_python(object_pk) for object_pk in object_pks]
+
+
+def _run_in_thread(job_pk: int):
+    try:
+        run_deletion_job(DeletionJob.objects.get(pk=job_pk))
+    finally:
+        # Threads get their own connections, which Django won't close for us
+        connections.close_all()
+
+
+def run_deletion_job(job: DeletionJob) -> bool:
+    """
+    Delete the related objects of the job's object in chunks, then the object itself
+
+    Related objects are found with :func:`fastview.views.cascade.get_cascade`, and
+    deleted from the end of the cascade back to the object, with one
+    ``DELETE ... WHERE pk IN (...)`` of up to ``job.batch_size`` rows per transaction.
+    Progress is saved to the job after each chunk.
+
+    Returns ``False`` if the job had already been claimed by another worker.
+    """
+    claimed = DeletionJob.objects.filter(
+        pk=job.pk, status=DeletionJob.STATUS_PENDING
+    ).update(status=DeletionJob.STATUS_RUNNING)
+    if not claimed:
+        return False
+    job.status = DeletionJob.STATUS_RUNNING
+
+    model = job.model
+    try:
+        obj = model._base_manager.filter(pk=job.object_pk).first()
+        if obj is not None:
+            delete_in_chunks(job, obj)
+    except Exception as error:
+        # Nobody is waiting on a background job, so record why it stopped
+        job.status = DeletionJob.STATUS_FAILED
+        job.error = str(error)
+    else:
+        job.status = DeletionJob.STATUS_DONE
+    job.save(update_fields=["status", "error", "updated"])
+
+    bump_generation(model)
+    return True
+
+
+def delete_in_chunks(job: DeletionJob, obj: Model):
+    # Follow every level, so the final delete has nothing left to collect
+    cascade = get_cascade(obj, max_depth=None)
+    protected = [count.label for count in cascade if count.protected]
+    if protected:
+        raise ValueError(f"Protected by {', '.join(protected)}")
+
+    job.total = sum(count.total for count in cascade if count.deleted)
+    job.save(update_fields=["total", "updated"])
+
+    for count in reversed(cascade):
+        if not count.deleted:
+            continue
+
+        manager = count.model._base_manager
+        queryset = manager.filter(**{count.lookup: obj.pk})
+        while True:
+            pks = list(queryset.values_list("pk", flat=True)[: job.batch_size])
+            if not pks:
+                break
+            with transaction.atomic():
+                manager.filter(pk__in=pks).delete()
+            job.deleted += len(pks)
+            job.save(update_fields=["deleted", "updated"])
+
+    obj.delete()
@@ -5,3 +5,10 @@ Exceptions raised by FastView
 
 class FastViewException(Exception):  # pragma: no cover
     pass
+
+
+class ConflictError(FastViewException):
+    """
+    An object could not be saved because it was changed by someone else since the form
+    was rendered
+    """
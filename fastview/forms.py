@@ -2,16 +2,294 @@
 Form classes
 """
 
-from typing import List
+import copy
+import uuid
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Type
 
-from django.db import transaction
-from django.forms import BaseInlineFormSet, ModelForm
+from django import forms
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured, ValidationError
+from django.db import models, router, transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import m2m_changed
+from django.forms import (
+    BaseForm,
+    BaseInlineFormSet,
+    BaseModelForm,
+    BaseModelFormSet,
+    ModelChoiceField,
+    ModelForm,
+)
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
+from .cache import bump_generation
+from .exceptions import ConflictError
+
+
+#: Name of the hidden form field with the version of the object being edited
+VERSION_FIELD_NAME = "fastview_version"
+
+CONFLICT_MESSAGE = _(
+    "This has been changed by someone else since you started editing it. Reload the "
+    "page to see their changes."
+)
+
+
+def get_changed_fields(form: ModelForm, exclude: Iterable[str] = ()) -> List[str]:
+    """
+    Return the names of the concrete model fields changed by a model form
+
+    If any fields changed, fields with ``auto_now`` are included, as they are set
+    whenever the object is saved.
+    """
+    concrete = {
+        field.name: field
+        for field in form.instance._meta.concrete_fields
+        if not field.primary_key and field.name not in exclude
+    }
+    names = [name for name in form.changed_data if name in concrete]
+    if names:
+        names += [
+            name
+            for name, field in concrete.items()
+            if getattr(field, "auto_now", False) and name not in names
+        ]
+    return names
+
+
+def bulk_update_fields(
+    model: Type[Model], objs: List[Model], field_names: Iterable[str]
+) -> None:
+    """
+    Save the named fields of the objects with a single ``bulk_update``, and invalidate
+    the model's caches
+
+    Each field's ``pre_save`` is called first, so values such as ``auto_now`` are set.
+    This does not call the model's ``save()`` or send save signals.
+    """
+    field_names = list(field_names)
+    if not objs or not field_names:
+        return
+
+    fields = [model._meta.get_field(name) for name in field_names]
+    for obj in objs:
+        for field in fields:
+            # Let fields prepare their values, eg auto_now or file uploads
+            setattr(obj, field.attname, field.pre_save(obj, add=False))
+    model._default_manager.bulk_update(objs, field_names)
+    bump_generation(model)
+
+
+def form_overrides_save(
+    form_class: Type[BaseModelForm], after: Optional[Type[BaseModelForm]] = None
+) -> bool:
+    """
+    Check if a model form class overrides ``save()``, which saving with partial or bulk
+    queries would not call
+
+    If ``after`` is given, only the classes after it in the MRO are checked.
+    """
+    mro = form_class.__mro__
+    if after is not None:
+        mro = mro[mro.index(after) + 1 :]
+    for cls in mro:
+        if cls is BaseModelForm:
+            break
+        if "save" in vars(cls):
+            return True
+    return False
+
+
+class SharedChoices:
+    """
+    Share the choices of model choice fields between forms
+
+    Each distinct choice queryset is evaluated once, the first time any form using it
+    is rendered, and the choices are reused by every other form.
+    """
+
+    choices: Dict[Hashable, List[Any]]
+
+    def __init__(self):
+        self.choices = {}
+
+    def get_key(self, field: ModelChoiceField) -> Optional[Hashable]:
+        """
+        Return a key which identifies the choices the field will generate, or ``None``
+        if they can't be shared
+        """
+        queryset = field.queryset
+        if queryset is None:
+            return None
+        try:
+            query = str(queryset.query)
+        except EmptyResultSet:
+            return None
+        return (
+            type(field),
+            queryset.model,
+            query,
+            field.empty_label,
+            field.to_field_name or queryset.model._meta.pk.name,
+        )
+
+    def get_choices(self, key: Hashable, field: ModelChoiceField) -> Callable:
+        """
+        Return a callable which evaluates the choices on first use
+        """
+
+        def choices():
+            if key not in self.choices:
+                # Iterate rather than list() to avoid a COUNT from len()
+                self.choices[key] = [choice for choice in field.iterator(field)]
+            return self.choices[key]
+
+        return choices
+
+    def apply(self, form: BaseForm):
+        """
+        Make the form's model choice fields use the shared choices
+        """
+        for field in form.fields.values():
+            if not isinstance(field, ModelChoiceField):
+                continue
+            key = self.get_key(field)
+            if key is not None:
+                field.choices = self.get_choices(key, field)
+
+
+def save_m2m_diff(
+    instance: Model, field: models.ManyToManyField, values: Iterable[Model]
+):
+    """
+    Set a many-to-many field to the given objects by changing only the rows which
+    differ
+
+    One query finds the current relations, then the changes are made with at most one
+    DELETE and one INSERT. ``m2m_changed`` is sent once for the removals and once for
+    the additions, as Django's related managers do.
+    """
+    through = field.remote_field.through
+    source_fk = through._meta.get_field(field.m2m_field_name())
+    target_fk = through._meta.get_field(field.m2m_reverse_field_name())
+    source_value = getattr(instance, source_fk.target_field.attname)
+    db = router.db_for_write(through, instance=instance)
+    manager = through._default_manager.using(db)
+    rows = manager.filter(**{source_fk.attname: source_value})
+
+    current = set(rows.values_list(target_fk.attname, flat=True))
+    new = {getattr(obj, target_fk.target_field.attname) for obj in values}
+    signal_kwargs = dict(
+        sender=through,
+        instance=instance,
+        reverse=False,
+        model=field.remote_field.model,
+        using=db,
+    )
+
+    removed = current - new
+    if removed:
+        m2m_changed.send(action="pre_remove", pk_set=removed, **signal_kwargs)
+        rows.filter(**{f"{target_fk.attname}__in": removed}).delete()
+        m2m_changed.send(action="post_remove", pk_set=removed, **signal_kwargs)
+
+    added = new - current
+    if added:
+        m2m_changed.send(action="pre_add", pk_set=added, **signal_kwargs)
+        manager.bulk_create(
+            [
+                through(**{source_fk.attname: source_value, target_fk.attname: pk})
+                for pk in added
+            ]
+        )
+        m2m_changed.send(action="post_add", pk_set=added, **signal_kwargs)
+
+
+class AutocompleteWidgetMixin:
+    """
+    Select widget which loads its choices from an autocomplete URL
+
+    Only the selected options are rendered, and they are loaded in a single query.
+    """
+
+    allow_multiple_selected: bool
+    create_option: Callable
+
+    def __init__(
+        self,
+        url: str,
+        queryset: QuerySet,
+        to_field_name: Optional[str] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+    ):
+        attrs = {**(attrs or {}), "data-fastview-autocomplete": url}
+        super().__init__(attrs)  # type: ignore
+        self.url = url
+        self.queryset = queryset
+        self.to_field_name = to_field_name
+
+    def optgroups(self, name, value, attrs=None):
+        """
+        Build options for the selected values
+        """
+        key = self.to_field_name or "pk"
+        values = [val for val in value if val not in ("", None)]
+        options = []
+        if not self.allow_multiple_selected:
+            options.append(self.create_option(name, "", "---------", not values, 0))
+        if values:
+            for obj in self.queryset.filter(**{f"{key}__in": values}):
+                options.append(
+                    self.create_option(
+                        name, str(getattr(obj, key)), str(obj), True, len(options)
+                    )
+                )
+        return [(None, [option], option["index"]) for option in options]
+
+
+class AutocompleteSelect(AutocompleteWidgetMixin, forms.Select):
+    pass
+
+
+class AutocompleteSelectMultiple(AutocompleteWidgetMixin, forms.SelectMultiple):
+    pass
+
+
+def use_autocomplete(form: BaseForm, name: str, url: str):
+    """
+    Make a model choice field on the form use an autocomplete widget
+    """
+    field = form.fields[name]
+    widget_cls: Type[forms.Select] = AutocompleteSelect
+    if isinstance(field, forms.ModelMultipleChoiceField):
+        widget_cls = AutocompleteSelectMultiple
+    field.widget = widget_cls(
+        url=url,
+        queryset=field.queryset,
+        to_field_name=field.to_field_name,
+        attrs=field.widget.attrs,
+    )
+
 
 class InlineParentModelForm(ModelForm):
     formsets: List[BaseInlineFormSet]
 
+    #: Only save the fields of an existing object which have changed. Set by
+    #: ``FormFieldMixin``
+    partial_save: bool = False
+
+    #: Names of the fields to update in a partial save, or ``None`` to update the fields
+    #: which differ from the object as it was loaded. Set by ``FormFieldMixin``
+    update_fields: Optional[List[str]] = None
+
+    # Concrete field values of the object when the form was created, by attname
+    loaded_values: Dict[str, Any]
+
+    #: Name of the model field used to detect conflicting edits, or ``None`` to save
+    #: without checking. Set by ``add_version_field()``
+    version_field: Optional[str] = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__init_inlines__()
@@ -21,6 +299,7 @@ class InlineParentModelForm(ModelForm):
         Called by __init__, or call manually if re-typing an existing form instance
         """
         self.formsets = []
+        self.loaded_values = self.get_field_values()
 
     def add_formset(self, formset: BaseInlineFormSet):
         self.formsets.append(formset)
@@ -39,22 +318,219 @@ class InlineParentModelForm(ModelForm):
 
         return form_valid
 
+    def get_field_values(self) -> Dict[str, Any]:
+        """
+        Return the values of the object's loaded concrete fields, by attname
+        """
+        values = {}
+        deferred = self.instance.get_deferred_fields()
+        for field in self.instance._meta.concrete_fields:
+            if field.primary_key or field.attname in deferred:
+                continue
+            value = getattr(self.instance, field.attname)
+            if isinstance(value, (dict, list)):
+                # Mutable values such as JSON could be changed in place
+                value = copy.deepcopy(value)
+            values[field.attname] = value
+        return values
+
+    def get_update_fields(self) -> List[str]:
+        """
+        Return the names of the fields to update in a partial save
+
+        Unless ``update_fields`` is set, these are the fields which differ from the
+        object as it was loaded, so fields changed by the view are saved as well as
+        those changed by the form. If any fields changed, fields with ``auto_now`` are
+        included, as they are set whenever the object is saved.
+        """
+        if self.update_fields is not None:
+            return self.update_fields
+
+        names = []
+        auto_now = []
+        for field in self.instance._meta.concrete_fields:
+            if field.primary_key:
+                continue
+            if getattr(field, "auto_now", False):
+                auto_now.append(field.name)
+            elif field.attname not in self.loaded_values:
+                # Deferred when loaded; only save it if it has been set since
+                if field.attname in self.instance.__dict__:
+                    names.append(field.name)
+            elif (
+                getattr(self.instance, field.attname)
+                != self.loaded_values[field.attname]
+            ):
+                names.append(field.name)
+
+        if names:
+            names += [name for name in auto_now if name not in names]
+        return names
+
+    def has_custom_save(self) -> bool:
+        """
+        Check if a form class after this one overrides ``save()``, which a partial save
+        would not call
+        """
+        return form_overrides_save(type(self), after=InlineParentModelForm)
+
+    def add_version_field(self, version_field: str):
+        """
+        Add a hidden field with the object's current version, so the object will only
+        be saved if nobody else has changed it since the form was rendered
+        """
+        self.version_field = version_field
+        self.fields[VERSION_FIELD_NAME] = forms.CharField(
+            widget=forms.HiddenInput, required=False
+        )
+        field = self.instance._meta.get_field(version_field)
+        self.initial[VERSION_FIELD_NAME] = field.value_to_string(self.instance)
+
+    def clean(self):
+        """
+        Check the submitted version matches the object's version
+        """
+        cleaned_data = super().clean()
+        if self.version_field is not None and cleaned_data.get(
+            VERSION_FIELD_NAME
+        ) != self.initial.get(VERSION_FIELD_NAME):
+            raise ValidationError(CONFLICT_MESSAGE, code="conflict")
+        return cleaned_data
+
+    def claim_version(self):
+        """
+        Move the object to a new version with a conditional UPDATE, if it is still at
+        the submitted version
+
+        Raises a ``ConflictError`` if the object has been changed since the form was
+        rendered. Called inside the save transaction, so a conflict rolls back the save.
+        """
+        model = type(self.instance)
+        field = model._meta.get_field(self.version_field)
+        version = field.to_python(self.cleaned_data[VERSION_FIELD_NAME] or None)
+        next_version = self.get_next_version(field, version)
+        claimed = model._default_manager.filter(
+            pk=self.instance.pk, **{field.attname: version}
+        ).update(**{field.attname: next_version})
+        if not claimed:
+            raise ConflictError(CONFLICT_MESSAGE)
+        setattr(self.instance, field.attname, next_version)
+
+        # The UPDATE sends no signals, so invalidate cached copies of the object
+        bump_generation(model)
+
+    def has_changes(self) -> bool:
+        """
+        Check if saving the form will change the object or its inlines
+        """
+        return bool(
+            self.has_changed()
+            or self.get_update_fields()
+            or any(formset.has_changed() for formset in self.formsets)
+        )
+
+    def get_next_version(self, field: models.Field, version: Any) -> Any:
+        """
+        Return a new version for the object
+        """
+        if isinstance(field, models.IntegerField):
+            return (version or 0) + 1
+        if isinstance(field, models.DateTimeField):
+            return timezone.now()
+        if isinstance(field, models.UUIDField):
+            return uuid.uuid4()
+        raise ImproperlyConfigured(
+            f"Cannot generate a new version for {type(field).__name__} {field.name}"
+        )
+
     def save(self, commit=True):
         """
         Save this form's self.instance object if commit=True, and then save the inline
         formsets.
 
+        If ``partial_save`` is set, only the changed fields of an existing object are
+        saved; see :meth:`save_changed`. If a form class overrides ``save()``, the object
+        is saved in full by calling it.
+
+        If the form has a version field, the object's version is claimed first, and a
+        ``ConflictError`` is raised if it has been changed since the form was rendered.
+        A partial save with no changes does not claim the version, so makes no queries.
+
         If commit=False, add a save_formsets() method to the form which can be called
         after the instance is saved manually at a later time.
         """
+        partial = (
+            commit
+            and self.partial_save
+            and not self.instance._state.adding
+            and not self.has_custom_save()
+        )
         with transaction.atomic():
-            instance = super().save(commit)
+            if (
+                commit
+                and self.version_field is not None
+                and not self.instance._state.adding
+                and (not partial or self.has_changes())
+            ):
+                self.claim_version()
+            if partial:
+                instance = self.save_changed()
+            else:
+                instance = super().save(commit)
             for formset in self.formsets:
                 formset.instance = instance
                 formset.save(commit=commit)
 
         return instance
 
+    def _save_m2m(self):
+        """
+        Save the many-to-many fields and generic relations for this form
+
+        Many-to-many fields with an automatic through model are saved with
+        :func:`save_m2m_diff`; others, and symmetrical relations which also need their
+        mirror rows written, are saved by the field as usual.
+        """
+        cleaned_data = self.cleaned_data
+        exclude = self._meta.exclude
+        fields = self._meta.fields
+        opts = self.instance._meta
+        for field in chain(opts.many_to_many, opts.private_fields):
+            if not hasattr(field, "save_form_data"):
+                continue
+            if fields and field.name not in fields:
+                continue
+            if exclude and field.name in exclude:
+                continue
+            if field.name not in cleaned_data:
+                continue
+            if (
+                isinstance(field, models.ManyToManyField)
+                and field.remote_field.through._meta.auto_created
+                and not field.remote_field.symmetrical
+            ):
+                save_m2m_diff(self.instance, field, cleaned_data[field.name])
+            else:
+                field.save_form_data(self.instance, cleaned_data[field.name])
+
+    def save_changed(self):
+        """
+        Save the changed fields of an existing object, and its many-to-many data
+
+        The fields are found by :meth:`get_update_fields`. If no fields were changed,
+        the object is not saved.
+        """
+        if self.errors:
+            raise ValueError(
+                f"The {self.instance._meta.object_name} could not be changed because "
+                "the data didn't validate."
+            )
+        update_fields = self.get_update_fields()
+        if update_fields:
+            self.instance.save(update_fields=update_fields)
+        self._save_m2m()
+        return self.instance
+
 
 class InlineChildModelForm(ModelForm):
     @property
@@ -66,3 +542,46 @@ class InlineChildModelForm(ModelForm):
             return str(self.instance)
         model = type(self.instance)
         return _(f"New {model._meta.verbose_name.title()}")
+
+
+class ListEditFormSet(BaseModelFormSet):
+    """
+    Model formset for a known list of objects, such as a page of a list view
+
+    Submitted primary keys are matched against the list, so no queries are needed to
+    find the objects. Rows for objects which are not in the list are ignored.
+    """
+
+    objects: List[Model]
+
+    def __init__(self, *args, objects: Iterable[Model] = (), **kwargs):
+        self.objects = list(objects)
+        super().__init__(*args, **kwargs)
+
+    def get_queryset(self) -> List[Model]:
+        return self.objects
+
+    def add_fields(self, form: BaseForm, index: Optional[int]):
+        """
+        Check the primary key against the list rather than looking it up
+        """
+        super().add_fields(form, index)
+        pk_field = form.fields[self._pk_field.name]
+        form.fields[self._pk_field.name] = forms.TypedChoiceField(
+            choices=[(obj.pk, obj.pk) for obj in self.objects],
+            coerce=self._pk_field.to_python,
+            required=False,
+            initial=pk_field.initial,
+            widget=forms.HiddenInput,
+        )
+
+    @property
+    def changed_forms(self) -> List[ModelForm]:
+        """
+        Return the forms for objects in the list which have been changed
+        """
+        return [
+            form
+            for form in self.initial_forms
+            if not form.instance._state.adding and form.has_changed()
+        ]
@@ -0,0 +1,42 @@
+"""
+Run pending background deletion jobs
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...deletion import run_deletion_job
+from ...models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Run pending deletion jobs created by DeleteView.background_delete, deleting "
+        "related objects in chunks"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll",
+            type=int,
+            default=0,
+            help="Keep running, checking for new jobs every POLL seconds",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            self.run_pending()
+            if not options["poll"]:
+                break
+            time.sleep(options["poll"])
+
+    def run_pending(self):
+        jobs = DeletionJob.objects.filter(status=DeletionJob.STATUS_PENDING).order_by(
+            "created"
+        )
+        for job in jobs:
+            if not run_deletion_job(job):
+                continue
+            self.stdout.write(f"{job}: {job.get_status_display()}")
+            if job.error:
+                self.stdout.write(f"    {job.error}")
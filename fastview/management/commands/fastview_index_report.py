@@ -0,0 +1,80 @@
+"""
+Report fields used by fastviews which are missing database indexes
+"""
+from typing import Dict, List
+
+from django.core import checks
+from django.core.management.base import BaseCommand
+from django.db import migrations
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+
+from ...checks import W_NO_TRIGRAM, IndexIssue, find_index_issues
+
+
+class Command(BaseCommand):
+    help = (
+        "Report model fields which fastviews filter, search or order by, which are "
+        "missing a suitable database index"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "app_label",
+            nargs="*",
+            help="Only report on models in these apps",
+        )
+        parser.add_argument(
+            "--migration",
+            action="store_true",
+            help="Print a migration stub for each app to add the missing indexes",
+        )
+
+    def handle(self, *app_labels, **options):
+        view_warnings: List[checks.Warning] = []
+        issues = find_index_issues(view_warnings=view_warnings)
+        for warning in view_warnings:
+            self.stderr.write(f"{warning.id} {warning.msg}")
+        if app_labels:
+            issues = [
+                issue for issue in issues if issue.model._meta.app_label in app_labels
+            ]
+
+        if not issues:
+            self.stdout.write("No missing indexes found")
+            return
+
+        if options["migration"]:
+            self.write_migrations(issues)
+            return
+
+        for issue in issues:
+            self.stdout.write(f"{issue.id} {issue.message}")
+            self.stdout.write(f"    HINT: {issue.hint}")
+
+    def write_migrations(self, issues: List[IndexIssue]):
+        by_app: Dict[str, List[IndexIssue]] = {}
+        for issue in issues:
+            by_app.setdefault(issue.model._meta.app_label, []).append(issue)
+
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        for app_label, app_issues in sorted(by_app.items()):
+            migration = migrations.Migration("fastview_indexes", app_label)
+            migration.dependencies = loader.graph.leaf_nodes(app_label)
+
+            if any(issue.id == W_NO_TRIGRAM for issue in app_issues):
+                from django.contrib.postgres.operations import TrigramExtension
+
+                migration.operations.append(TrigramExtension())
+
+            for issue in app_issues:
+                migration.operations.append(
+                    migrations.AddIndex(
+                        model_name=issue.model._meta.model_name,
+                        index=issue.get_index(),
+                    )
+                )
+
+            writer = MigrationWriter(migration)
+            self.stdout.write(f"# {app_label}/migrations/{writer.filename}")
+            self.stdout.write(writer.as_string())
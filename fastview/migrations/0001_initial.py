@@ -0,0 +1,61 @@
+# Generated by Django 3.2.25 on 2026-10-19 06:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletionJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model_label", models.CharField(max_length=255)),
+                ("object_pk", models.CharField(max_length=255)),
+                (
+                    "object_repr",
+                    models.CharField(max_length=255, verbose_name="object"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("batch_size", models.PositiveIntegerField(default=1000)),
+                ("total", models.PositiveIntegerField(default=0)),
+                ("deleted", models.PositiveIntegerField(default=0)),
+                ("error", models.TextField(blank=True)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["-created"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="deletionjob",
+            index=models.Index(
+                fields=["model_label", "status"], name="fastview_de_model_l_776149_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,64 @@
+"""
+Models for fastview
+"""
+from typing import Type
+
+from django.apps import apps
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _
+
+
+class DeletionJob(models.Model):
+    """
+    A delete with a large cascade, which is carried out in chunks in the background
+
+    The object is identified by its model label and primary key, so the job doesn't
+    depend on the contenttypes framework.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_DONE, _("Done")),
+        (STATUS_FAILED, _("Failed")),
+    ]
+
+    model_label = models.CharField(max_length=255)
+    object_pk = models.CharField(max_length=255)
+    object_repr = models.CharField(_("object"), max_length=255)
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    batch_size = models.PositiveIntegerField(default=1000)
+    total = models.PositiveIntegerField(default=0)
+    deleted = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["model_label", "status"])]
+
+    def __str__(self):
+        return f"{self.model_label} {self.object_repr}"
+
+    @property
+    def model(self) -> Type[Model]:
+        return apps.get_model(self.model_label)
+
+    @property
+    def progress(self) -> int:
+        """
+        Percentage of the related objects deleted
+        """
+        if self.status == self.STATUS_DONE:
+            return 100
+        if not self.total:
+            return 0
+        return min(100, int(self.deleted * 100 / self.total))
@@ -18,6 +18,11 @@ class Permission:
     Base permission class - permission denied
     """
 
+    #: Whether the outcome can depend on the identity of the user. If ``False``, the
+    #: outcome only depends on the general attributes in :meth:`get_fingerprint`, so
+    #: cached output can be shared between users.
+    user_specific: bool = True
+
     def check(
         self,
         request: HttpRequest,
@@ -63,6 +68,20 @@ class Permission:
         # Allow none
         return Q_NONE
 
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        """
+        Return a string which identifies the outcome of this permission for a request
+
+        Requests with the same fingerprint must get the same results from ``check``
+        and ``filter``, so the fingerprint can be used in cache keys. By default this
+        identifies the user; subclasses which don't depend on the user's identity
+        should return something more general so cache entries can be shared.
+        """
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return "anon"
+        return f"user:{user.pk}"
+
     def __and__(self, other: Permission) -> Permission:
         return AndPermission(self, other)
 
@@ -74,7 +93,10 @@ class Permission:
 
 
 class Denied(Permission):
-    pass
+    user_specific = False
+
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return ""
 
 
 class OrPermission(Permission):
@@ -110,6 +132,15 @@ class OrPermission(Permission):
         right_q = self.right.filter_q(request, queryset)
         return left_q | right_q
 
+    @property  # type: ignore
+    def user_specific(self) -> bool:  # type: ignore
+        return self.left.user_specific or self.right.user_specific
+
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        left = self.left.get_fingerprint(request)
+        right = self.right.get_fingerprint(request)
+        return f"({left}|{right})"
+
 
 class AndPermission(Permission):
     """
@@ -144,6 +175,15 @@ class AndPermission(Permission):
         right_q = self.right.filter_q(request, queryset)
         return left_q & right_q
 
+    @property  # type: ignore
+    def user_specific(self) -> bool:  # type: ignore
+        return self.left.user_specific or self.right.user_specific
+
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        left = self.left.get_fingerprint(request)
+        right = self.right.get_fingerprint(request)
+        return f"({left}&{right})"
+
 
 class NotPermission(Permission):
     """
@@ -175,12 +215,21 @@ class NotPermission(Permission):
         q = self.permission.filter_q(request, queryset)
         return ~q
 
+    @property  # type: ignore
+    def user_specific(self) -> bool:  # type: ignore
+        return self.permission.user_specific
+
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return f"~{self.permission.get_fingerprint(request)}"
+
 
 class Public(Permission):
     """
     Public permission - everyone can access
     """
 
+    user_specific = False
+
     def check(
         self,
         request: HttpRequest,
@@ -189,12 +238,17 @@ class Public(Permission):
     ) -> bool:
         return True
 
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return ""
+
 
 class Login(Permission):
     """
     Users must be logged in
     """
 
+    user_specific = False
+
     def check(
         self,
         request: HttpRequest,
@@ -205,12 +259,17 @@ class Login(Permission):
             return True
         return False
 
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return "auth" if self.check(request) else "anon"
+
 
 class Staff(Permission):
     """
     User must be staff
     """
 
+    user_specific = False
+
     def check(
         self,
         request: HttpRequest,
@@ -219,12 +278,17 @@ class Staff(Permission):
     ) -> bool:
         return request.user.is_staff
 
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return "staff" if self.check(request) else ""
+
 
 class Superuser(Permission):
     """
     User must be superuser
     """
 
+    user_specific = False
+
     def check(
         self,
         request: HttpRequest,
@@ -233,6 +297,9 @@ class Superuser(Permission):
     ) -> bool:
         return request.user.is_superuser
 
+    def get_fingerprint(self, request: HttpRequest) -> str:
+        return "superuser" if self.check(request) else ""
+
 
 class Django(Permission):
     """
@@ -43,11 +43,16 @@ def urlparams(context, **kwargs):
 
         <a href="{% url .. %}?{% urlparams foo=bar remove=None %}">
     """
+    # Lists build canonical URLs
+    list_query = context.get("list_query")
+    if list_query is not None:
+        return list_query.to_querystring(**kwargs)
+
     params = context["request"].GET.copy()
     # Can't call params.update() - a QueryDict appends to existing, doesn't overwrite
     for key, value in kwargs.items():
         if value is None:
-            if value in params:
+            if key in params:
                 del params[key]
         else:
             params[key] = value
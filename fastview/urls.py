@@ -3,17 +3,84 @@ URL management
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
+from weakref import WeakKeyDictionary
 
 from django.core.exceptions import ImproperlyConfigured
-from django.urls import reverse
+from django.urls import (
+    NoReverseMatch,
+    get_resolver,
+    get_script_prefix,
+    get_urlconf,
+    reverse,
+)
+from django.utils.translation import get_language
 
 
 if TYPE_CHECKING:
+    from django.urls.resolvers import URLResolver
+
     from .views.mixins import AbstractFastView
 
 
+# Stands in for the primary key when compiling a URL template
+PK_PLACEHOLDER = 918273645546372819
+
+# URL templates by resolver, then by script prefix, language, view name and whether a
+# pk is used.
+# A template is the URL split around the pk, or None if it must be reversed each time.
+# Keyed on the resolver so templates are discarded with it by ``clear_url_caches()``
+_url_templates: WeakKeyDictionary[
+    URLResolver, Dict[Tuple[str, Optional[str], str, bool], Optional[Tuple[str, ...]]]
+] = WeakKeyDictionary()
+
+
+def _compile(viewname: str, with_pk: bool) -> Optional[Tuple[str, ...]]:
+    """
+    Reverse the URL once, and split it where the pk goes
+    """
+    if not with_pk:
+        return (reverse(viewname),)
+
+    try:
+        url = reverse(viewname, args=[PK_PLACEHOLDER])
+    except NoReverseMatch:
+        return None
+
+    parts = tuple(url.split(str(PK_PLACEHOLDER)))
+    if len(parts) != 2:
+        return None
+    return parts
+
+
+def cached_reverse(viewname: str, pk: Any = None) -> str:
+    """
+    Reverse a URL which takes no arguments, or a single integer ``pk``, without walking
+    the resolver each time
+
+    The first call for each view name, script prefix and language reverses the URL and keeps it
+    as a template, so later calls only substitute the pk. Other pks, and patterns which
+    the template cannot represent, fall back to ``reverse()``.
+    """
+    with_pk = pk is not None
+    if with_pk and (type(pk) is not int or pk < 0):
+        return reverse(viewname, args=[pk])
+
+    templates = _url_templates.setdefault(get_resolver(get_urlconf()), {})
+    # The language is part of the URL under i18n_patterns
+    key = (get_script_prefix(), get_language(), viewname, with_pk)
+    if key not in templates:
+        templates[key] = _compile(viewname, with_pk)
+
+    template = templates[key]
+    if template is None:
+        return reverse(viewname, args=[pk])
+    if not with_pk:
+        return template[0]
+    return f"{template[0]}{pk}{template[1]}"
+
+
 def _reverse(
     viewname: str,
     view: AbstractFastView,
@@ -47,9 +114,11 @@ def _reverse(
             if not object:
                 raise ImproperlyConfigured("Could not find target object on the view")
 
-            return reverse(f"{namespace}:{viewname}", args=[object.pk])
+            return cached_reverse(f"{namespace}:{viewname}", object.pk)
 
-        return reverse(f"{namespace}:{viewname}")
+        if not args and not kwargs:
+            return cached_reverse(f"{namespace}:{viewname}")
+        return reverse(f"{namespace}:{viewname}", *args, **kwargs)
 
     return reverse(viewname, *args, **kwargs)
 
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+from functools import partial
 from inspect import isclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from django.core.exceptions import FieldDoesNotExist
-from django.urls import include, path, reverse
+from django.urls import include, path
 from django.views.generic import View
 from django.views.generic.detail import SingleObjectMixin
 from django.views.generic.list import MultipleObjectMixin
 
 from ..constants import INDEX_VIEW, OBJECT_VIEW, VIEW_SUFFIX
 from ..permissions import Permission
+from ..urls import cached_reverse
+from ..views.autocomplete import AutocompleteView
 from ..views.generic import CreateView, DeleteView, DetailView, ListView, UpdateView
-from ..views.mixins import AbstractFastView
+from ..views.mixins import AbstractFastView, FormFieldMixin
 
 
 if TYPE_CHECKING:
+    from django.db.models import Model
     from django.db.models.base import ModelBase
+    from django.http import HttpRequest
     from django.urls.resolvers import CheckURLMixin
 
 
@@ -34,8 +39,6 @@ class ViewGroupType(type):
             if not attr.endswith(VIEW_SUFFIX):
                 continue
 
-            name = attr[: -len(VIEW_SUFFIX)]
-
             if isinstance(view, dict):
                 # We've found a config, look for the view class defined on a base class
                 config = view
@@ -58,6 +61,45 @@ class ViewGroupType(type):
         return super().__new__(cls, name, bases, dct)
 
 
+class ActionLink:
+    """
+    A view in a viewgroup which can be linked to
+
+    Built once when the viewgroup is created, so requests only need to check the
+    permission and build the URL.
+    """
+
+    #: Name of the view in the viewgroup
+    name: str
+
+    #: View class
+    view: Type[AbstractFastView]
+
+    #: Label for links to the view
+    label: str
+
+    def __init__(self, name: str, view: Type[AbstractFastView]):
+        self.name = name
+        self.view = view
+        self.label = view.get_action_label()
+
+    def can(self, request: HttpRequest, instance: Optional[Model] = None) -> bool:
+        """
+        Check if the user can access the view, for the instance if given
+        """
+        permission = self.view.get_permission()
+        if instance is None:
+            return permission.check(request)
+        return permission.check(request, model=type(instance), instance=instance)
+
+    def get_url(self, request: HttpRequest, pk: Any = None) -> str:
+        """
+        Return the URL for the view in the namespace of the current request, for the
+        object ``pk`` if given
+        """
+        return cached_reverse(f"{request.resolver_match.namespace}:{self.name}", pk)
+
+
 class ViewGroup(metaclass=ViewGroupType):
     """
     Collection of related views served from the same root url
@@ -79,6 +121,16 @@ class ViewGroup(metaclass=ViewGroupType):
 
     action_links: Optional[List[str]] = None
 
+    #: Views which do not operate on an existing object, by name
+    basic_views: Dict[str, Type[AbstractFastView]]
+
+    #: Views which operate on an existing object, by name
+    object_views: Dict[str, Type[AbstractFastView]]
+
+    # Sorted links for basic and object views, by the action links they were filtered by
+    _basic_links: Dict[Optional[Tuple[str, ...]], List[ActionLink]]
+    _object_links: Dict[Optional[Tuple[str, ...]], List[ActionLink]]
+
     def __init__(self, **kwargs):
         """
         Configure view group
@@ -87,6 +139,7 @@ class ViewGroup(metaclass=ViewGroupType):
             setattr(self, key, value)
 
         self._collect_views()
+        self._prepare_links()
 
     def get_template_root(self) -> Optional[str]:
         """
@@ -126,6 +179,71 @@ class ViewGroup(metaclass=ViewGroupType):
                 self.views[name] = view.config(**config)
                 setattr(self, attr, self.views[name])
 
+    def _prepare_links(self) -> None:
+        """
+        Partition the views and build the action links for the group
+
+        Intended for internal use, called once the views have been collected.
+        """
+        self.basic_views = {}
+        self.object_views = {}
+        for name, view in self.views.items():
+            if getattr(view, "has_id_slug", False):
+                self.object_views[name] = view
+            else:
+                self.basic_views[name] = view
+
+        self._basic_links = {}
+        self._object_links = {}
+        self.get_basic_links(self.get_action_links())
+
+    def _sort_links(
+        self,
+        views: Dict[str, Type[AbstractFastView]],
+        action_links: Optional[List[str]],
+    ) -> List[ActionLink]:
+        """
+        Build action links for the views, filtered and sorted by ``action_links``
+        """
+        links = [
+            ActionLink(name, view)
+            for name, view in views.items()
+            # Autocomplete views are called by form widgets, not linked to
+            if not issubclass(view, AutocompleteView)
+        ]
+        if action_links is None:
+            return links
+
+        order = {name: index for index, name in enumerate(action_links)}
+        links = [link for link in links if link.name in order]
+        return sorted(links, key=lambda link: order[link.name])
+
+    def get_basic_links(
+        self, action_links: Optional[List[str]] = None
+    ) -> List[ActionLink]:
+        """
+        Return the links to basic views, filtered and sorted by ``action_links``
+
+        Links are built once for each set of action links.
+        """
+        key = None if action_links is None else tuple(action_links)
+        if key not in self._basic_links:
+            self._basic_links[key] = self._sort_links(self.basic_views, action_links)
+        return self._basic_links[key]
+
+    def get_object_links(
+        self, action_links: Optional[List[str]] = None
+    ) -> List[ActionLink]:
+        """
+        Return the links to object views, filtered and sorted by ``action_links``
+
+        Links are built once for each set of action links.
+        """
+        key = None if action_links is None else tuple(action_links)
+        if key not in self._object_links:
+            self._object_links[key] = self._sort_links(self.object_views, action_links)
+        return self._object_links[key]
+
     def _get_view_attrs(self, name: str, view: View) -> Dict[str, Any]:
         """
         Get a dict of attrs to set on a view class before it is added to self.views
@@ -205,80 +323,52 @@ class ViewGroup(metaclass=ViewGroupType):
     def get_context_data(self, view: View, **context: Any) -> Dict[str, Any]:
         """
         Get additional context data for the view
-        """
-        # Build using delayed closures, avoid unnecessary potentially expensive lookups
-        # TODO: Is this really worth the complexity? Candidate for simplification.
-        def can_factory(to_view):
-            def can():
-                permission = to_view.get_permission()
-                return permission.check(view.request)
-
-            return can
-
-        def get_url_factory(name):
-            def get_url():
-                return reverse(f"{view.request.resolver_match.namespace}:{name}")
-
-            return get_url
-
-        def action_links_factory(action_link_data):
-            def action_links():
-                return [
-                    (label, get_url())
-                    for name, label, can, get_url in action_link_data
-                    if can()
-                ]
-
-            return action_links
-
-        action_links = self.get_action_links()
-        action_link_data = []
-        for name, to_view in self.get_basic_views().items():
-            can = can_factory(to_view)
-            get_url = get_url_factory(name)
-
-            context[f"can_{name}"] = can
-            context[f"get_{name}_url"] = get_url
 
-            if (action_links is None or name in action_links) and name != view.action:
-                action_link_data.append(
-                    (name, to_view.get_action_label(), can, get_url)
-                )
+        Adds ``can_<name>`` and ``get_<name>_url`` callables for each basic view, which
+        are only evaluated if used by the template, and ``action_links``.
+        """
+        request = view.request
+        for link in self.get_basic_links():
+            context[f"can_{link.name}"] = partial(link.can, request)
+            context[f"get_{link.name}_url"] = partial(link.get_url, request)
 
-        if action_links:
-            action_link_data = sorted(
-                action_link_data, key=lambda data: action_links.index(data[0])
-            )
+        links = [
+            link
+            for link in self.get_basic_links(self.get_action_links())
+            if link.name != view.action
+        ]
 
         context["view"] = view
-        context["action_links"] = action_links_factory(action_link_data)
+        context["action_links"] = partial(self.resolve_action_links, request, links)
 
         if context.get("base_template_name") is None:
             context["base_template_name"] = self.base_template_name
 
         return context
 
+    def resolve_action_links(
+        self, request: HttpRequest, links: List[ActionLink]
+    ) -> List[Tuple[str, str]]:
+        """
+        Return ``(label, url)`` pairs for the links the user can access
+        """
+        return [
+            (link.label, link.get_url(request)) for link in links if link.can(request)
+        ]
+
     def get_object_views(self):
         """
         Return a filtered list of views which operate on an existing object - views
         which have the attribute ``has_id_slug == True`` (see mixins)
         """
-        return {
-            name: view
-            for name, view in self.views.items()
-            if getattr(view, "has_id_slug", False)
-        }
+        return self.object_views
 
     def get_basic_views(self):
         """
         Return a filtered list of views which do not operate on an existing object - all
         views which are not returned by ``get_object_views``
         """
-        return {
-            name: view
-            for name, view in self.views.items()
-            if not getattr(view, "has_id_slug", False)
-        }
+        return self.basic_views
 
 
 class ModelViewGroup(ViewGroup):
@@ -293,6 +383,20 @@ class ModelViewGroup(ViewGroup):
     create_view: Optional[Type[AbstractFastView]] = CreateView
     update_view: Optional[Type[AbstractFastView]] = UpdateView
     delete_view: Optional[Type[AbstractFastView]] = DeleteView
+    autocomplete_view: Optional[Type[AbstractFastView]] = AutocompleteView
+
+    #: Bulk import view, eg :class:`fastview.views.imports.ImportView`. Not enabled by
+    #: default
+    import_view: Optional[Type[AbstractFastView]] = None
+
+    #: Progress of background deletes, eg
+    #: :class:`fastview.views.deletions.DeletionListView`. Not enabled by default
+    deletions_view: Optional[Type[AbstractFastView]] = None
+
+    #: Related fields in the create and update forms which should load their choices
+    #: from the autocomplete view, with the fields on the related model to search, eg
+    #: ``{"author": ["username"]}``
+    autocomplete_fields: Optional[Dict[str, List[str]]] = None
 
     def _get_view_attrs(self, name: str, view: View) -> Dict[str, Any]:
         """
@@ -303,11 +407,18 @@ class ModelViewGroup(ViewGroup):
         # Only add the model if one hasn't been defined already - a group may contain
         # views which operate on different models
         if (
-            issubclass(view, (SingleObjectMixin, MultipleObjectMixin))
+            issubclass(view, (SingleObjectMixin, MultipleObjectMixin, AutocompleteView))
             and view.model is None
         ):
             attrs["model"] = self.model
 
+        # Share the autocomplete fields between the forms and the autocomplete view
+        if (
+            issubclass(view, (FormFieldMixin, AutocompleteView))
+            and view.autocomplete_fields is None
+        ):
+            attrs["autocomplete_fields"] = self.autocomplete_fields
+
         # Propagate action links, unless specified on the view
         if getattr(view, "action_links", None) is None:
             attrs["action_links"] = self.get_action_links()
@@ -335,6 +446,9 @@ class ModelViewGroup(ViewGroup):
         elif name == OBJECT_VIEW:
             raise ValueError("Detail view must be a SingleObjectMixin subclass")
 
+        elif issubclass(view, AutocompleteView):
+            return f"{name}/<str:field_name>/"
+
         return super().get_url_route_for_view(name, view)
 
     def get_id_field(self):
@@ -0,0 +1,179 @@
+"""
+Bulk actions for list views
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..cache import bump_generation
+from ..permissions import Denied, Permission
+
+
+if TYPE_CHECKING:
+    from .generic import ListView
+
+
+class BulkAction:
+    """
+    An action which can be applied to the rows selected in a list
+
+    The selected objects are filtered by the action's permission in the database, then
+    processed in batches of ``batch_size`` with a single query per batch.
+    """
+
+    #: Name of the action, submitted by the list form
+    name: str = ""
+
+    #: Label for the action
+    label: str = ""
+
+    #: Name of the viewgroup view whose permission the action uses, eg ``"delete"``
+    view_name: Optional[str] = None
+
+    #: Permission for the action. If not set, uses the permission of the view in the
+    #: viewgroup named by ``view_name``, otherwise access is denied.
+    permission: Optional[Permission] = None
+
+    #: Number of objects to change in each query
+    batch_size: int = 500
+
+    #: Message to show after the action. Supports ``count`` and ``model_name``
+    #: placeholders
+    success_message: str = ""
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        label: Optional[str] = None,
+        view_name: Optional[str] = None,
+        permission: Optional[Permission] = None,
+        batch_size: Optional[int] = None,
+        success_message: Optional[str] = None,
+    ):
+        if name is not None:
+            self.name = name
+        if label is not None:
+            self.label = label
+        if view_name is not None:
+            self.view_name = view_name
+        if permission is not None:
+            self.permission = permission
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if success_message is not None:
+            self.success_message = success_message
+
+    def get_permission(self, view: ListView) -> Permission:
+        if self.permission:
+            return self.permission
+
+        viewgroup = view.viewgroup
+        if viewgroup and self.view_name in viewgroup.views:
+            return viewgroup.views[self.view_name].get_permission()
+
+        return Denied()
+
+    def filter(self, view: ListView, queryset: QuerySet) -> QuerySet:
+        """
+        Restrict the queryset to the objects the user can apply this action to
+        """
+        return self.get_permission(view).filter(view.request, queryset)
+
+    def execute(self, view: ListView, queryset: QuerySet) -> int:
+        """
+        Apply the action to the permitted objects in the queryset, and return the
+        number of objects changed
+
+        The primary keys of each batch are found by walking the primary key index, so
+        each batch is processed in its own transaction without holding locks on the rest.
+        """
+        model = queryset.model
+        queryset = self.filter(view, queryset).order_by("pk")
+
+        count = 0
+        last_pk = None
+        while True:
+            batch = queryset
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(batch.values_list("pk", flat=True)[: self.batch_size])
+            if not pks:
+                break
+
+            with transaction.atomic():
+                count += self.process(view, model._default_manager.filter(pk__in=pks))
+            last_pk = pks[-1]
+
+        if count:
+            bump_generation(model)
+        return count
+
+    def process(self, view: ListView, queryset: QuerySet) -> int:
+        """
+        Apply the action to a batch of objects, and return the number changed
+        """
+        raise NotImplementedError()
+
+    def get_success_message(self, view: ListView, count: int) -> str:
+        if not self.success_message:
+            return ""
+        return self.success_message % {
+            "count": count,
+            "model_name": view.model._meta.verbose_name_plural.title(),
+        }
+
+
+class DeleteAction(BulkAction):
+    """
+    Delete the selected objects, using the permission of the viewgroup's delete view
+    """
+
+    name = "delete"
+    label = _("Delete")
+    view_name = "delete"
+    success_message = _("Deleted %(count)d %(model_name)s")
+
+    def process(self, view: ListView, queryset: QuerySet) -> int:
+        _total, deleted = queryset.delete()
+        return deleted.get(queryset.model._meta.label, 0)
+
+
+class UpdateAction(BulkAction):
+    """
+    Set fields on the selected objects, using the permission of the viewgroup's update
+    view
+
+    Example::
+
+        UpdateAction("publish", "Publish", values={"is_published": True})
+
+    Fields with ``auto_now`` are updated too.
+    """
+
+    view_name = "update"
+    success_message = _("Updated %(count)d %(model_name)s")
+
+    #: Values to set, as field names and values or expressions
+    values: Dict[str, Any]
+
+    def __init__(self, *args, values: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if values is not None:
+            self.values = values
+
+    def get_values(self, view: ListView) -> Dict[str, Any]:
+        values = {}
+        now = timezone.now()
+        for field in view.model._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                values[field.name] = now
+        values.update(self.values)
+        return values
+
+    def process(self, view: ListView, queryset: QuerySet) -> int:
+        return queryset.update(**self.get_values(view))
@@ -0,0 +1,152 @@
+"""
+Autocomplete endpoint for related fields in forms
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model, Q, QuerySet
+from django.db.models.base import ModelBase
+from django.forms import ModelChoiceField
+from django.http import Http404, JsonResponse
+from django.views.generic import View
+
+from ..constants import PARAM_SEARCH
+from .mixins import AbstractFastView, FormFieldMixin
+
+
+class AutocompleteView(AbstractFastView, View):
+    """
+    Return a page of matching choices for a related field as JSON
+
+    Called with the name of the field, eg ``autocomplete/author/?q=jo&page=2``::
+
+        {"results": [{"id": 1, "text": "john"}], "more": false}
+
+    Unless the view has a ``permission`` of its own, the user must have permission for
+    a form view in the viewgroup which uses autocomplete for the field, such as the
+    create or update view.
+    """
+
+    model: Optional[Type[ModelBase]] = None
+
+    #: Fields on the related model to search, for each form field which uses
+    #: autocomplete, eg ``{"author": ["username"]}``
+    autocomplete_fields: Optional[Dict[str, List[str]]] = None
+
+    #: Lookup used for the search. On PostgreSQL the default case-insensitive match
+    #: needs a trigram index on the search fields, which the index system check
+    #: (``fastview.W003``) reports; ``startswith`` can use a btree index instead
+    lookup: str = "istartswith"
+
+    #: Number of choices to return per page
+    page_size: int = 20
+
+    def has_permission(self) -> bool:
+        if self.permission or not self.viewgroup:
+            return super().has_permission()
+
+        field_name = self.kwargs.get("field_name")
+        if field_name not in (self.autocomplete_fields or {}):
+            # Not found, raised by get()
+            return True
+        return any(
+            self.has_form_view_permission(view)
+            for view in self.get_form_views(field_name)
+        )
+
+    def get_form_views(self, field_name: str) -> List[Type[FormFieldMixin]]:
+        """
+        Return the viewgroup's form views which use autocomplete for the field
+        """
+        if not self.viewgroup:
+            return []
+        return [
+            view
+            for view in self.viewgroup.views.values()
+            if issubclass(view, FormFieldMixin)
+            and field_name in (view.autocomplete_fields or {})
+        ]
+
+    def has_form_view_permission(self, view: Type[FormFieldMixin]) -> bool:
+        """
+        Check the user has permission for the form view
+
+        Views of an existing object are checked for permission to any object of the
+        model, with a single query.
+        """
+        permission = view.get_permission()
+        if getattr(view, "has_id_slug", False):
+            return permission.filter(self.request, view.model._default_manager).exists()
+        return permission.check(self.request, view.model)
+
+    def get(self, request, field_name: str):
+        form_field = self.get_form_field(field_name)
+        qs = self.get_queryset(field_name, form_field)
+
+        try:
+            page = max(1, int(request.GET.get("page", 1)))
+        except ValueError:
+            page = 1
+
+        # Fetch one more than we need to see if there is another page, without a COUNT
+        offset = (page - 1) * self.page_size
+        objects = list(qs[offset : offset + self.page_size + 1])
+        more = len(objects) > self.page_size
+        return JsonResponse(
+            {
+                "results": [
+                    self.get_result(form_field, obj)
+                    for obj in objects[: self.page_size]
+                ],
+                "more": more,
+            }
+        )
+
+    def get_search_fields(self, field_name: str) -> List[str]:
+        """
+        Return the fields to search, or raise a 404 if the field does not use
+        autocomplete
+        """
+        if not self.autocomplete_fields or field_name not in self.autocomplete_fields:
+            raise Http404(f"No autocomplete for {field_name}")
+        return self.autocomplete_fields[field_name]
+
+    def get_form_field(self, field_name: str) -> ModelChoiceField:
+        """
+        Return the form field for the model field, so choices respect
+        ``limit_choices_to``
+        """
+        self.get_search_fields(field_name)
+        if self.model is None:
+            raise ImproperlyConfigured(f"{type(self).__name__} needs a model")
+        model_field = self.model._meta.get_field(field_name)
+        form_field = model_field.formfield()
+        if not isinstance(form_field, ModelChoiceField):
+            raise Http404(f"{field_name} is not a related field")
+        return form_field
+
+    def get_queryset(self, field_name: str, form_field: ModelChoiceField) -> QuerySet:
+        """
+        Return the choices which match the search term, ordered by the search fields
+        """
+        search_fields = self.get_search_fields(field_name)
+        qs = form_field.queryset
+
+        term = self.request.GET.get(PARAM_SEARCH, "").strip()
+        if term:
+            rules = Q()
+            for search_field in search_fields:
+                rules |= Q(**{f"{search_field}__{self.lookup}": term})
+            qs = qs.filter(rules)
+        return qs.order_by(*search_fields, "pk")
+
+    def get_result(self, form_field: ModelChoiceField, obj: Model) -> Dict[str, Any]:
+        """
+        Return the JSON data for a choice
+        """
+        return {
+            "id": form_field.prepare_value(obj),
+            "text": form_field.label_from_instance(obj),
+        }
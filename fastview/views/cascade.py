@@ -0,0 +1,145 @@
+"""
+Summaries of the related objects affected by deleting an object
+"""
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional, Type
+
+from django.db import models
+from django.db.models import Model
+from django.utils.translation import gettext_lazy as _
+
+
+#: Labels for what happens to related objects, by ``on_delete`` handler
+ON_DELETE_LABELS = {
+    models.CASCADE: _("deleted"),
+    models.PROTECT: _("protected"),
+    models.SET_NULL: _("cleared"),
+    models.SET_DEFAULT: _("cleared"),
+}
+
+#: ``on_delete`` handlers which can stop the delete
+PROTECT_HANDLERS = {models.PROTECT}
+
+# RESTRICT was added in Django 3.1
+if hasattr(models, "RESTRICT"):  # pragma: no cover
+    ON_DELETE_LABELS[models.RESTRICT] = _("protected")
+    PROTECT_HANDLERS.add(models.RESTRICT)
+
+
+class CascadeCount(NamedTuple):
+    """
+    The number of objects of a related model affected by a delete
+    """
+
+    #: Related model, or the through model of a many-to-many relationship
+    model: Type[Model]
+
+    #: Number of objects
+    total: int
+
+    #: What will happen to them, eg ``"deleted"``
+    action: str
+
+    #: Lookup from the model back to the primary key of the object being deleted
+    lookup: str = "pk"
+
+    #: ``True`` if the objects, or many-to-many rows, will be deleted
+    deleted: bool = False
+
+    #: ``True`` if the objects will stop the delete
+    protected: bool = False
+
+    @property
+    def label(self) -> str:
+        return self.model._meta.verbose_name_plural
+
+
+def get_cascade(obj: Model, max_depth: Optional[int] = 5) -> List[CascadeCount]:
+    """
+    Count the related objects which will be affected by deleting ``obj``
+
+    Relations are found from ``_meta.related_objects``, and followed through cascading
+    deletes up to ``max_depth`` relations deep, or to any depth if ``max_depth`` is
+    ``None``. Each relation is counted with a
+    single ``COUNT`` query filtered on the path back to ``obj``, so no related objects
+    are loaded. Relations with no objects are left out.
+
+    Related objects are listed after the objects they depend on, so they can be
+    deleted in reverse order.
+    """
+    cascade: List[CascadeCount] = []
+    _walk(cascade, type(obj), "pk", obj.pk, 1, max_depth, [type(obj)])
+    return cascade
+
+
+def _walk(
+    cascade: List[CascadeCount],
+    model: Type[Model],
+    path: str,
+    pk: object,
+    depth: int,
+    max_depth: Optional[int],
+    chain: List[Type[Model]],
+):
+    # Rows in auto-created many-to-many tables are removed with the object
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        if through._meta.auto_created:
+            lookup = f"{field.m2m_field_name()}__{path}"
+            _add(cascade, through, lookup, pk, _("removed"), deleted=True)
+
+    for rel in model._meta.related_objects:
+        if rel.many_to_many:
+            through = rel.through
+            if through._meta.auto_created:
+                lookup = f"{rel.field.m2m_reverse_field_name()}__{path}"
+                _add(cascade, through, lookup, pk, _("removed"), deleted=True)
+            continue
+
+        action = ON_DELETE_LABELS.get(rel.on_delete)
+        if action is None:
+            # DO_NOTHING, or SET(...) which may not change anything
+            continue
+
+        related_model = rel.related_model
+        lookup = f"{rel.field.name}__{path}"
+        count = _add(
+            cascade,
+            related_model,
+            lookup,
+            pk,
+            action,
+            deleted=rel.on_delete is models.CASCADE,
+            protected=rel.on_delete in PROTECT_HANDLERS,
+        )
+        if (
+            count
+            and rel.on_delete is models.CASCADE
+            and (max_depth is None or depth < max_depth)
+            and related_model not in chain
+        ):
+            _walk(
+                cascade,
+                related_model,
+                lookup,
+                pk,
+                depth + 1,
+                max_depth,
+                chain + [related_model],
+            )
+
+
+def _add(
+    cascade: List[CascadeCount],
+    model: Type[Model],
+    lookup: str,
+    pk: object,
+    action: str,
+    deleted: bool = False,
+    protected: bool = False,
+) -> int:
+    count = model._base_manager.filter(**{lookup: pk}).count()
+    if count:
+        cascade.append(CascadeCount(model, count, action, lookup, deleted, protected))
+    return count
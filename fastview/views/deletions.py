@@ -0,0 +1,46 @@
+"""
+Progress of background deletion jobs
+"""
+from django.db.models import QuerySet
+
+from ..models import DeletionJob
+from .display import AttributeValue
+from .generic import ListView
+from .objects import AnnotatedObject
+
+
+class AnnotatedDeletionJob(AnnotatedObject):
+    # The viewgroup's object views are for the deleted model, not for jobs
+    use_viewgroup_links = False
+
+
+class DeletionListView(ListView):
+    """
+    List the background deletion jobs for the viewgroup's model, with their progress
+    """
+
+    model = DeletionJob
+    default_template_name = "fastview/deletions.html"
+    title = "Deletions"
+    action = "deletions"
+    action_label = "Deletions"
+    fields = [
+        "object_repr",
+        AttributeValue("get_status_display", label="Status", order_by="status"),
+        "progress",
+        "created",
+    ]
+    action_links = []
+
+    def get_annotated_model_object(self):
+        return AnnotatedDeletionJob.for_view(self, action_links=[])
+
+    def get_filtered_queryset(self) -> QuerySet:
+        """
+        Only show jobs for the viewgroup's model
+        """
+        qs = super().get_filtered_queryset()
+        model = getattr(self.viewgroup, "model", None)
+        if model is not None:
+            qs = qs.filter(model_label=model._meta.label)
+        return qs
@@ -108,6 +108,25 @@ class BaseFilter:
         }
         return context
 
+    def get_querystring(self, value: str) -> str:
+        """
+        Return the query string for the current request with this filter set to the
+        value, or removed if the value is empty
+        """
+        if not self.view:
+            raise FilterError(f"Filter {self.label} has no view, incorrect usage")
+
+        list_query = getattr(self.view, "list_query", None)
+        if list_query is not None:
+            return list_query.to_querystring(**{self.param: value or None})
+
+        # Use pop instead of del as we'll also cover the case where no param was passed
+        params = self.view.request.GET.copy()
+        params.pop(self.param, None)
+        if value:
+            params[self.param] = value
+        return params.urlencode()
+
     def get_all_choice(self) -> ChoiceType:
         """
         Return an "All" option (value, label) tuple
@@ -271,21 +290,14 @@ class Filter(BaseFilter):
 
         choices = self.get_choices()
 
-        request = self.view.request
-        base_url = request.path
-        params = request.GET.copy()
+        base_url = self.view.request.path
 
         for value, label in choices:
-            if not value:
-                # Delete from params. Use pop instead of del as we'll also cover the
-                # case where no param has been passed
-                params.pop(self.param, None)
-            else:
-                params[self.param] = value
+            url = f"{base_url}?{self.get_querystring(value)}"
 
             selected = value == self.value
 
-            yield (value, label, f"{base_url}?{params.urlencode()}", selected)
+            yield (value, label, url, selected)
 
 
 def str_to_date_tuple(value: str) -> Tuple[Optional[int], Optional[int]]:
@@ -547,9 +559,7 @@ class TreeFilter(Filter):
 
         tree: TreeListType = self.get_tree()
 
-        request = self.view.request
-        base_url = request.path
-        params = request.GET.copy()
+        base_url = self.view.request.path
 
         def generate_for_nodelist(nodes):
             choice: ChoiceType
@@ -558,12 +568,7 @@ class TreeFilter(Filter):
             for choice, children in nodes:
                 value, label = self._choice_to_value_label(choice)
 
-                if not value:
-                    # Delete from params. Use pop instead of del as we'll also cover the
-                    # case where no param has been passed
-                    params.pop(self.param, None)
-                else:
-                    params[self.param] = value
+                url = f"{base_url}?{self.get_querystring(value)}"
 
                 selected = self.value == value
                 child_selected = self.value.startswith(f"{value}/")
@@ -571,7 +576,7 @@ class TreeFilter(Filter):
                 yield (
                     value,
                     label,
-                    f"{base_url}?{params.urlencode()}",
+                    url,
                     selected,
                     child_selected,
                     generate_for_nodelist(children) if children else None,
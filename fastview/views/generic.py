@@ -4,15 +4,32 @@ Generic views for FastView
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import django
 from django.contrib import messages
-from django.core.exceptions import FieldDoesNotExist
-from django.db.models import Q, QuerySet
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Count, Max, Model, Q, QuerySet
+from django.db.models.base import ModelBase
+from django.forms import ModelForm, modelformset_factory
+from django.shortcuts import redirect
+from django.utils.text import slugify
+from django.utils.translation import gettext as _
 from django.views import generic
 
-from ..constants import PARAM_LIMIT, PARAM_ORDER, PARAM_SEARCH
+from ..cache import get_cache, get_generations, make_key
+from ..constants import (
+    PARAM_ACTION,
+    PARAM_SEARCH,
+    PARAM_SELECT_ALL,
+    PARAM_SELECTED,
+    UPDATE_VIEW,
+)
+from ..deletion import RUNNER_THREAD, start_deletion
+from ..forms import ListEditFormSet, bulk_update_fields, get_changed_fields
+from ..permissions import Denied, Permission
+from .actions import BulkAction
+from .cascade import CascadeCount, get_cascade
 from .display import ObjectValue
 from .filters import BaseFilter, FilterError, field_to_filter_class
 from .mixins import (
@@ -22,7 +39,14 @@ from .mixins import (
     ModelFastViewMixin,
     ObjectFastViewMixin,
     SuccessUrlMixin,
+    fields_key,
 )
+from .query import ListQuery, get_search_rule
+from .related import RelatedSection
+
+
+# Formset classes for ListView.editable_fields, by model and fields
+_editable_formset_classes: Dict[Tuple[Any, ...], Type[ListEditFormSet]] = {}
 
 
 class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
@@ -80,18 +104,247 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
     #: List of fields to search
     search_fields: Optional[List[str]] = None
 
+    #: List of :class:`~fastview.views.actions.BulkAction` instances which can be
+    #: applied to selected rows, or to every row matching the current filters
+    #:
+    #: Example::
+    #:
+    #:      bulk_actions = [
+    #:          DeleteAction(),
+    #:          UpdateAction("publish", "Publish", values={"is_published": True}),
+    #:      ]
+    bulk_actions: Optional[List[BulkAction]] = None
+
+    #: DOM id of the bulk actions form, which the row checkboxes refer to. If not set,
+    #: it is derived from the model and view class, so lists on one page don't clash.
+    bulk_actions_id: Optional[str] = None
+
+    #: List of model fields which can be edited in the list. These are shown as form
+    #: fields after the display fields, for objects on the current page which the user
+    #: has :attr:`editable_permission` for.
+    editable_fields: Optional[List[str]] = None
+
+    #: :mod:`Permission <fastview.permissions>` to edit rows in the list. If not set,
+    #: uses the permission of the viewgroup's ``update`` view.
+    editable_permission: Optional[Permission] = None
+
+    #: The formset for ``editable_fields`` built for the request
+    editable_formset: Optional[ListEditFormSet] = None
+
     #: Context variable name for the annotated object list.
     context_annotated_name = "annotated_object_list"
 
     #: Ordering params found in the request when getting the queryset
     request_ordering: Optional[Dict[str, str]] = None
 
+    #: The queryset built for the request
+    request_queryset: Optional[QuerySet] = None
+
+    #: The queryset built for the request, before the limit is applied
+    request_filtered_queryset: Optional[QuerySet] = None
+
+    #: The parsed list params for the current request
+    list_query: ListQuery
+
+    #: Redirect GET requests to the canonical URL for their list params with a ``302``,
+    #: so equivalent URLs share cache entries
+    redirect_canonical: bool = False
+
+    #: Cache the primary keys and count of each page of results across requests, and
+    #: the rendered output when embedded as a fragment which is not user-specific.
+    #: See :ref:`performance__list_cache`
+    cache_results: bool = False
+
+    @classmethod
+    def uses_cache(cls) -> bool:
+        return super().uses_cache() or cls.cache_results
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.list_query = self.get_list_query()
+
     def dispatch(self, request, *args, **kwargs):
         # Set up request caches here in case a subclass overrides something carelessly
         self.request_filters = {}
         self.request_ordering = {}
+        self.request_queryset = None
+        self.request_filtered_queryset = None
         return super().dispatch(request, *args, **kwargs)
 
+    def get(self, request, *args, **kwargs):
+        """
+        Redirect to the canonical URL, and serve a cached fragment if possible
+        """
+        if self.redirect_canonical and not self._as_fragment:
+            querystring = self.list_query.to_querystring()
+            if querystring != request.META.get("QUERY_STRING", ""):
+                url = request.path
+                if querystring:
+                    url = f"{url}?{querystring}"
+                return redirect(url)
+
+        if not self.is_fragment_cacheable():
+            return super().get(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_results_cache_key(
+            "fragment",
+            self.get_permission_fingerprint(self.get_cache_permissions()),
+        )
+        content = cache.get(key)
+        if content is not None:
+            response = self.response_class(request=request, template=[])
+            response.content = content
+            return response
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        if response.status_code == 200:
+            cache.set(key, response.content, self.get_cache_timeout())
+        return response
+
+    def post(self, request, *args, **kwargs):
+        """
+        Save the editable fields, or apply a bulk action to the selected rows, then
+        return to the list
+
+        Lists without bulk actions or editable fields do not accept POST.
+        """
+        if not self.editable_fields and not self.get_bulk_actions():
+            return self.http_method_not_allowed(request, *args, **kwargs)
+
+        if self.editable_fields and PARAM_ACTION not in request.POST:
+            return self.post_editable()
+
+        action = self.get_bulk_actions().get(request.POST.get(PARAM_ACTION, ""))
+        if action is None:
+            messages.error(request, _("No action selected"))
+        else:
+            count = action.execute(self, self.get_action_queryset())
+            success_message = action.get_success_message(self, count)
+            if success_message:
+                messages.success(request, success_message)
+        return redirect(request.get_full_path())
+
+    def get_bulk_actions(self) -> Dict[str, BulkAction]:
+        return {action.name: action for action in self.bulk_actions or []}
+
+    def get_bulk_actions_id(self) -> str:
+        if self.bulk_actions_id:
+            return self.bulk_actions_id
+        opts = self.model._meta
+        return slugify(
+            f"fastview-bulk-actions-{opts.app_label}-{opts.model_name}-"
+            f"{type(self).__name__}"
+        )
+
+    def get_action_queryset(self) -> QuerySet:
+        """
+        Return the objects selected for a bulk action
+
+        These are either the selected primary keys, or every object matching the
+        current filters and search, from the same queryset as the list.
+        """
+        qs = self.get_queryset()
+        if not qs.query.can_filter():
+            # Sliced by the limit param
+            pks = list(qs.values_list("pk", flat=True))
+            qs = self.model._default_manager.filter(pk__in=pks)
+
+        if self.request.POST.get(PARAM_SELECT_ALL):
+            return qs
+
+        pk_field = self.model._meta.pk
+        selected = []
+        for value in self.request.POST.getlist(PARAM_SELECTED):
+            try:
+                selected.append(pk_field.to_python(value))
+            except ValidationError:
+                continue
+        return qs.filter(pk__in=selected)
+
+    def post_editable(self):
+        """
+        Validate and save the changed rows of the editable formset
+        """
+        self.object_list = self.get_queryset()
+        context = self.get_context_data()
+        changed_forms = self.editable_formset.changed_forms
+        if all([form.is_valid() for form in changed_forms]):
+            self.save_editable(changed_forms)
+            return redirect(self.request.get_full_path())
+        return self.render_to_response(context)
+
+    def get_editable_permission(self) -> Permission:
+        if self.editable_permission:
+            return self.editable_permission
+        if self.viewgroup and UPDATE_VIEW in self.viewgroup.views:
+            return self.viewgroup.views[UPDATE_VIEW].get_permission()
+        return Denied()
+
+    def get_editable_formset_class(self) -> Type[ListEditFormSet]:
+        """
+        Return the formset class for ``editable_fields``, which is built once and
+        reused
+        """
+        key = (self.model, fields_key(self.editable_fields))
+        if key not in _editable_formset_classes:
+            _editable_formset_classes[key] = modelformset_factory(
+                self.model,
+                formset=ListEditFormSet,
+                fields=self.editable_fields,
+                extra=0,
+            )
+        return _editable_formset_classes[key]
+
+    def get_editable_objects(self, objects: Iterable[Model]) -> List[Model]:
+        """
+        Return the objects which the user can edit, checking permission in one query
+        """
+        objects = list(objects)
+        if not objects:
+            return []
+        queryset = self.model._default_manager.filter(
+            pk__in=[obj.pk for obj in objects]
+        )
+        permitted = set(
+            self.get_editable_permission()
+            .filter(self.request, queryset)
+            .values_list("pk", flat=True)
+        )
+        return [obj for obj in objects if obj.pk in permitted]
+
+    def get_editable_formset(self, objects: Iterable[Model]) -> ListEditFormSet:
+        """
+        Build the formset for the editable objects from a page of the list
+        """
+        kwargs: Dict[str, Any] = {
+            "objects": self.get_editable_objects(objects),
+            "prefix": "edit",
+        }
+        if self.request.method == "POST":
+            kwargs.update({"data": self.request.POST, "files": self.request.FILES})
+        return self.get_editable_formset_class()(**kwargs)
+
+    def save_editable(self, forms: List[ModelForm]):
+        """
+        Save the changed fields of the changed rows with a single ``bulk_update``
+
+        This does not call the model's ``save()`` or send save signals.
+        """
+        field_names: List[str] = []
+        for form in forms:
+            for name in get_changed_fields(form):
+                if name not in field_names:
+                    field_names.append(name)
+        bulk_update_fields(self.model, [form.instance for form in forms], field_names)
+
+    def get_list_query(self) -> ListQuery:
+        """
+        Parse the list params from the request
+        """
+        return ListQuery.from_params(self.request.GET, page_param=self.page_kwarg)
+
     def get_filters(self) -> Dict[str, BaseFilter]:
         """
         Build filter list by looking up field strings and converting to Filter instances
@@ -132,8 +385,33 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
 
     def get_queryset(self) -> QuerySet:
         """
-        Apply filters, search terms, ordering and limits to the queryset
+        Apply the limit to the filtered queryset
+
+        The queryset is only built once per request.
+        """
+        if self.request_queryset is not None:
+            return self.request_queryset
+
+        qs = self.get_filtered_queryset()
+
+        # Limit the queryset
+        if self.list_query.limit:
+            qs = qs[: self.list_query.limit]
+
+        self.request_queryset = qs
+        return qs
+
+    def get_filtered_queryset(self) -> QuerySet:
+        """
+        Apply filters, search terms and ordering to the queryset
+
+        The queryset can still be filtered, so subclasses should override this rather
+        than ``get_queryset`` to restrict the objects in the list. It is only built once
+        per request.
         """
+        if self.request_filtered_queryset is not None:
+            return self.request_filtered_queryset
+
         qs = super().get_queryset()
 
         # Only show permitted objects
@@ -144,13 +422,14 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
         # can use them when rendering the template
         self.request_filters = self.get_filters()
 
-        # If we have filters defined, check GET and default filter
+        # If we have filters defined, check the query and default filter
         if self.request_filters:
             for param, filter_obj in self.request_filters.items():
-                if param in self.request.GET:
+                value = self.list_query.get(param)
+                if value is not None:
                     # Bind filters to values for use in templates
                     try:
-                        bound_filter = filter_obj.bind(self.request.GET[param])
+                        bound_filter = filter_obj.bind(value)
                         self.request_filters[param] = bound_filter
 
                         # Call the filters' process() to filter the data
@@ -160,29 +439,15 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
                         messages.error(self.request, str(e))
 
         # Search
-        search_query = self.request.GET.get(PARAM_SEARCH, "")
-        if search_query:
-            qs = self.search_queryset(search_query, qs)
+        if self.list_query.search:
+            qs = self.search_queryset(self.list_query.search, qs)
 
         # Order
         ordering = self.get_ordering()
         if ordering:
             qs = qs.order_by(*ordering)
 
-        # Limit the queryset
-        limit = self.request.GET.get(PARAM_LIMIT, 0)
-        if limit:
-            try:
-                limit = int(limit)
-            except ValueError:
-                limit = 0
-
-            # Ensure positive limit (or 0)
-            limit = max(0, limit)
-
-            if limit:
-                qs = qs[:limit]
-
+        self.request_filtered_queryset = qs
         return qs
 
     def search_queryset(self, search_query: str, qs: QuerySet) -> QuerySet:
@@ -191,39 +456,27 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
 
         rules = Q()
         for field in self.search_fields:
-            # Add __icontains to the field, unless it already specifies a string rule
-            if "__" in field:
-                suffix = field.rsplit("__", 1)[1]
-            else:
-                suffix = ""
-            if not suffix or suffix not in [
-                "exact",
-                "iexact",
-                "contains",
-                "icontains",
-                "startswith",
-                "istartswith",
-                "endswith",
-                "iendswith",
-            ]:
-                field = f"{field}__icontains"
-            rules |= Q(**{field: search_query})
+            rules |= Q(**{self.get_search_rule(field): search_query})
 
         qs = qs.filter(rules)
         return qs
 
+    def get_search_rule(self, field: str) -> str:
+        """
+        Add ``__icontains`` to the search field, unless it already specifies a string
+        rule
+        """
+        return get_search_rule(field)
+
     def get_ordering(self):
         """
-        Build queryset ordering rule from the CSV list of DisplayValue slugs in
-        ``request.GET[PARAM_ORDER]``
+        Build queryset ordering rule from the DisplayValue slugs in the list query
         """
-        if PARAM_ORDER not in self.request.GET:
+        if not self.list_query.order:
             return None
 
-        # Split CSV list into DV slugs
-        slugs = self.request.GET[PARAM_ORDER].split(",")
         ordering = []
-        for slug in slugs:
+        for slug in self.list_query.order:
             # Determine order for this slug
             order = ""
             if slug.startswith("-"):
@@ -238,6 +491,147 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
 
         return ordering
 
+    def get_version(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Aggregate the latest version and the number of objects in the list
+
+        The aggregate is taken before the limit, which cannot be reordered.
+        """
+        aggregates = (
+            self.get_filtered_queryset()
+            .order_by()
+            .aggregate(version=Max(self.version_field), count=Count("pk"))
+        )
+        return aggregates["version"], aggregates["count"], self.list_query.cache_key
+
+    def get_last_modified(self, version: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Lists don't send ``Last-Modified``, as the latest version does not change when
+        rows are deleted, or depend on which rows the user can see
+        """
+        return None
+
+    def get_cache_paths(self) -> List[str]:
+        """
+        Add the lookup paths of the filters, search fields and ordering
+        """
+        paths = super().get_cache_paths()
+        paths += [filter_obj.field_name for filter_obj in self.get_filters().values()]
+        paths += self.search_fields or []
+        for display_value in self.get_fields():
+            try:
+                paths.append(display_value.get_order_by(self).lstrip("-"))
+            except (AttributeError, NotImplementedError):
+                pass
+        return paths
+
+    def get_results_permissions(self) -> List[Permission]:
+        """
+        Return the permissions which can change the results of the queryset
+        """
+        permissions = [self.get_permission()]
+        if self.row_permission:
+            permissions.append(self.row_permission)
+        return permissions
+
+    def get_cache_permissions(self) -> List[Permission]:
+        """
+        Add the row permission, which can change the rows shown
+        """
+        permissions = super().get_cache_permissions()
+        if self.row_permission:
+            permissions.append(self.row_permission)
+        return permissions
+
+    def is_fragment_cacheable(self) -> bool:
+        """
+        Rendered fragments are cached if they are not user-specific
+        """
+        return (
+            self.cache_results
+            and self._as_fragment
+            and not self.bulk_actions
+            and not self.editable_fields
+            and not any(
+                permission.user_specific for permission in self.get_cache_permissions()
+            )
+        )
+
+    def get_results_cache_key(self, *parts: Any) -> str:
+        """
+        Build a cache key for the results of the current request
+
+        The key is based on the view class, the path, the list query, the permission
+        fingerprint for the user, and the generations of :meth:`get_cache_models`.
+        """
+        return make_key(
+            "list",
+            type(self).__module__,
+            type(self).__qualname__,
+            self.request.path,
+            self.list_query.cache_key,
+            self.get_permission_fingerprint(self.get_results_permissions()),
+            *parts,
+            models=self.get_cache_models(),
+        )
+
+    def get_objects_by_pk(self, queryset: QuerySet, pks: List[Any]) -> List[Model]:
+        """
+        Fetch cached results in a single query, in the order of the cached pks
+        """
+        if not queryset.query.can_filter():
+            # Sliced by the limit param
+            queryset = queryset.model._default_manager.all()
+        objects = {obj.pk: obj for obj in queryset.filter(pk__in=pks).order_by()}
+        return [objects[pk] for pk in pks if pk in objects]
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Use the cached page if ``cache_results`` is enabled
+        """
+        if not self.cache_results:
+            return super().paginate_queryset(queryset, page_size)
+
+        cache = get_cache()
+        key = self.get_results_cache_key()
+        results = cache.get(key)
+        if results is None:
+            paginator, page, object_list, is_paginated = super().paginate_queryset(
+                queryset, page_size
+            )
+            results = {
+                "pks": [obj.pk for obj in object_list],
+                "count": paginator.count,
+                "number": page.number,
+            }
+            cache.set(key, results, self.get_cache_timeout())
+            return paginator, page, object_list, is_paginated
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        paginator.count = results["count"]
+        page = paginator.page(results["number"])
+        page.object_list = self.get_objects_by_pk(queryset, results["pks"])
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_cached_object_list(self, queryset: QuerySet) -> List[Model]:
+        """
+        Return the unpaginated object list from the cache, or cache it
+        """
+        cache = get_cache()
+        key = self.get_results_cache_key()
+        results = cache.get(key)
+        if results is None:
+            object_list = list(queryset)
+            results = {"pks": [obj.pk for obj in object_list]}
+            cache.set(key, results, self.get_cache_timeout())
+            return object_list
+        return self.get_objects_by_pk(queryset, results["pks"])
+
     def get_context_data(self, **kwargs):
         """
         The template context has additional variables available::
@@ -247,7 +641,13 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
             page_range: Paginator page range (Django 3.2+)
             label_orders: List of (label, current_order, param_value) tuples for
                 links in the table header
+            list_query: The parsed list params, used by ``{% urlparams %}``
+            bulk_actions_id: DOM id of the bulk actions form, if there are bulk actions
         """
+        if self.cache_results and not self.get_paginate_by(self.object_list):
+            kwargs.setdefault(
+                "object_list", self.get_cached_object_list(self.object_list)
+            )
         context = super().get_context_data(**kwargs)
         if self.paginate_by:
             page_obj = context["page_obj"]
@@ -259,6 +659,14 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
         else:
             objects = context["object_list"]
 
+        if self.editable_fields:
+            self.editable_formset = self.get_editable_formset(objects)
+            context["editable_formset"] = self.editable_formset
+            context["editable_labels"] = [
+                self.editable_formset.form.base_fields[name].label
+                for name in self.editable_fields
+            ]
+
         # Generator to return object list with permissions and iterable fields
         context[self.context_annotated_name] = self.object_annotator_factory(objects)
 
@@ -276,6 +684,10 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
             context["label_orders"].append((label, current_order, param_value))
 
         context["PARAM_SEARCH"] = PARAM_SEARCH
+        context["bulk_actions"] = list(self.get_bulk_actions().values())
+        if context["bulk_actions"]:
+            context["bulk_actions_id"] = self.get_bulk_actions_id()
+        context["list_query"] = self.list_query
 
         return context
 
@@ -299,9 +711,17 @@ class ListView(DisplayFieldMixin, ModelFastViewMixin, generic.ListView):
 
         AnnotatedModelObject = self.get_annotated_model_object()
 
+        editable_forms = {}
+        if self.editable_formset is not None:
+            editable_forms = {
+                form.instance.pk: form for form in self.editable_formset.initial_forms
+            }
+
         def generator():
             for obj in object_list:
-                yield AnnotatedModelObject(obj)
+                annotated = AnnotatedModelObject(obj)
+                annotated.form = editable_forms.get(obj.pk)
+                yield annotated
 
         return generator
 
@@ -313,10 +733,80 @@ class DetailView(DisplayFieldMixin, ObjectFastViewMixin, generic.DetailView):
     action = "view"
     action_label = "View"
 
+    #: List of :class:`~fastview.views.related.RelatedSection` instances, to show
+    #: tables of related objects under the object's fields.
+    #:
+    #: Example::
+    #:
+    #:      related_sections = [
+    #:          RelatedSection("choice_set", fields=["choice_text", "votes"]),
+    #:      ]
+    related_sections: Optional[List[RelatedSection]] = None
+
+    @classmethod
+    def uses_cache(cls) -> bool:
+        """
+        The version of a view with related sections depends on their models
+        """
+        return super().uses_cache() or bool(cls.version_field and cls.related_sections)
+
+    def get_related_sections(self) -> List[RelatedSection]:
+        return self.related_sections or []
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Prefetch the related sections
+        """
+        qs = super().get_queryset()
+        prefetches = [
+            section.get_prefetch(self.model) for section in self.get_related_sections()
+        ]
+        prefetches = [prefetch for prefetch in prefetches if prefetch is not None]
+        if prefetches:
+            qs = qs.prefetch_related(*prefetches)
+        return qs
+
+    def get_cache_models(self) -> List[ModelBase]:
+        """
+        Add the models of the related sections
+        """
+        models = super().get_cache_models()
+        models += [
+            section.get_related_model(self.model)
+            for section in self.get_related_sections()
+        ]
+        return models
+
+    def get_version(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Use the object's version, and the generations of the related sections' models
+        """
+        self.object = self.get_object()
+        related_models = [
+            section.get_related_model(self.model)
+            for section in self.get_related_sections()
+        ]
+        return (
+            getattr(self.object, str(self.version_field)),
+            self.object.pk,
+            *get_generations(related_models),
+        )
+
+    def get_last_modified(self, version: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Don't send ``Last-Modified`` if related sections can change without the object
+        """
+        if self.get_related_sections():
+            return None
+        return super().get_last_modified(version)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         AnnotatedModelObject = self.get_annotated_model_object()
         context["annotated_object"] = AnnotatedModelObject(context["object"])
+        context["related_sections"] = [
+            section.bind(context["object"]) for section in self.get_related_sections()
+        ]
         return context
 
 
@@ -353,3 +843,98 @@ class DeleteView(SuccessUrlMixin, ObjectFastViewMixin, generic.DeleteView):
     has_id_slug = True
     action = "delete"
     action_label = "Delete"
+
+    #: Show a summary of the related objects which will be deleted or changed on the
+    #: confirmation page, counted with one ``COUNT`` query per relation
+    cascade_summary: bool = True
+
+    #: Number of relations deep to follow cascading deletes for the summary
+    cascade_depth: int = 5
+
+    #: Number of related objects to delete above which the confirmation page warns that
+    #: the delete is large
+    large_cascade: int = 1000
+
+    #: Number of related objects to delete above which the object is deleted in the
+    #: background, in chunks. If ``None``, objects are always deleted in the request.
+    #: See :ref:`deleteview__background`
+    background_delete: Optional[int] = None
+
+    #: How background deletes are run - ``"thread"`` to use a thread pool in the web
+    #: process, or ``"command"`` to leave them for the ``fastview_delete_worker``
+    #: management command
+    background_runner: str = RUNNER_THREAD
+
+    #: Number of rows to delete in each query when deleting in the background
+    background_batch_size: int = 1000
+
+    #: Message to show when a delete has been started in the background. Supports a
+    #: ``model_name`` placeholder
+    background_message = _("%(model_name)s is being deleted")
+
+    def post(self, request, *args, **kwargs):
+        """
+        Start a background delete if the cascade is above ``background_delete``
+
+        If related objects would prevent the delete, the confirmation page is shown
+        again instead.
+        """
+        if self.background_delete is None:
+            return super().post(request, *args, **kwargs)
+
+        self.object = self.get_object()
+        cascade = self.get_cascade()
+        deleted = sum(count.total for count in cascade if count.deleted)
+        if deleted <= self.background_delete:
+            return super().post(request, *args, **kwargs)
+
+        # The job would fail in the background, so refuse it before it is started
+        if any(count.protected for count in cascade):
+            return self.render_to_response(
+                self.get_context_data(cascade=cascade, is_protected=True)
+            )
+
+        start_deletion(
+            self.object,
+            batch_size=self.background_batch_size,
+            runner=self.background_runner,
+        )
+        if self.background_message:
+            messages.info(
+                request,
+                self.background_message
+                % {"model_name": self.model._meta.verbose_name.title()},
+            )
+        return redirect(self.get_success_url())
+
+    def get_cascade(self) -> List[CascadeCount]:
+        """
+        Count the related objects affected by deleting the object
+        """
+        return get_cascade(self.object, max_depth=self.cascade_depth)
+
+    def get_context_data(self, **kwargs):
+        """
+        The template context has additional variables when ``cascade_summary`` is set::
+
+            cascade: List of CascadeCount tuples for each affected related model
+            cascade_deleted: Number of related objects which will be deleted
+            is_large_cascade: Whether the number deleted is above ``large_cascade``
+            is_protected: Whether related objects will prevent the delete
+        """
+        context = super().get_context_data(**kwargs)
+        if self.cascade_summary:
+            # The cascade may already have been counted by post()
+            cascade = context.get("cascade")
+            if cascade is None:
+                cascade = self.get_cascade()
+            deleted = sum(count.total for count in cascade if count.deleted)
+            context.update(
+                {
+                    "cascade": cascade,
+                    "cascade_deleted": deleted,
+                    "is_large_cascade": deleted > self.large_cascade,
+                    "is_protected": any(count.protected for count in cascade),
+                }
+            )
+        return context
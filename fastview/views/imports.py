@@ -0,0 +1,244 @@
+"""
+Bulk import of objects from an uploaded file
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from django import forms
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DatabaseError, transaction
+from django.db.models import Model
+from django.forms import ModelForm
+from django.forms.utils import ErrorDict
+from django.utils.translation import gettext as _
+from django.views.generic.detail import SingleObjectTemplateResponseMixin
+from django.views.generic.edit import BaseFormView
+
+from ..cache import bump_generation
+from ..constants import CREATE_VIEW
+from ..permissions import Permission
+from .mixins import FormFieldMixin, ModelFastViewMixin
+
+
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+
+
+class ImportForm(forms.Form):
+    """
+    Upload form for :class:`ImportView`
+    """
+
+    file = forms.FileField()
+    format = forms.ChoiceField(
+        choices=[(FORMAT_CSV, "CSV"), (FORMAT_JSON, "JSON lines")]
+    )
+
+
+class ImportResult:
+    """
+    The outcome of an import
+
+    Only the first ``max_errors`` row errors are kept; the rest are counted.
+    """
+
+    #: Number of objects created
+    created: int
+
+    #: Number of rows which were not imported
+    failed: int
+
+    #: List of ``(row number, [messages])`` tuples
+    errors: List[Tuple[int, List[str]]]
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, number: int, messages: List[str]):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((number, messages))
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.failed > len(self.errors)
+
+
+class ImportView(
+    FormFieldMixin,
+    ModelFastViewMixin,
+    SingleObjectTemplateResponseMixin,
+    BaseFormView,
+):
+    """
+    Create objects from an uploaded CSV or JSON lines file
+
+    The file is read one row at a time. Each row is validated by the view's model form,
+    and valid rows are inserted with ``bulk_create`` in batches of ``batch_size``, each
+    in its own transaction.
+
+    If the view has no ``permission`` of its own, it uses the permission of the
+    viewgroup's create view.
+
+    Because rows are inserted with ``bulk_create``, the model's ``save()`` is not called,
+    no ``pre_save`` or ``post_save`` signals are sent, and many-to-many fields are not
+    saved.
+    """
+
+    title = "{action} {verbose_name_plural}"
+    default_template_name = "fastview/import.html"
+    action = "import"
+    action_label = "Import"
+    template_name_suffix = "_import"
+
+    #: Form class for the upload
+    upload_form_class = ImportForm
+
+    #: Number of rows to insert in each query and transaction
+    batch_size: int = 500
+
+    #: Maximum number of row errors to report
+    max_errors: int = 100
+
+    #: Encoding of uploaded files
+    encoding: str = "utf-8-sig"
+
+    # No object, for SingleObjectMixin
+    object = None
+
+    @classmethod
+    def get_permission(cls) -> Permission:
+        """
+        Use the permission of the viewgroup's create view, unless one is set on this view
+        """
+        if not cls.permission and cls.viewgroup and CREATE_VIEW in cls.viewgroup.views:
+            return cls.viewgroup.views[CREATE_VIEW].get_permission()
+        return super().get_permission()
+
+    def get_form_class(self):
+        return self.upload_form_class
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs.pop("instance", None)
+        return kwargs
+
+    def get_row_form_class(self) -> Type[ModelForm]:
+        """
+        Return the model form class to validate each row, from ``fields``
+        """
+        return super().get_form_class()
+
+    def form_valid(self, form):
+        result = self.import_file(
+            form.cleaned_data["file"], form.cleaned_data["format"]
+        )
+        return self.render_to_response(self.get_context_data(form=form, result=result))
+
+    def import_file(self, file: UploadedFile, file_format: str) -> ImportResult:
+        """
+        Validate and insert the rows of the file, and return the result
+        """
+        result = ImportResult(self.max_errors)
+        form_class = self.get_row_form_class()
+        batch: List[Tuple[int, Model]] = []
+
+        number = 0
+        try:
+            for number, record in enumerate(self.read_rows(file, file_format), 1):
+                try:
+                    data = self.get_row_data(record, file_format)
+                except ValueError as error:
+                    result.add_error(number, [str(error)])
+                    continue
+
+                row_form = form_class(data=data)
+                if not row_form.is_valid():
+                    result.add_error(number, self.get_error_messages(row_form.errors))
+                    continue
+
+                batch.append((number, row_form.instance))
+                if len(batch) >= self.batch_size:
+                    self.save_batch(batch, result)
+                    batch = []
+
+        except (UnicodeDecodeError, csv.Error) as error:
+            result.add_error(number + 1, [_("Could not read file: %s") % error])
+
+        if batch:
+            self.save_batch(batch, result)
+        return result
+
+    def read_rows(self, file: UploadedFile, file_format: str) -> Iterator[Any]:
+        """
+        Read records from the file one at a time
+
+        CSV files yield a dict per row. JSON lines files yield the text of each line,
+        which is decoded by :meth:`get_row_data`.
+        """
+        file.seek(0)
+        stream = io.TextIOWrapper(file, encoding=self.encoding, newline="")
+        try:
+            if file_format == FORMAT_CSV:
+                yield from csv.DictReader(stream)
+            else:
+                for line in stream:
+                    if line.strip():
+                        yield line
+        finally:
+            # Leave the upload open for Django to clean up
+            stream.detach()
+
+    def get_row_data(self, record: Any, file_format: str) -> Dict[str, Any]:
+        """
+        Return the form data for a record, or raise ``ValueError`` if it is invalid
+        """
+        if file_format != FORMAT_JSON:
+            return record
+
+        try:
+            data = json.loads(record)
+        except ValueError:
+            raise ValueError(_("Invalid JSON"))
+        if not isinstance(data, dict):
+            raise ValueError(_("Expected a JSON object"))
+        return data
+
+    def get_error_messages(self, errors: ErrorDict) -> List[str]:
+        """
+        Flatten form errors into a list of messages
+        """
+        messages = []
+        for field, field_errors in errors.items():
+            for message in field_errors:
+                if field == NON_FIELD_ERRORS:
+                    messages.append(message)
+                else:
+                    messages.append(f"{field}: {message}")
+        return messages
+
+    def save_batch(self, batch: List[Tuple[int, Model]], result: ImportResult):
+        """
+        Insert a batch of valid rows in a single transaction
+
+        If the batch fails, every row in it is reported as an error.
+        """
+        objects = [obj for _number, obj in batch]
+        try:
+            with transaction.atomic():
+                self.model._default_manager.bulk_create(objects)
+        except DatabaseError as error:
+            for number, _obj in batch:
+                result.add_error(number, [_("Could not save: %s") % error])
+            return
+
+        result.created += len(objects)
+        bump_generation(self.model)
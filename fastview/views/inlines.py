@@ -3,21 +3,319 @@ Form view inlines
 
 Mimic Django admin inlines
 """
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.db.models import Model, Q, QuerySet
 from django.db.models.base import ModelBase
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.forms import BaseInlineFormSet, ModelForm
 from django.forms.models import inlineformset_factory
+from django.http import QueryDict
 
-from ..forms import InlineChildModelForm
-from .mixins import FormFieldMixin, InlineMixin
+from ..cache import bump_generation, has_receivers
+from ..forms import (
+    InlineChildModelForm,
+    SharedChoices,
+    bulk_update_fields,
+    form_overrides_save,
+    get_changed_fields,
+)
+from .mixins import FormFieldMixin, InlineMixin, fields_key
+from .query import get_search_rule
+
+
+#: Management field posted by the formset JavaScript with the number of unchanged
+#: initial forms it left out of the POST
+OMITTED_FORM_COUNT = "OMITTED_FORMS"
+
+# Formset classes built by inlineformset_factory, by inline class, parent and fields
+_formset_classes: Dict[Tuple[Any, ...], Type[BaseInlineFormSet]] = {}
 
 
 class InlineFormSet(BaseInlineFormSet):
+    #: Choices shared with the parent form and other formsets, set by ``InlineMixin``
+    shared_choices: Optional[SharedChoices] = None
+
+    #: Number of existing rows to show at once, or ``None`` to show them all.
+    #: Set from ``Inline.page_size``
+    page_size: Optional[int] = None
+
+    #: Ordering for the existing rows. Set from ``Inline.ordering``
+    ordering: Optional[List[str]] = None
+
+    #: Fields to search the existing rows by. Set from ``Inline.search_fields``
+    search_fields: Optional[List[str]] = None
+
+    #: Request query params, used to select the window of existing rows
+    params: Optional[QueryDict] = None
+
+    def __init__(self, *args, params: Optional[QueryDict] = None, **kwargs):
+        self.params = params
+        super().__init__(*args, **kwargs)
+
     @property
     def title(self):
         return self.model._meta.verbose_name_plural.title()
 
+    def get_param(self, name: str) -> str:
+        """
+        Return a window param for this formset from the request query params
+        """
+        if self.params is None:
+            return ""
+        return self.params.get(self.add_prefix(name), "").strip()
+
+    @property
+    def search(self) -> str:
+        return self.get_param("q")
+
+    def get_search_rule(self, field: str) -> str:
+        """
+        Add ``__icontains`` to the search field, unless it already specifies a string
+        rule
+        """
+        return get_search_rule(field)
+
+    def get_base_queryset(self) -> QuerySet:
+        """
+        Return the ordered and searched existing rows, before they are windowed
+        """
+        if self.queryset is not None:
+            qs = self.queryset
+        else:
+            qs = self.model._default_manager.get_queryset()
+
+        if self.ordering:
+            qs = qs.order_by(*self.ordering)
+        elif not qs.ordered:
+            qs = qs.order_by(self.model._meta.pk.name)
+
+        if self.search and self.search_fields:
+            rules = Q()
+            for field in self.search_fields:
+                rules |= Q(**{self.get_search_rule(field): self.search})
+            qs = qs.filter(rules)
+        return qs
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Return the existing rows to show in the formset
+
+        If the formset has a ``page_size``, this is the current window of rows. If the
+        formset is bound and windowed, or some forms were omitted from the POST, this
+        is the rows which were submitted; see :meth:`get_submitted_queryset`.
+        """
+        if not hasattr(self, "_queryset"):
+            qs = self.get_base_queryset()
+            if self.is_bound and (self.page_size or self.omitted_form_count()):
+                qs = self.get_submitted_queryset(qs)
+            elif self.page_size:
+                window = self.window
+                if window is not None:
+                    qs = window.object_list
+            self._queryset = qs
+        return self._queryset
+
+    def get_submitted_queryset(self, qs: QuerySet) -> QuerySet:
+        """
+        Restrict the existing rows to the rows whose forms were submitted
+
+        This means rows which were added or removed since the page was rendered do not
+        change which objects the submitted forms are matched to, and rows outside the
+        window or omitted from the POST are never loaded, validated or saved.
+        """
+        to_python = self._get_to_python(self.model._meta.pk)
+        pk_name = self.model._meta.pk.name
+        count = self.initial_form_count()
+        if self.page_size:
+            count = min(count, self.page_size)
+
+        pks = []
+        for index in range(count):
+            try:
+                pk = to_python(self.data.get(f"{self.add_prefix(index)}-{pk_name}"))
+            except ValidationError:
+                continue
+            if pk is not None:
+                pks.append(pk)
+        return qs.filter(pk__in=pks)
+
+    @property
+    def can_omit_forms(self) -> bool:
+        """
+        Whether the formset JavaScript can leave unchanged initial forms out of the POST
+
+        Not supported when the number of forms is validated or the forms can be
+        ordered, as these need every form to be submitted.
+        """
+        return not (self.validate_min or self.validate_max or self.can_order)
+
+    def omitted_form_count(self) -> int:
+        """
+        Return the number of unchanged initial forms which were left out of the POST
+        """
+        if not self.is_bound or not self.can_omit_forms:
+            return 0
+        try:
+            return max(0, int(self.data.get(self.add_prefix(OMITTED_FORM_COUNT), 0)))
+        except (TypeError, ValueError):
+            return 0
+
+    @property
+    def window(self) -> Optional[Page]:
+        """
+        Return the page of existing rows shown in the formset, or ``None`` if the
+        formset is not windowed
+        """
+        if not self.page_size:
+            return None
+        if not hasattr(self, "_window"):
+            paginator = Paginator(self.get_base_queryset(), self.page_size)
+            self._window = paginator.get_page(self.get_param("page"))
+        return self._window
+
+    def get_window_querystring(self, page: int) -> str:
+        """
+        Return the query string for a page of existing rows
+        """
+        params = (
+            self.params.copy() if self.params is not None else QueryDict(mutable=True)
+        )
+        params[self.add_prefix("page")] = str(page)
+        return params.urlencode()
+
+    @property
+    def window_search_params(self) -> List[Tuple[str, str]]:
+        """
+        Return the other query params as (name, value) pairs, for hidden inputs in the
+        search form, so a search keeps the page and other windows
+
+        This formset's search and page params are left out, so a search starts on the
+        first page.
+        """
+        if self.params is None:
+            return []
+        own = {self.add_prefix("q"), self.add_prefix("page")}
+        return [
+            (name, value)
+            for name, values in self.params.lists()
+            if name not in own
+            for value in values
+        ]
+
+    @property
+    def previous_window_querystring(self) -> Optional[str]:
+        window = self.window
+        if window is None or not window.has_previous():
+            return None
+        return self.get_window_querystring(window.previous_page_number())
+
+    @property
+    def next_window_querystring(self) -> Optional[str]:
+        window = self.window
+        if window is None or not window.has_next():
+            return None
+        return self.get_window_querystring(window.next_page_number())
+
+    def add_fields(self, form, index):
+        """
+        Called for each form, including the empty form
+        """
+        super().add_fields(form, index)
+        if self.shared_choices is not None:
+            self.shared_choices.apply(form)
+
+    def save(self, commit=True):
+        """
+        Save the formset with bulk queries if possible, otherwise one query per row
+        """
+        if not commit or not self.can_bulk_save():
+            return super().save(commit=commit)
+        return self.save_bulk()
+
+    def can_bulk_save(self) -> bool:
+        """
+        Check the rows can be saved without calling each object's ``save()`` and
+        ``delete()`` methods or the form's ``save()``, which bulk queries bypass along
+        with model signals
+        """
+        model = self.model
+        if self.save_as_new:
+            return False
+        if form_overrides_save(self.form):
+            return False
+        if model.save is not Model.save or model.delete is not Model.delete:
+            return False
+        if any(
+            field.name in self.form.base_fields for field in model._meta.many_to_many
+        ):
+            return False
+        signals = (pre_save, post_save, pre_delete, post_delete, m2m_changed)
+        return not any(has_receivers(signal, model) for signal in signals)
+
+    def get_update_fields(self, form: ModelForm) -> List[str]:
+        """
+        Return the names of the model fields to update for a changed form
+        """
+        return get_changed_fields(form, exclude=[self.fk.name])
+
+    def save_bulk(self) -> List[Model]:
+        """
+        Save the formset with one DELETE for deleted rows, one UPDATE for each set of
+        changed fields, and one INSERT for new rows
+
+        Objects are not refreshed after the INSERT, so new objects will only have a
+        primary key on database backends which can return it from a bulk insert.
+        """
+        manager = self.model._default_manager
+        self.changed_objects = []
+        self.deleted_objects = []
+        self.new_objects = []
+
+        updates: Dict[Tuple[str, ...], List[Model]] = {}
+        for form in self.initial_forms:
+            obj = form.instance
+            if obj.pk is None:
+                continue
+            if self.can_delete and self._should_delete_form(form):
+                self.deleted_objects.append(obj)
+            elif form.has_changed():
+                self.changed_objects.append((obj, form.changed_data))
+                update_fields = self.get_update_fields(form)
+                if update_fields:
+                    updates.setdefault(tuple(update_fields), []).append(obj)
+
+        for form in self.extra_forms:
+            if not form.has_changed():
+                continue
+            if self.can_delete and self._should_delete_form(form):
+                continue
+            setattr(form.instance, self.fk.name, self.instance)
+            self.new_objects.append(form.instance)
+
+        if self.deleted_objects:
+            manager.filter(pk__in=[obj.pk for obj in self.deleted_objects]).delete()
+
+        for field_names, objs in updates.items():
+            bulk_update_fields(self.model, objs, field_names)
+
+        if self.new_objects:
+            manager.bulk_create(self.new_objects)
+
+        # Updates have already bumped the generation
+        if self.deleted_objects or self.new_objects:
+            bump_generation(self.model)
+
+        return [obj for obj, _ in self.changed_objects] + self.new_objects
+
 
 class Inline(FormFieldMixin):
     model: Type[ModelBase]
@@ -40,6 +338,15 @@ class Inline(FormFieldMixin):
     can_order: bool = False
     can_delete: bool = True
 
+    #: Number of existing rows to show at once, or ``None`` to show them all
+    page_size: Optional[int] = None
+
+    #: Ordering for the existing rows
+    ordering: Optional[List[str]] = None
+
+    #: Fields to search the existing rows by
+    search_fields: Optional[List[str]] = None
+
     def __init__(self, parent_model: Type[ModelBase]):
         self.parent_model = parent_model
         super().__init__()
@@ -50,9 +357,30 @@ class Inline(FormFieldMixin):
             cls = type("InlineFormSet", (InlineFormSet, cls), {})
         return cls
 
-    def get_formset(self) -> BaseInlineFormSet:
+    def get_formset(self) -> Type[BaseInlineFormSet]:
+        """
+        Return the formset class for this inline
+
+        Formset classes are built once and reused; see :meth:`get_formset_class_key`.
+        """
         self.fields = self.get_fields()
-        return inlineformset_factory(
+        key = self.get_formset_class_key()
+        if key not in _formset_classes:
+            _formset_classes[key] = self.build_formset()
+        return _formset_classes[key]
+
+    def get_formset_class_key(self) -> Tuple[Any, ...]:
+        """
+        Return the key to reuse a formset class built by :meth:`get_formset`
+
+        The other formset options are read from class attributes, so are the same for
+        every instance of the inline class. If a subclass changes them per instance,
+        it should add them to this key.
+        """
+        return (type(self), self.parent_model, fields_key(self.fields))
+
+    def build_formset(self) -> Type[BaseInlineFormSet]:
+        formset = inlineformset_factory(
             parent_model=self.parent_model,
             model=self.model,
             form=self.form,
@@ -75,6 +403,10 @@ class Inline(FormFieldMixin):
             can_order=self.can_order,
             can_delete=self.can_delete,
         )
+        formset.page_size = self.page_size
+        formset.ordering = self.ordering
+        formset.search_fields = self.search_fields
+        return formset
 
     def get_initial(self) -> Dict[str, Any]:
         # TODO
@@ -3,32 +3,82 @@ Mixins for fastviews
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union, cast
-
+import hashlib
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from django.conf import settings
+from django.contrib import messages
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import AutoField
 from django.forms.models import ModelForm, modelform_factory
-from django.http import Http404
+from django.http import Http404, HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 from django.utils.translation import gettext as _
 from django.views.generic.edit import ModelFormMixin
 
-from ..constants import INDEX_VIEW, TEMPLATE_FRAGMENT_SLUG
-from ..forms import InlineParentModelForm
-from ..permissions import Denied, Permission
+from ..cache import (
+    get_cache,
+    get_canonical_url,
+    get_path_models,
+    make_key,
+    resolve_model,
+    watch_view,
+)
+from ..constants import (
+    AUTOCOMPLETE_VIEW,
+    DELETE_VIEW,
+    INDEX_VIEW,
+    TEMPLATE_FRAGMENT_SLUG,
+)
+from ..deletion import get_deleting_pks
+from ..exceptions import ConflictError
+from ..forms import InlineParentModelForm, SharedChoices, use_autocomplete
+from ..permissions import Denied, Permission, Public
 from ..urls import viewgroup_reverse
 from .display import AttributeValue, DisplayValue
 from .objects import AnnotatedObject
 
 
 if TYPE_CHECKING:
+    from django.db.models import Model
     from django.db.models.base import ModelBase
 
     from ..viewgroups import ViewGroup
     from .inlines import Inline
 
 
+# Form classes built by modelform_factory, by model, base form class and fields
+_form_classes: Dict[Tuple[Any, ...], Type[ModelForm]] = {}
+
+# InlineParentModelForm versions of form classes
+_inline_parent_form_classes: Dict[Type[ModelForm], Type[InlineParentModelForm]] = {}
+
+
+def fields_key(fields: Any) -> Any:
+    """
+    Return a hashable version of a ``fields`` attribute, for use in class cache keys
+    """
+    if fields is None or isinstance(fields, str):
+        return fields
+    return tuple(fields)
+
+
 class AbstractFastView(UserPassesTestMixin):
     """
     Mixin for a class-based view which supports FastView groups but does not render a
@@ -141,9 +191,125 @@ class FastViewMixin(AbstractFastView):
     # Template name when rendering a fragment
     fragment_template_name: Optional[str] = None
 
+    #: Serve anonymous requests from a shared page cache when the view's permission is
+    #: :class:`~fastview.permissions.Public`. See :ref:`performance__page_cache`
+    cache_pages: bool = False
+
+    #: Number of seconds to cache for. If ``None``, the cache's default is used
+    cache_timeout: Optional[int] = None
+
+    #: Additional models which the view's output depends on, as model classes or
+    #: ``"app_label.ModelName"`` strings. Changes to these will invalidate the view's
+    #: cache entries.
+    cache_models: Optional[List[Union[str, Type[Model]]]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Model views can't be watched until they have a model
+        if cls.uses_cache() and getattr(cls, "model", True) is not None:
+            watch_view(cls)
+
     def dispatch(self, request, *args, as_fragment=False, **kwargs):
         self._as_fragment = as_fragment
-        return super().dispatch(request, *args, **kwargs)
+        if not self.cache_pages:
+            return super().dispatch(request, *args, **kwargs)
+
+        if self.is_page_cacheable():
+            response = self.get_cached_page(request, *args, **kwargs)
+        else:
+            response = super().dispatch(request, *args, **kwargs)
+
+        # Responses differ for visitors with a session
+        patch_vary_headers(response, ["Cookie"])
+        return response
+
+    def get_cached_page(self, request, *args, **kwargs) -> HttpResponse:
+        """
+        Return the response from the page cache, or render and cache it
+        """
+        cache = get_cache()
+        key = self.get_page_cache_key()
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if isinstance(response, SimpleTemplateResponse):
+            response.render()
+        if self.is_response_cacheable(response):
+            # No Cache-Control, as copies downstream would outlive the generation
+            cache.set(key, response, self.get_cache_timeout())
+        return response
+
+    @classmethod
+    def uses_cache(cls) -> bool:
+        """
+        Whether any cache is enabled for this view, so its models need watching
+        """
+        return cls.cache_pages
+
+    def get_cache_timeout(self) -> Optional[int]:
+        if self.cache_timeout is None:
+            return get_cache().default_timeout
+        return self.cache_timeout
+
+    def get_cache_models(self) -> List[Type[Model]]:
+        """
+        Return the models whose changes invalidate this view's cache entries
+        """
+        return [resolve_model(model) for model in self.cache_models or []]
+
+    def is_page_cacheable(self) -> bool:
+        """
+        Pages are cached for anonymous GET requests to public views
+
+        Requests with a session or messages cookie are not served from the cache, as
+        the page may show something specific to that visitor.
+        """
+        request = self.request
+        if self._as_fragment or request.method not in ("GET", "HEAD"):
+            return False
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return False
+
+        cookie_names = [
+            settings.SESSION_COOKIE_NAME,
+            getattr(settings, "MESSAGE_COOKIE_NAME", "messages"),
+        ]
+        if any(name in request.COOKIES for name in cookie_names):
+            return False
+
+        return isinstance(self.get_permission(), Public)
+
+    def is_response_cacheable(self, response: HttpResponse) -> bool:
+        """
+        Only cache complete responses which have not set anything for the visitor
+        """
+        messages = getattr(self.request, "_messages", None)
+        return (
+            response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not self.request.META.get("CSRF_COOKIE_USED")
+            and not getattr(messages, "added_new", False)
+            and "private" not in response.get("Cache-Control", "")
+        )
+
+    def get_page_cache_key(self) -> str:
+        """
+        Build a cache key for the page from the canonical URL of the request, the
+        permission fingerprint and the generations of :meth:`get_cache_models`
+        """
+        return make_key(
+            "page",
+            type(self).__module__,
+            type(self).__qualname__,
+            get_canonical_url(self.request),
+            self.get_permission_fingerprint(self.get_cache_permissions()),
+            models=self.get_cache_models(),
+        )
 
     def get_template_names(self, as_fragment=False) -> List[str]:
         # Get default template names
@@ -193,6 +359,28 @@ class FastViewMixin(AbstractFastView):
 
         return context
 
+    def get_cache_permissions(self) -> List[Permission]:
+        """
+        Return the permissions which can change the rendered output of this view
+
+        This is the view's own permission, plus the permissions of the views in its
+        viewgroup, which are used for action links.
+        """
+        permissions = [self.get_permission()]
+        if self.viewgroup:
+            permissions += [
+                view.get_permission() for view in self.viewgroup.views.values()
+            ]
+        return permissions
+
+    def get_permission_fingerprint(self, permissions: List[Permission]) -> str:
+        """
+        Combine the fingerprints of the given permissions for the current request
+        """
+        return "|".join(
+            permission.get_fingerprint(self.request) for permission in permissions
+        )
+
     def get_title(self):
         """
         Get the title for the page
@@ -236,17 +424,125 @@ class ModelFastViewMixin(FastViewMixin):
 
     model: Type[ModelBase]
     annotated_model_object = None
-    action_links = None
+    action_links: Optional[List[str]] = None
+
+    #: Name of a model field which changes whenever an object changes, such as an
+    #: ``updated_at`` field with ``auto_now=True``. If set, views which support it will
+    #: answer conditional GET requests. See :ref:`performance__conditional`
+    version_field: Optional[str] = None
+
+    def get(self, request, *args, **kwargs):
+        """
+        Return ``304 Not Modified`` if the client's copy is current
+        """
+        version = None
+        if self.version_field and not self._as_fragment:
+            version = self.get_version()
+
+        if version is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators(version)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_vary_headers(response, ["Cookie"])
+        return response
+
+    def get_version(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Return values which identify the version of the data the view will show, where
+        the first value is the latest value of the ``version_field``
+
+        Returns ``None`` if the view doesn't support conditional requests.
+        """
+        return None
+
+    def get_validators(self, version: Tuple[Any, ...]) -> Tuple[str, Optional[int]]:
+        """
+        Return the ``ETag`` and ``Last-Modified`` timestamp for a version
+
+        The ETag includes the permission fingerprint, so users who can see different
+        things get different ETags.
+        """
+        parts = [
+            self.request.path,
+            self.get_permission_fingerprint(self.get_cache_permissions()),
+            *version,
+        ]
+        digest = hashlib.md5("|".join(str(part) for part in parts).encode())
+        etag = f'W/"{digest.hexdigest()}"'
+        return etag, self.get_last_modified(version)
+
+    def get_last_modified(self, version: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Return the ``Last-Modified`` timestamp for a version, or ``None`` to only send
+        the ``ETag``
+
+        The timestamp is only used if it is the version field's value, so it changes
+        whenever the data does. Views whose version has other parts which can change
+        on their own should return ``None``.
+        """
+        if isinstance(version[0], datetime):
+            return int(version[0].timestamp())
+        return None
 
     def get_queryset(self):
         """
-        Filter the queryset using the class filter and permissions
+        Filter the queryset using the class filter and permissions, and hide objects
+        which are being deleted in the background
         """
         qs = super().get_queryset()
         if self.permission:
             qs = self.permission.filter(self.request, qs)
+        if self.hides_deleting():
+            deleting = get_deleting_pks(self.model)
+            if deleting:
+                qs = qs.exclude(pk__in=deleting)
         return qs
 
+    def hides_deleting(self) -> bool:
+        """
+        Check if objects being deleted in the background should be hidden, which is
+        when this view or its viewgroup's delete view can delete in the background
+        """
+        views: List[Type[AbstractFastView]] = [type(self)]
+        if self.viewgroup and DELETE_VIEW in self.viewgroup.views:
+            views.append(self.viewgroup.views[DELETE_VIEW])
+        return any(
+            getattr(view, "background_delete", None) is not None
+            and getattr(view, "model", None) is self.model
+            for view in views
+        )
+
+    def get_cache_models(self) -> List[Type[Model]]:
+        """
+        Add the view's model, plus any related models reached through the paths
+        returned by :meth:`get_cache_paths`
+        """
+        models = super().get_cache_models()
+        models.append(self.model)
+        for path in self.get_cache_paths():
+            models += get_path_models(self.model, path)
+        return models
+
+    def get_cache_paths(self) -> List[str]:
+        """
+        Return the lookup paths of related values which the view displays
+        """
+        paths = []
+        if isinstance(self, DisplayFieldMixin):
+            for display_value in self.get_fields():
+                if isinstance(display_value, AttributeValue):
+                    paths.append(display_value.attribute)
+        return paths
+
     def get_annotated_model_object(self):
         """
         Return an AnnotatedObject class for the annotated_object_list
@@ -282,6 +578,53 @@ class ObjectFastViewMixin(ModelFastViewMixin):
     Mixin for class-based views which operate on a single object
     """
 
+    #: Serve the object for GET requests from the cache. See
+    #: :ref:`performance__object_cache`
+    cache_objects: bool = False
+
+    @classmethod
+    def uses_cache(cls) -> bool:
+        return super().uses_cache() or cls.cache_objects
+
+    def get_object(self, queryset=None):
+        """
+        Read the object through the cache if ``cache_objects`` is enabled
+        """
+        if not self.is_object_cacheable(queryset):
+            return super().get_object(queryset)
+
+        cache = get_cache()
+        key = self.get_object_cache_key()
+        obj = cache.get(key)
+        if obj is None:
+            obj = super().get_object(queryset)
+            cache.set(key, obj, self.get_cache_timeout())
+        return obj
+
+    def is_object_cacheable(self, queryset=None) -> bool:
+        """
+        Objects are cached for GET requests using the view's own queryset
+        """
+        return (
+            self.cache_objects
+            and queryset is None
+            and self.request.method in ("GET", "HEAD")
+        )
+
+    def get_object_cache_key(self) -> str:
+        """
+        Build a cache key for the object from the URL kwargs, the fingerprint of the
+        view's permission, and the generations of :meth:`get_cache_models`
+        """
+        return make_key(
+            "object",
+            type(self).__module__,
+            type(self).__qualname__,
+            sorted(self.kwargs.items()),
+            self.get_permission_fingerprint([self.get_permission()]),
+            models=self.get_cache_models(),
+        )
+
     def has_permission(self) -> bool:
         """
         Check if this view instance has permission, based on self.request, the model and
@@ -289,11 +632,9 @@ class ObjectFastViewMixin(ModelFastViewMixin):
         """
         permission = self.__class__.get_permission()
 
-        # TODO: The permission check is carried out before ``self.get()`` sets
-        # ``self.object``, so we need to get it ourselves. This adds a call to
-        # ``get_object()``; this should be cached so not result in any additional db
-        # requests, but still seems unnecessary. Either rewimplement super's get to
-        # check for ``self.object``, or patch Django to do the same - see Django #18849
+        # The permission check is carried out before ``self.get()`` sets
+        # ``self.object``, so we need to get it ourselves, and then make sure the
+        # handler reuses it rather than fetching it again - see Django #18849
         instance = None
         if self.has_id_slug:
             # As this is before ``self.get()`` we don't want to bubble the potential Http404 just yet
@@ -303,8 +644,25 @@ class ObjectFastViewMixin(ModelFastViewMixin):
                 instance = self.get_object()
             except Http404:
                 return False
+            self.remember_object(instance)
         return permission.check(self.request, self.model, instance)
 
+    def remember_object(self, instance):
+        """
+        Make ``get_object()`` return this instance for the rest of the request
+
+        This replaces ``get_object`` on the view instance, so it also applies when a
+        subclass has overridden it. Calls with a custom queryset are passed through.
+        """
+        get_object = self.get_object
+
+        def get_remembered_object(queryset=None):
+            if queryset is None:
+                return instance
+            return get_object(queryset)
+
+        self.get_object = get_remembered_object
+
     def get_title_kwargs(self, **kwargs):
         kwargs = super().get_title_kwargs(**kwargs)
         kwargs["object"] = str(self.object)
@@ -359,6 +717,16 @@ class FormFieldMixin(BaseFieldMixin, ModelFormMixin):
     #: Allow collection of initial from GET parameters
     initial_from_params: bool = False
 
+    #: Only save an existing object if its ``version_field`` has not changed since the
+    #: form was rendered. The version is sent in a hidden field.
+    optimistic_lock: bool = False
+    version_field: Optional[str]  # Help type hinting
+
+    #: Related fields which should load their choices from the viewgroup's
+    #: autocomplete view, with the fields to search, eg ``{"author": ["username"]}``.
+    #: Set by ``ModelViewGroup.autocomplete_fields``
+    autocomplete_fields: Optional[Dict[str, List[str]]] = None
+
     form_class: Type[ModelForm] = ModelForm
 
     def get_form_class(self):
@@ -370,9 +738,75 @@ class FormFieldMixin(BaseFieldMixin, ModelFormMixin):
 
         Does NOT call super().get_form_class() - replacement logic to bypass errors
         which no longer apply.
+
+        Form classes are built once and reused; see :meth:`get_form_class_key`.
         """
         self.fields = self.get_fields()
-        return modelform_factory(self.model, form=self.form_class, fields=self.fields)
+        key = self.get_form_class_key()
+        if key not in _form_classes:
+            _form_classes[key] = modelform_factory(
+                self.model, form=self.form_class, fields=self.fields
+            )
+        return _form_classes[key]
+
+    def get_form_class_key(self) -> Tuple[Any, ...]:
+        """
+        Return the key to reuse a form class built by :meth:`get_form_class`
+
+        The form class only depends on the model, the base form class and the fields,
+        so a view which changes its fields in ``get_fields()`` will get a different
+        class for each set of fields.
+        """
+        return (self.model, self.form_class, fields_key(self.fields))
+
+    def get_form(self, form_class=None):
+        """
+        Add the version field to the form if using optimistic locking, and use
+        autocomplete widgets for ``autocomplete_fields``
+        """
+        form = super().get_form(form_class)
+        for name in self.autocomplete_fields or {}:
+            if name in form.fields:
+                url = viewgroup_reverse(
+                    f":{AUTOCOMPLETE_VIEW}", view=self, kwargs={"field_name": name}
+                )
+                use_autocomplete(form, name, url)
+
+        if (
+            self.optimistic_lock
+            and isinstance(form, InlineParentModelForm)
+            and not form.instance._state.adding
+        ):
+            if not self.version_field:
+                raise ImproperlyConfigured(
+                    f"{type(self).__name__} needs a version_field for optimistic_lock"
+                )
+            form.add_version_field(self.version_field)
+        return form
+
+    def form_valid(self, form):
+        """
+        Only update the changed fields when saving an existing object, and show an
+        error if the object was changed by someone else
+        """
+        if isinstance(form, InlineParentModelForm) and not form.instance._state.adding:
+            form.partial_save = True
+            form.update_fields = self.get_update_fields(form)
+        try:
+            return super().form_valid(form)
+        except ConflictError as error:
+            form.add_error(None, str(error))
+            return self.form_invalid(form)
+
+    def get_update_fields(self, form: ModelForm) -> Optional[List[str]]:
+        """
+        Return the names of the fields to update when saving an existing object, or
+        ``None`` to update the fields which differ from the object as it was loaded
+
+        Changes made to ``form.instance`` by the view are detected, so this only needs
+        to be overridden to save fields which would not otherwise appear changed.
+        """
+        return None
 
     def get_initial(self):
         """
@@ -393,6 +827,7 @@ class InlineMixin:
     # TODO: Consider merging with FormFieldMixin when adding support for nested inlines
     model: Type[ModelBase]  # Help type hinting to identify the intended base classes
     get_form_kwargs: Callable  # Help type hinting
+    request: HttpRequest  # Help type hinting
     inlines: Optional[List[Inline]] = None
 
     def get_form(self, form_class=None):
@@ -405,13 +840,19 @@ class InlineMixin:
             # It's not. It should have been set by .inlines.Inline, but someone must
             # have overriden the default without knowing what they're doing. Fix it.
             orig_cls = form.__class__
-            form.__class__ = type(
-                str("InlineParent%s" % orig_cls.__name__),
-                (InlineParentModelForm, orig_cls),
-                {},
-            )
+            if orig_cls not in _inline_parent_form_classes:
+                _inline_parent_form_classes[orig_cls] = type(
+                    str("InlineParent%s" % orig_cls.__name__),
+                    (InlineParentModelForm, orig_cls),
+                    {},
+                )
+            form.__class__ = _inline_parent_form_classes[orig_cls]
             form.__init_inlines__()
 
+        # Evaluate each choice queryset once for the form and its formsets
+        shared_choices = SharedChoices()
+        shared_choices.apply(form)
+
         # Look up and register the formsets
         form_prefix = self.get_prefix()
         if self.inlines is not None:
@@ -423,6 +864,7 @@ class InlineMixin:
                     inline, prefix=f"{form_prefix}__formset_{index}"
                 )
                 formset = formset_cls(**kwargs)
+                formset.shared_choices = shared_choices
                 form.add_formset(formset)
 
         return form
@@ -431,6 +873,7 @@ class InlineMixin:
         kwargs = self.get_form_kwargs()
         kwargs.update(extra_kwargs)
         kwargs["initial"] = inline.get_initial_from_view(view=self)
+        kwargs["params"] = self.request.GET
         return kwargs
 
 
@@ -531,6 +974,17 @@ class SuccessUrlMixin(SuccessMessageMixin):
                 return viewgroup_reverse(f":{INDEX_VIEW}", self)
             raise
 
+    def form_valid(self, form):
+        """
+        Only show the success message if the form was saved without errors
+        """
+        response = super(SuccessMessageMixin, self).form_valid(form)
+        if not form.errors:
+            success_message = self.get_success_message(form.cleaned_data)
+            if success_message:
+                messages.success(self.request, success_message)
+        return response
+
     def get_success_message(self, cleaned_data):
         data = cleaned_data.copy()
         if hasattr(self, "model"):
@@ -3,13 +3,14 @@ Annotated objects
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 from django.db.models import Model
-from django.urls import reverse
+from django.forms import BaseForm
 
 
 if TYPE_CHECKING:
+    from ..viewgroups.base import ActionLink
     from .mixins import ModelFastViewMixin
 
 
@@ -20,6 +21,13 @@ class AnnotatedObject:
     #: Current instance of the model that this annotated object wraps
     object: Model
 
+    #: Form for the object's editable fields in a list, if it can be edited
+    form: Optional[BaseForm] = None
+
+    #: Whether to add the viewgroup's object links. Views of a model other than the
+    #: viewgroup's should not link to its object views.
+    use_viewgroup_links: bool = True
+
     def __init__(self, instance: Model):
         """
         Arguments:
@@ -29,13 +37,13 @@ class AnnotatedObject:
 
     @classmethod
     def for_view(
-        cls, view: Type[ModelFastViewMixin], action_links: Optional[List[str]] = None
+        cls, view: ModelFastViewMixin, action_links: Optional[List[str]] = None
     ):
         """
         Generate a version of this class to fit the given view, model and viewgroup
 
         Arguments:
-            instance: Object which this is annotating
+            view: View instance which is rendering the objects
             action_links: List of action names to filter ``.action_links``. If ``None``,
                 show all.
 
@@ -45,34 +53,47 @@ class AnnotatedObject:
                 One for each view on the viewgroup.
             get_VIEW_url: the url to access the ``VIEW``, eg ``get_change_url()``.
                 One for each view on the viewgroup.
+
+        The methods are built once for each view class and set of action links; each
+        request only creates a subclass bound to the view instance.
         """
+        base = cls.get_view_class(type(view), action_links)
+        return type(base.__name__, (base,), {"view": view})
 
-        def can_factory(to_view):
+    @classmethod
+    def get_view_class(
+        cls, view_class: Type[ModelFastViewMixin], action_links: Optional[List[str]]
+    ) -> Type[AnnotatedObject]:
+        """
+        Return the cached subclass with the methods for the view class, building it on
+        first use
+        """
+        key = (
+            cls,
+            view_class,
+            view_class.action,
+            None if action_links is None else tuple(action_links),
+        )
+        if key in _view_classes:
+            return _view_classes[key]
+
+        def can_factory(link: ActionLink):
             """
             Generate view-specific can() methods for the instance
             """
 
             def can(self):
-                permission = to_view.get_permission()
-                if permission.check(
-                    request=self.view.request,
-                    model=type(self.object),
-                    instance=self.object,
-                ):
-                    return True
-                return False
+                return link.can(self.view.request, self.object)
 
             return can
 
-        def get_url_factory(to_name):
+        def get_url_factory(link: ActionLink):
             """
             Generate view-specific get_X_url() methods for the instance
             """
 
             def get_url(self):
-                namespace = self.view.request.resolver_match.namespace
-                full_name = f"{namespace}:{to_name}"
-                return reverse(full_name, args=[self.object.pk])
+                return link.get_url(self.view.request, self.object.pk)
 
             return get_url
 
@@ -95,36 +116,26 @@ class AnnotatedObject:
             return zip(self.labels(), self.values())
 
         # Attach functions for data values using same patterns as a dict
-        attrs = {"view": view, "labels": labels, "values": values, "items": items}
-
-        # TODO: This should probably be in the viewgroup for consistency
-        # Attach list of permissions and urls to this object for object-specific views
-        viewgroup = getattr(view, "viewgroup", None)
-        action_link_data = []
-        if viewgroup:
-            for name, to_view in viewgroup.get_object_views().items():
-                can = can_factory(to_view)
-                get_url = get_url_factory(name)
-                attrs[f"can_{name}"] = can
-                attrs[f"get_{name}_url"] = get_url
-                if (
-                    action_links is None or name in action_links
-                ) and name != view.action:
-                    action_link_data.append(
-                        (name, to_view.get_action_label(), can, get_url)
-                    )
-
-        # If action links were specified, sort them into that order
-        if action_links is not None:
-            action_links_list = action_links  # because mypy thought it could be None
-            action_link_data = sorted(
-                action_link_data, key=lambda data: action_links_list.index(data[0])
-            )
-
+        attrs: Dict[str, Any] = {"labels": labels, "values": values, "items": items}
+
+        # Attach permissions and urls to this object for object-specific views, using
+        # the links prepared by the viewgroup
+        viewgroup = getattr(view_class, "viewgroup", None)
+        action_link_data: List[ActionLink] = []
+        if viewgroup and cls.use_viewgroup_links:
+            for link in viewgroup.get_object_links():
+                attrs[f"can_{link.name}"] = can_factory(link)
+                attrs[f"get_{link.name}_url"] = get_url_factory(link)
+            action_link_data = [
+                link
+                for link in viewgroup.get_object_links(action_links)
+                if link.name != view_class.action
+            ]
         attrs["action_link_data"] = action_link_data
 
         # Create the new AnnotatedModel subclass
-        subclass = type(f"Annotated{view.model.__name__}", (cls,), attrs)
+        subclass = type(f"Annotated{view_class.model.__name__}", (cls,), attrs)
+        _view_classes[key] = subclass
         return subclass
 
     def action_links(self):
@@ -132,8 +143,13 @@ class AnnotatedObject:
         Return a list of (label, url) tuples for actions that can be performed on this
         object
         """
+        request = self.view.request
         return [
-            (label, get_url(self))
-            for name, label, can, get_url in self.action_link_data
-            if can(self)
+            (link.label, link.get_url(request, self.object.pk))
+            for link in self.action_link_data
+            if link.can(request, self.object)
         ]
+
+
+# Cache of AnnotatedObject subclasses by class, view class, action and action links
+_view_classes: Dict[tuple, Type[AnnotatedObject]] = {}
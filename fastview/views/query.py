@@ -0,0 +1,155 @@
+"""
+List query parameters
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+from django.http import QueryDict
+
+from ..constants import PARAM_LIMIT, PARAM_ORDER, PARAM_SEARCH
+
+
+#: String lookups which can be specified on a ``search_fields`` entry
+SEARCH_LOOKUPS = [
+    "exact",
+    "iexact",
+    "contains",
+    "icontains",
+    "startswith",
+    "istartswith",
+    "endswith",
+    "iendswith",
+]
+
+
+def get_search_rule(field: str) -> str:
+    """
+    Add ``__icontains`` to a ``search_fields`` entry, unless it already specifies a
+    string rule
+    """
+    suffix = field.rsplit("__", 1)[1] if "__" in field else ""
+    if not suffix or suffix not in SEARCH_LOOKUPS:
+        field = f"{field}__icontains"
+    return field
+
+
+class ListQuery(NamedTuple):
+    """
+    The list parameters of a request, parsed once and normalised
+
+    Two requests for the same list will have equal ``ListQuery`` objects, whatever the
+    order of their params, and regardless of empty or default values.
+    """
+
+    #: Display value slugs to order by, with a ``-`` prefix for descending order
+    order: Tuple[str, ...] = ()
+
+    #: Search term
+    search: str = ""
+
+    #: Maximum number of results, or ``0`` for no limit
+    limit: int = 0
+
+    #: Page number, or an empty string for the first page
+    page: str = ""
+
+    #: Any other params, including filters, as sorted ``(param, value)`` pairs
+    params: Tuple[Tuple[str, str], ...] = ()
+
+    #: Name of the page param
+    page_param: str = "page"
+
+    @classmethod
+    def from_params(cls, params: QueryDict, page_param: str = "page") -> ListQuery:
+        """
+        Parse and normalise the list parameters from ``request.GET``
+
+        Empty values are removed, along with a limit of ``0`` and a page of ``1``. If a
+        param is given more than once, the last value is used for the order, search,
+        limit and page.
+        """
+        order: List[str] = []
+        for slug in params.get(PARAM_ORDER, "").split(","):
+            slug = slug.strip()
+            if slug and slug not in order:
+                order.append(slug)
+
+        try:
+            limit = max(0, int(params.get(PARAM_LIMIT, 0)))
+        except ValueError:
+            limit = 0
+
+        page = params.get(page_param, "").strip()
+        if page == "1":
+            page = ""
+
+        reserved = (PARAM_ORDER, PARAM_SEARCH, PARAM_LIMIT, page_param)
+        other = sorted(
+            (key, value)
+            for key, values in params.lists()
+            if key not in reserved
+            for value in values
+            if value != ""
+        )
+
+        return cls(
+            order=tuple(order),
+            search=params.get(PARAM_SEARCH, "").strip(),
+            limit=limit,
+            page=page,
+            params=tuple(other),
+            page_param=page_param,
+        )
+
+    def get(self, param: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Return the last value of a filter or other param
+        """
+        value = default
+        for key, param_value in self.params:
+            if key == param:
+                value = param_value
+        return value
+
+    def to_params(self) -> List[Tuple[str, str]]:
+        """
+        Return all params as ``(param, value)`` pairs in canonical order
+        """
+        pairs = list(self.params)
+        if self.order:
+            pairs.append((PARAM_ORDER, ",".join(self.order)))
+        if self.search:
+            pairs.append((PARAM_SEARCH, self.search))
+        if self.limit:
+            pairs.append((PARAM_LIMIT, str(self.limit)))
+        if self.page:
+            pairs.append((self.page_param, self.page))
+        return sorted(pairs)
+
+    def to_querystring(self, **updates: Any) -> str:
+        """
+        Return the canonical query string, with optional updates
+
+        Pass a ``None`` value to remove a param.
+        """
+        if not updates:
+            return urlencode(self.to_params())
+
+        params = QueryDict(mutable=True)
+        for key, value in self.to_params():
+            params.appendlist(key, value)
+        for key, value in updates.items():
+            params.pop(key, None)
+            if value is not None:
+                params[key] = str(value)
+        return self.from_params(params, page_param=self.page_param).to_querystring()
+
+    @property
+    def cache_key(self) -> str:
+        """
+        A stable hash of the query, for use in cache keys
+        """
+        return hashlib.sha1(self.to_querystring().encode()).hexdigest()
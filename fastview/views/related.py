@@ -0,0 +1,161 @@
+"""
+Related object sections for detail views
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Type, Union
+
+import django
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ForeignObjectRel, Model, Prefetch, QuerySet
+
+from .display import DisplayValue
+from .mixins import DisplayFieldMixin
+
+
+class RelatedSection(DisplayFieldMixin):
+    """
+    A table of related objects on a detail page
+
+    The related objects are loaded with ``prefetch_related`` when the object is fetched.
+    """
+
+    #: Name of the related manager on the object, eg ``comment_set``
+    accessor: str
+
+    #: Ordering for the related objects
+    ordering: Optional[List[str]] = None
+
+    #: Maximum number of related objects to show
+    limit: Optional[int] = None
+
+    #: Label for the section. Defaults to the related model's plural verbose name
+    label: Optional[str] = None
+
+    #: Object this section has been bound to
+    instance: Optional[Model] = None
+
+    def __init__(
+        self,
+        accessor: str,
+        fields: Optional[List[Union[str, DisplayValue]]] = None,
+        ordering: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        label: Optional[str] = None,
+    ):
+        self.accessor = accessor
+        if fields is not None:
+            self.fields = fields
+        self.ordering = ordering
+        self.limit = limit
+        self.label = label
+
+    def deconstruct(self) -> Dict[str, Any]:
+        """
+        Create a dict of arguments for the constructor, used by clone()
+        """
+        return {
+            "accessor": self.accessor,
+            "fields": self.fields,
+            "ordering": self.ordering,
+            "limit": self.limit,
+            "label": self.label,
+        }
+
+    def clone(self) -> RelatedSection:
+        """
+        Make a clean copy of this section, without an object
+        """
+        return type(self)(**self.deconstruct())
+
+    def bind(self, instance: Model) -> RelatedSection:
+        """
+        Create a copy of this section for the given object
+        """
+        bound = self.clone()
+        bound.model = bound.get_related_model(type(instance))
+        bound.instance = instance
+        return bound
+
+    def get_related_model(self, parent_model: Type[Model]) -> Type[Model]:
+        """
+        Find the model of the related objects from the accessor
+        """
+        for field in parent_model._meta.get_fields():
+            if not (field.one_to_many or field.many_to_many):
+                continue
+            if isinstance(field, ForeignObjectRel):
+                name = field.get_accessor_name()
+            else:
+                name = field.name
+            if name == self.accessor:
+                return field.related_model
+
+        raise FieldDoesNotExist(
+            f"{parent_model.__name__} has no related objects {self.accessor}"
+        )
+
+    def get_label(self) -> str:
+        if self.label is not None:
+            return self.label
+        return self.model._meta.verbose_name_plural.title()
+
+    def get_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Apply the ordering to the related queryset
+
+        Subclasses can override this to add a ``select_related`` for the display
+        fields.
+        """
+        if self.ordering:
+            queryset = queryset.order_by(*self.ordering)
+        return queryset
+
+    @property
+    def to_attr(self) -> str:
+        return f"fastview_{self.accessor}"
+
+    def can_prefetch(self) -> bool:
+        """
+        Sliced prefetches need Django 4.2 or later
+        """
+        return not self.limit or django.VERSION >= (4, 2)
+
+    def get_prefetch(self, parent_model: Type[Model]) -> Optional[Prefetch]:
+        """
+        Return a ``Prefetch`` for the related objects, or ``None`` if they will be
+        fetched when rendered
+        """
+        if not self.can_prefetch():
+            return None
+
+        model = self.get_related_model(parent_model)
+        queryset = self.get_queryset(model._default_manager.all())
+        if self.limit:
+            queryset = queryset[: self.limit]
+        return Prefetch(self.accessor, queryset=queryset, to_attr=self.to_attr)
+
+    def get_objects(self) -> List[Model]:
+        """
+        Return the related objects for the bound object
+        """
+        if self.instance is None:
+            raise ValueError("Related section is not bound to an object")
+
+        if hasattr(self.instance, self.to_attr):
+            return getattr(self.instance, self.to_attr)
+
+        queryset = self.get_queryset(getattr(self.instance, self.accessor).all())
+        if self.limit:
+            queryset = queryset[: self.limit]
+        return list(queryset)
+
+    @property
+    def rows(self) -> List[List[Any]]:
+        """
+        Return the display values for each related object
+        """
+        fields = self.get_fields()
+        return [
+            [field.get_value(obj) for field in fields] for obj in self.get_objects()
+        ]
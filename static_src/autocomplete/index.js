@@ -0,0 +1,115 @@
+/**
+ * Autocomplete for related fields
+ *
+ * Select elements with a data-fastview-autocomplete URL only render their selected
+ * options; this adds a search input which loads matching options from the URL.
+ */
+
+const defaultDataAutocomplete = 'fastview-autocomplete';
+
+export class Autocomplete {
+  /**
+   * Manage an autocomplete select
+   */
+
+  delay = 250;
+
+  constructor(selectEl, url) {
+    this.selectEl = selectEl;
+    this.url = url;
+    this.term = '';
+    this.page = 1;
+    this.timeout = null;
+
+    this.searchEl = this.createSearchEl();
+    this.moreEl = this.createMoreEl();
+  }
+
+  createSearchEl() {
+    let searchEl = document.createElement('input');
+    searchEl.type = 'search';
+    searchEl.className = 'fastview-autocomplete-search';
+    searchEl.placeholder = 'Search';
+    this.selectEl.parentNode.insertBefore(searchEl, this.selectEl);
+    searchEl.addEventListener('input', () => {
+      clearTimeout(this.timeout);
+      this.timeout = setTimeout(() => this.search(searchEl.value), this.delay);
+    });
+    return searchEl;
+  }
+
+  createMoreEl() {
+    let moreEl = document.createElement('button');
+    moreEl.type = 'button';
+    moreEl.className = 'fastview-autocomplete-more';
+    moreEl.innerHTML = 'More';
+    moreEl.style.setProperty('display', 'none');
+    this.selectEl.parentNode.insertBefore(moreEl, this.selectEl.nextSibling);
+    moreEl.onclick = () => {
+      this.load(this.term, this.page + 1);
+    };
+    return moreEl;
+  }
+
+  search(term) {
+    this.load(term.trim(), 1);
+  }
+
+  async load(term, page) {
+    /**
+     * Load a page of options which match the term
+     */
+    let params = new URLSearchParams({q: term, page: page});
+    let response = await fetch(`${this.url}?${params}`, {credentials: 'same-origin'});
+    if (!response.ok) {
+      return;
+    }
+    let data = await response.json();
+
+    // Ignore out of date responses
+    if (term != this.searchEl.value.trim()) {
+      return;
+    }
+
+    this.term = term;
+    this.page = page;
+    this.render(data.results, page > 1);
+    this.moreEl.style.setProperty('display', data.more ? '' : 'none');
+  }
+
+  render(results, append) {
+    /**
+     * Replace unselected options with the results
+     */
+    if (!append) {
+      Array.from(this.selectEl.options).forEach(optionEl => {
+        if (!optionEl.selected && optionEl.value) {
+          optionEl.remove();
+        }
+      });
+    }
+
+    const existing = new Set(Array.from(this.selectEl.options).map(el => el.value));
+    results.forEach(result => {
+      const value = String(result.id);
+      if (existing.has(value)) {
+        return;
+      }
+      this.selectEl.appendChild(new Option(result.text, value));
+    });
+  }
+}
+
+export function autocompletes(
+  dataAutocomplete = defaultDataAutocomplete,
+  autocompleteClass = Autocomplete,
+) {
+  /**
+   * Initialise autocomplete selects with the data attribute matching dataAutocomplete
+   */
+  let selectEls = document.querySelectorAll(`select[data-${dataAutocomplete}]`);
+  selectEls.forEach(selectEl => {
+    let url = selectEl.getAttribute(`data-${dataAutocomplete}`);
+    new autocompleteClass(selectEl, url);
+  });
+}
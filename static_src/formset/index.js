@@ -6,6 +6,7 @@ const defaultDataFormset = 'fastview-formset';
 const defaultDataForm = 'fastview-formset-form';
 const defaultDataTemplate = 'fastview-formset-template';
 const defaultDataPk = 'fastview-formset-pk';
+const defaultDataOmit = 'fastview-formset-omit';
 
 class Form {
   /**
@@ -15,10 +16,19 @@ class Form {
     this.formset = formset;
     this.rootEl = rootEl;
     this.prefix = prefix;
+    this.index = parseInt(prefix.slice(formset.prefix.length + 1), 10);
 
     // Set a flag so CSS can change its layout
     this.rootEl.classList.add("js-enabled");
 
+    // Track whether the user has changed any values in this form
+    this.dirty = false;
+    const setDirty = () => {
+      this.dirty = true;
+    };
+    this.rootEl.addEventListener('input', setDirty);
+    this.rootEl.addEventListener('change', setDirty);
+
     this.deleteEl = this.getDeleteEl();
     this.deleteCon = this.getDeleteCon();
     this.render();
@@ -98,6 +108,38 @@ class Form {
     this.render();
   }
 
+  disable() {
+    /**
+     * Disable all fields so the form is not submitted
+     */
+    this.rootEl.querySelectorAll('input, select, textarea').forEach(fieldEl => {
+      fieldEl.disabled = true;
+    });
+  }
+
+  renumber(index) {
+    /**
+     * Change the form's index, updating the prefix of all its fields
+     */
+    const oldPrefix = `${this.prefix}-`;
+    const newPrefix = `${this.formset.prefix}-${index}-`;
+    if (oldPrefix == newPrefix) {
+      return;
+    }
+
+    this.rootEl.querySelectorAll('[name], [id], [for]').forEach(el => {
+      ['name', 'id', 'for'].forEach(attr => {
+        const value = el.getAttribute(attr);
+        if (value && value.includes(oldPrefix)) {
+          el.setAttribute(attr, value.replace(oldPrefix, newPrefix));
+        }
+      });
+    });
+    this.prefix = `${this.formset.prefix}-${index}`;
+    this.index = index;
+    this.rootEl.setAttribute(`data-${this.formset.dataForm}`, this.prefix);
+  }
+
   render() {
     /**
      * Render the form whenever there is a change to delete state
@@ -127,6 +169,7 @@ export class Formset {
   dataForm = defaultDataForm;
   dataTemplate = defaultDataTemplate;
   dataPk = defaultDataPk;
+  dataOmit = defaultDataOmit;
   formClass = Form;
 
   constructor(rootEl, prefix) {
@@ -156,6 +199,7 @@ export class Formset {
 
     // We're removing if we have empty extra forms
     const initialForms = parseInt(this.initialFormsEl.value, 10);
+    this.initialFormCount = initialForms;
     let removing = (this.numForms > initialForms);
 
     // Build list of template fields so we can see which values have changed
@@ -200,10 +244,58 @@ export class Formset {
     this.addEl = this.getAddEl();
     this.addCon = this.getAddCon();
 
+    // Leave unchanged initial forms out of the POST, if the server supports it
+    this.canOmit = rootEl.getAttribute(`data-${this.dataOmit}`) == 'true';
+    const formEl = rootEl.closest('form');
+    if (this.canOmit && formEl) {
+      formEl.addEventListener('submit', () => {
+        this.omitUnchanged();
+      });
+    }
+
     // Re-render this and all forms
     this.render();
   }
 
+  omitUnchanged() {
+    /**
+     * Disable unchanged initial forms so they are not submitted, renumber the
+     * remaining forms to close the gaps, and tell the server how many were omitted
+     */
+    let index = 0;
+    let initial = 0;
+    let omitted = 0;
+    this.forms.forEach(form => {
+      if (form.index < this.initialFormCount) {
+        if (!form.dirty) {
+          form.disable();
+          omitted += 1;
+          return;
+        }
+        initial += 1;
+      }
+      form.renumber(index);
+      index += 1;
+    });
+
+    if (!omitted) {
+      return;
+    }
+    this.initialFormsEl.value = initial;
+    this.initialFormCount = initial;
+    this.numForms = index;
+
+    let omittedEl = document.getElementById(`id_${this.prefix}-OMITTED_FORMS`);
+    if (!omittedEl) {
+      omittedEl = document.createElement('input');
+      omittedEl.type = 'hidden';
+      omittedEl.id = `id_${this.prefix}-OMITTED_FORMS`;
+      omittedEl.name = `${this.prefix}-OMITTED_FORMS`;
+      this.rootEl.appendChild(omittedEl);
+    }
+    omittedEl.value = omitted;
+  }
+
   getAddEl() {
     let button = document.createElement('button');
     button.innerHTML = 'Add';
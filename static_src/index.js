@@ -1,7 +1,9 @@
+import { autocompletes } from './autocomplete/index.js';
 import { formsets } from './formset/index.js';
 import { listView } from './list/index.js';
 
 document.addEventListener('DOMContentLoaded', (event) => {
+  autocompletes();
   formsets();
   listView();
 })
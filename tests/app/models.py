@@ -8,8 +8,22 @@ from django.db import models
 class Entry(models.Model):
     title = models.CharField(max_length=255, default="Title")
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    updated = models.DateTimeField(auto_now=True)
 
 
 class Comment(models.Model):
     entry = models.ForeignKey(Entry, on_delete=models.CASCADE)
     message = models.CharField(max_length=255, default="Comment", blank=True)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=255)
+    related = models.ManyToManyField("self", blank=True)
+    parent = models.ForeignKey(
+        "self", on_delete=models.PROTECT, null=True, blank=True, related_name="children"
+    )
+
+
+class Label(models.Model):
+    code = models.CharField(max_length=32, primary_key=True)
+    name = models.CharField(max_length=255)
@@ -1,7 +1,7 @@
 """
 Pytest fixtures
 """
-from django.urls import path
+from django.urls import clear_url_caches, path
 
 import pytest
 
@@ -16,6 +16,7 @@ PASSWORD = "x"
 def urlpatterns():
     yield urls.urlpatterns
     urls.urlpatterns.clear()
+    clear_url_caches()
 
 
 @pytest.fixture
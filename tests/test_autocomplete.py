@@ -0,0 +1,105 @@
+"""
+Test fastview/views/autocomplete.py
+"""
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.exceptions import PermissionDenied
+
+import pytest
+
+from fastview import permissions
+from fastview.viewgroups import ModelViewGroup
+
+from .app.models import Entry
+
+
+@pytest.fixture
+def entries(add_url):
+    class Entries(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        autocomplete_fields = {"author": ["username"]}
+
+    add_url("", Entries().include(namespace="entries"))
+
+
+def test_autocomplete__prefix_search__paginated(entries, client, db):
+    for name in ["alice", "alex", "bob", "albert"]:
+        User.objects.create(username=name)
+    data = client.get("/autocomplete/author/?q=AL").json()
+    assert data == {
+        "results": [
+            {"id": User.objects.get(username=name).pk, "text": name}
+            for name in ["albert", "alex", "alice"]
+        ],
+        "more": False,
+    }
+
+
+def test_autocomplete__pages__more(entries, client, db):
+    for index in range(25):
+        User.objects.create(username=f"user{index:02}")
+
+    first = client.get("/autocomplete/author/?q=user").json()
+    assert len(first["results"]) == 20
+    assert first["more"] is True
+
+    second = client.get("/autocomplete/author/?q=user&page=2").json()
+    assert [result["text"] for result in second["results"]] == [
+        f"user{index:02}" for index in range(20, 25)
+    ]
+    assert second["more"] is False
+
+
+def test_autocomplete__unknown_field__404(entries, client, db):
+    assert client.get("/autocomplete/title/").status_code == 404
+
+
+def test_autocomplete__denied__no_access(urlpatterns, rf, db):
+    class Entries(ModelViewGroup):
+        model = Entry
+        permission = permissions.Staff()
+        autocomplete_fields = {"author": ["username"]}
+
+    request = rf.get("/autocomplete/author/")
+    request.user = AnonymousUser()
+    view = Entries().views["autocomplete"].as_view()
+    response = view(request, field_name="author")
+    assert response.status_code == 302
+
+
+def test_autocomplete__form_renders_selected_option_only(
+    entries, client, user_owner, user_other
+):
+    entry = Entry.objects.create(author=user_owner)
+    content = client.get(f"/{entry.pk}/update/").content.decode()
+    assert 'data-fastview-autocomplete="/autocomplete/author/"' in content
+    assert f'<option value="{user_owner.pk}" selected>owner</option>' in content
+    assert f'value="{user_other.pk}"' not in content
+
+
+def test_autocomplete__form_views_restricted__no_access(
+    urlpatterns, rf, user_owner, user_other
+):
+    class Entries(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        create_view = dict(permission=permissions.Staff())
+        update_view = dict(permission=permissions.Owner("author"))
+        autocomplete_fields = {"author": ["username"]}
+
+    Entry.objects.create(author=user_owner)
+    view = Entries().views["autocomplete"].as_view()
+
+    request = rf.get("/autocomplete/author/")
+    request.user = AnonymousUser()
+    assert view(request, field_name="author").status_code == 302
+
+    # Can update an entry, so can use the field
+    request = rf.get("/autocomplete/author/")
+    request.user = user_owner
+    assert view(request, field_name="author").status_code == 200
+
+    request = rf.get("/autocomplete/author/")
+    request.user = user_other
+    with pytest.raises(PermissionDenied):
+        view(request, field_name="author")
@@ -0,0 +1,87 @@
+"""
+Test fastview/cache.py
+"""
+from django.contrib.auth.models import Group, User
+
+import pytest
+
+from fastview import permissions
+from fastview.cache import bump_generation, get_cache, make_key, watch_model
+from fastview.views.generic import ListView
+
+from .app.models import Comment, Entry
+
+
+@pytest.fixture(params=["locmem", "filebased"])
+def fastview_cache(request, settings, tmp_path):
+    """
+    Run the test against each cache backend fastview needs to support in tests
+    """
+    backends = {
+        "locmem": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "filebased": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        },
+    }
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "fastview": backends[request.param],
+    }
+    settings.FASTVIEW_CACHE = "fastview"
+    yield get_cache()
+    get_cache().clear()
+
+
+def test_make_key__stable_until_bumped(fastview_cache):
+    key = make_key("part", 1, models=[Entry, "app.Comment"])
+    assert make_key("part", 1, models=["app.Comment", Entry]) == key
+    assert make_key("part", 2, models=[Entry, Comment]) != key
+
+    bump_generation(Comment)
+    assert make_key("part", 1, models=[Entry, Comment]) != key
+
+
+def test_make_key__bump_unrelated__unchanged(fastview_cache):
+    key = make_key("part", models=[Entry])
+    bump_generation(Comment)
+    assert make_key("part", models=[Entry]) == key
+
+
+def test_watch_model__save_and_delete_bump(fastview_cache, user_owner):
+    watch_model(Entry)
+    key = make_key(models=[Entry])
+    entry = Entry.objects.create(author=user_owner)
+    saved_key = make_key(models=[Entry])
+    assert saved_key != key
+
+    entry.delete()
+    assert make_key(models=[Entry]) != saved_key
+
+
+def test_watch_model__m2m_change_bumps_both_sides(fastview_cache, user_owner):
+    watch_model(User)
+    group = Group.objects.create(name="group")
+    user_key = make_key(models=[User])
+    group_key = make_key(models=[Group])
+
+    user_owner.groups.add(group)
+    assert make_key(models=[User]) != user_key
+    assert make_key(models=[Group]) != group_key
+
+
+def test_view_cache_models__declared_models_invalidate(fastview_cache, rf, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        cache_results = True
+        cache_models = ["app.Comment"]
+
+    view = EntryList()
+    view.setup(rf.get("/"))
+    assert Comment in view.get_cache_models()
+
+    entry = Entry.objects.create(author=user_owner)
+    key = view.get_results_cache_key()
+    Comment.objects.create(entry=entry)
+    assert view.get_results_cache_key() != key
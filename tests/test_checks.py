@@ -0,0 +1,111 @@
+"""
+Test fastview/checks.py
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from fastview import permissions
+from fastview.checks import (
+    W_MISSING_INDEX,
+    W_VIEW_ERROR,
+    check_indexes,
+    find_index_issues,
+    get_view_field_usage,
+    resolve_field_path,
+)
+from fastview.viewgroups import ModelViewGroup
+from fastview.views.generic import ListView
+
+from .app.models import Comment, Entry
+
+
+def test_resolve_field_path__follows_relations():
+    model, field, lookup = resolve_field_path(Comment, "entry__title__icontains")
+    assert model == Entry
+    assert field.name == "title"
+    assert lookup == "icontains"
+
+
+def test_resolve_field_path__lookup_on_relation():
+    model, field, lookup = resolve_field_path(Entry, "author__in")
+    assert model == Entry
+    assert field.name == "author"
+    assert lookup == "in"
+
+
+def test_find_index_issues__unindexed_filter_reported():
+    class EntryList(ListView):
+        model = Entry
+        fields = ["title"]
+        filters = ["title", "author"]
+
+    issues = find_index_issues([EntryList])
+    assert [(issue.id, issue.label) for issue in issues] == [
+        (W_MISSING_INDEX, "app.Entry.title")
+    ]
+    assert issues[0].sources == {
+        "tests.test_checks.test_find_index_issues__unindexed_filter_reported."
+        "<locals>.EntryList (filter)",
+        "tests.test_checks.test_find_index_issues__unindexed_filter_reported."
+        "<locals>.EntryList (order)",
+    }
+
+
+def test_find_index_issues__owner_on_indexed_fk_not_reported():
+    class EntryList(ListView):
+        model = Entry
+        row_permission = permissions.Owner("author")
+
+    assert find_index_issues([EntryList]) == []
+
+
+def test_check_indexes__finds_viewgroup_views(add_url):
+    class Entries(ModelViewGroup):
+        model = Entry
+        index_view = dict(search_fields=["title__exact"])
+
+    add_url("", Entries().include(namespace="entries"))
+    warnings = check_indexes()
+    assert len(warnings) == 1
+    assert warnings[0].id == W_MISSING_INDEX
+    assert "Entries.index (search)" in warnings[0].hint
+
+
+def test_index_report__migration_stub(add_url):
+    class Entries(ModelViewGroup):
+        model = Entry
+        index_view = dict(fields=["title"])
+
+    add_url("", Entries().include(namespace="entries"))
+    out = StringIO()
+    call_command("fastview_index_report", "--migration", stdout=out)
+    stub = out.getvalue()
+    assert "migrations.AddIndex(" in stub
+    assert "model_name='entry'" in stub
+    assert "fields=['title']" in stub
+
+
+def test_get_view_field_usage__autocomplete_search_fields():
+    class Entries(ModelViewGroup):
+        model = Entry
+        autocomplete_fields = {"author": ["username"]}
+
+    usages = list(get_view_field_usage(Entries().views["autocomplete"]))
+    assert [(usage.model, usage.field.name, usage.lookup) for usage in usages] == [
+        (User, "username", "istartswith")
+    ]
+    assert usages[0].source == "Entries.autocomplete (autocomplete)"
+
+
+def test_check_indexes__misconfigured_view__reported_as_warning(add_url):
+    class Entries(ModelViewGroup):
+        model = Entry
+        index_view = dict(filters=["missing"], search_fields=["title__exact"])
+
+    add_url("", Entries().include(namespace="entries"))
+    messages = check_indexes()
+    assert [message.id for message in messages] == [W_VIEW_ERROR]
+    assert not messages[0].is_serious()
+    assert messages[0].msg.startswith("Entries.index could not be checked")
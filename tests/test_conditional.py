@@ -0,0 +1,132 @@
+"""
+Test conditional GET support
+"""
+import time
+
+from django.utils.http import http_date
+
+from fastview import permissions
+from fastview.views.generic import DetailView, ListView
+from fastview.views.related import RelatedSection
+
+from .app.models import Comment, Entry
+
+
+def test_detail__etag_matches__not_modified(add_url, client, user_owner):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        version_field = "updated"
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    add_url("<int:pk>/", EntryDetail.as_view())
+    response = client.get(f"/{entry.pk}/")
+    assert response.status_code == 200
+    assert "Last-Modified" in response
+    etag = response["ETag"]
+
+    response = client.get(f"/{entry.pk}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    entry.save()
+    response = client.get(f"/{entry.pk}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_detail__related_changed__modified(add_url, client, user_owner):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        version_field = "updated"
+        related_sections = [RelatedSection("comment_set", fields=["message"])]
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    comment = Comment.objects.create(entry=entry, message="before")
+    add_url("<int:pk>/", EntryDetail.as_view())
+    response = client.get(f"/{entry.pk}/")
+    assert "Last-Modified" not in response
+    etag = response["ETag"]
+    assert client.get(f"/{entry.pk}/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    comment.message = "after"
+    comment.save()
+    response = client.get(f"/{entry.pk}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.context_data["related_sections"][0].rows == [["after"]]
+
+
+def test_list__not_modified__skips_rows(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        version_field = "updated"
+
+    first = Entry.objects.create(title="1", author=user_owner)
+    Entry.objects.create(title="2", author=user_owner)
+    add_url("", EntryList.as_view())
+    etag = client.get("/")["ETag"]
+
+    # Only the aggregate query
+    with django_assert_num_queries(1):
+        response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    # Deleting changes the count
+    first.delete()
+    assert client.get("/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_list__different_query__different_etag(add_url, client, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        search_fields = ["title"]
+        version_field = "updated"
+
+    Entry.objects.create(title="entry", author=user_owner)
+    add_url("", EntryList.as_view())
+    assert client.get("/")["ETag"] != client.get("/?q=entry")["ETag"]
+
+
+def test_list__limit__etag_from_filtered_list(add_url, client, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        version_field = "updated"
+
+    Entry.objects.create(title="1", author=user_owner)
+    Entry.objects.create(title="2", author=user_owner)
+    add_url("", EntryList.as_view())
+    response = client.get("/?l=1")
+    assert response.status_code == 200
+    assert len(response.context_data["object_list"]) == 1
+    assert client.get("/?l=1", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+
+def test_list__deleted__if_modified_since__modified(add_url, client, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        version_field = "updated"
+
+    Entry.objects.create(title="1", author=user_owner)
+    second = Entry.objects.create(title="2", author=user_owner)
+    add_url("", EntryList.as_view())
+    response = client.get("/")
+    assert "Last-Modified" not in response
+
+    second.delete()
+    since = http_date(time.time() + 60)
+    response = client.get("/", HTTP_IF_MODIFIED_SINCE=since)
+    assert response.status_code == 200
+    assert len(response.context_data["object_list"]) == 1
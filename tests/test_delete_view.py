@@ -0,0 +1,221 @@
+"""
+Test DeleteView
+"""
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.exceptions import PermissionDenied
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from fastview import permissions
+from fastview.deletion import run_deletion_job, start_deletion
+from fastview.models import DeletionJob
+from fastview.viewgroups import ModelViewGroup
+from fastview.views.cascade import get_cascade
+from fastview.views.deletions import DeletionListView
+from fastview.views.generic import DeleteView
+
+from .app.models import Comment, Entry, Tag
+
+
+def num_count_queries(queries):
+    return len(
+        [q for q in queries.captured_queries if q["sql"].startswith("SELECT COUNT")]
+    )
+
+
+class UserDelete(DeleteView):
+    model = User
+    permission = permissions.Public()
+
+
+def test_cascade_summary__counts_without_loading(add_url, client, user_owner):
+    entries = [Entry.objects.create(author=user_owner) for _ in range(2)]
+    for entry in entries + [entries[0]]:
+        Comment.objects.create(entry=entry)
+    add_url("<int:pk>/", UserDelete.as_view())
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/{user_owner.pk}/")
+
+    cascade = response.context["cascade"]
+    assert [(count.model, count.total) for count in cascade] == [
+        (Entry, 2),
+        (Comment, 3),
+    ]
+    assert response.context["cascade_deleted"] == 5
+    assert not response.context["is_large_cascade"]
+
+    # Only the user is loaded; related objects are counted
+    sql = [query["sql"] for query in queries.captured_queries]
+    assert len([query for query in sql if query.startswith("SELECT COUNT")]) == 4
+    assert len([query for query in sql if not query.startswith("SELECT COUNT")]) == 1
+
+
+def test_cascade_summary__large__flagged(add_url, client, user_owner):
+    for _ in range(3):
+        Entry.objects.create(author=user_owner)
+    add_url("<int:pk>/", UserDelete.config(large_cascade=2).as_view())
+
+    response = client.get(f"/{user_owner.pk}/")
+    assert response.context["is_large_cascade"]
+    assert b"This will delete 3 related objects" in response.content
+
+
+def test_background_delete__deleted_in_chunks(add_url, client, user_owner):
+    entries = [Entry.objects.create(author=user_owner) for _ in range(2)]
+    for entry in entries + [entries[0]]:
+        Comment.objects.create(entry=entry)
+    view = UserDelete.config(
+        background_delete=4,
+        background_runner="command",
+        background_batch_size=2,
+        background_message="",
+        success_url="/",
+    )
+    add_url("<int:pk>/", view.as_view())
+
+    response = client.post(f"/{user_owner.pk}/")
+    assert response.status_code == 302
+    assert User.objects.filter(pk=user_owner.pk).exists()
+    job = DeletionJob.objects.get()
+    assert job.status == DeletionJob.STATUS_PENDING
+
+    with CaptureQueriesContext(connection) as queries:
+        assert run_deletion_job(job)
+
+    comment_deletes = [
+        query
+        for query in queries.captured_queries
+        if query["sql"].startswith('DELETE FROM "app_comment" WHERE "app_comment"."id"')
+    ]
+    assert len(comment_deletes) == 2
+    job.refresh_from_db()
+    assert job.status == DeletionJob.STATUS_DONE
+    assert (job.total, job.deleted, job.progress) == (5, 5, 100)
+    assert not User.objects.filter(pk=user_owner.pk).exists()
+    assert not Comment.objects.exists()
+
+    # Already run
+    assert not run_deletion_job(job)
+
+
+def test_background_delete__beyond_summary_depth__chunked(monkeypatch, user_owner):
+    # Limit the summary depth so comments are past it
+    monkeypatch.setattr(get_cascade, "__defaults__", (1,))
+    entry = Entry.objects.create(author=user_owner)
+    Comment.objects.create(entry=entry)
+    job = start_deletion(user_owner, runner="command")
+
+    with CaptureQueriesContext(connection) as queries:
+        assert run_deletion_job(job)
+
+    assert any(
+        query["sql"].startswith('DELETE FROM "app_comment" WHERE "app_comment"."id"')
+        for query in queries.captured_queries
+    )
+    job.refresh_from_db()
+    assert (job.total, job.deleted) == (2, 2)
+    assert not Comment.objects.exists()
+
+
+def test_background_delete__worker_command_and_progress(add_url, client, user_owner):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        deletions_view = DeletionListView
+
+    entry = Entry.objects.create(title="doomed", author=user_owner)
+    Comment.objects.create(entry=entry)
+    start_deletion(entry, runner="command")
+    add_url("entries/", EntryViews().include(namespace="entries"))
+    response = client.get("/entries/deletions/")
+    assert b"<td>Pending</td>" in response.content
+
+    # Rows don't get the entry views' links with the job's pk
+    (job,) = response.context_data["annotated_object_list"]()
+    assert not hasattr(job, "get_update_url")
+    assert job.action_links() == []
+
+    out = StringIO()
+    call_command("fastview_delete_worker", stdout=out)
+    assert "Done" in out.getvalue()
+    assert not Entry.objects.exists()
+    assert b"<td>Done</td>" in client.get("/entries/deletions/").content
+
+
+def test_background_delete__pending__object_hidden(add_url, client, rf, user_owner):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        update_view = dict(permission=permissions.Public())
+        delete_view = dict(
+            permission=permissions.Public(),
+            background_delete=0,
+            background_runner="command",
+        )
+
+    doomed = Entry.objects.create(title="doomed", author=user_owner)
+    Entry.objects.create(title="kept", author=user_owner)
+    viewgroup = EntryViews()
+    add_url("entries/", viewgroup.include(namespace="entries"))
+    start_deletion(doomed, runner="command")
+
+    response = client.get("/entries/")
+    assert [obj.title for obj in response.context_data["object_list"]] == ["kept"]
+
+    # The object can't be found to check permission against
+    for view, method in [
+        (viewgroup.update_view, rf.get),
+        (viewgroup.delete_view, rf.post),
+    ]:
+        request = method("/")
+        request.user = user_owner
+        with pytest.raises(PermissionDenied):
+            view.as_view()(request, pk=doomed.pk)
+    assert DeletionJob.objects.count() == 1
+
+
+def test_deletion_list__limit(add_url, client, user_owner):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        deletions_view = DeletionListView
+
+    for title in ["one", "two"]:
+        start_deletion(Entry.objects.create(title=title, author=user_owner))
+    add_url("entries/", EntryViews().include(namespace="entries"))
+    response = client.get("/entries/deletions/?l=1")
+    assert response.status_code == 200
+    assert len(response.context_data["object_list"]) == 1
+
+
+def test_background_delete__protected__not_started(add_url, client, db):
+    tag = Tag.objects.create(name="parent")
+    tag.related.add(Tag.objects.create(name="related"))
+    Tag.objects.create(name="child", parent=tag)
+
+    class TagDelete(DeleteView):
+        model = Tag
+        permission = permissions.Public()
+        background_delete = 0
+        background_runner = "command"
+        success_url = "/"
+
+    add_url("<int:pk>/", TagDelete.as_view())
+    with CaptureQueriesContext(connection) as get_queries:
+        client.get(f"/{tag.pk}/")
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(f"/{tag.pk}/")
+    assert response.status_code == 200
+
+    # The cascade is only counted once
+    assert num_count_queries(queries) == num_count_queries(get_queries)
+    assert response.context["is_protected"]
+    assert b"Protected objects must be removed" in response.content
+    assert not DeletionJob.objects.exists()
+    assert Tag.objects.filter(pk=tag.pk).exists()
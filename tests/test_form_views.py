@@ -0,0 +1,303 @@
+"""
+Test saving objects through form views
+"""
+
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.db.models.signals import m2m_changed
+from django.forms import ModelForm
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from fastview import permissions
+from fastview.forms import CONFLICT_MESSAGE, VERSION_FIELD_NAME, InlineParentModelForm
+from fastview.views.generic import CreateView, UpdateView
+
+from .app.models import Entry, Label, Tag
+
+
+@pytest.fixture
+def update_entry(add_url):
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title", "author"]
+        success_url = "/"
+        success_message = ""
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    return UpdateEntry
+
+
+def get_updates(queries):
+    return [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("UPDATE")
+    ]
+
+
+def test_update__changed_fields_saved(update_entry, client, user_owner):
+    entry = Entry.objects.create(title="before", author=user_owner)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            f"/{entry.pk}/", {"title": "after", "author": user_owner.pk}
+        )
+    assert response.status_code == 302
+
+    updates = get_updates(queries)
+    assert len(updates) == 1
+    assert '"title"' in updates[0]
+    assert '"updated"' in updates[0]
+    assert '"author_id"' not in updates[0]
+    entry.refresh_from_db()
+    assert entry.title == "after"
+
+
+def test_update__unchanged__not_saved(update_entry, client, user_owner):
+    entry = Entry.objects.create(title="before", author=user_owner)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            f"/{entry.pk}/", {"title": "before", "author": user_owner.pk}
+        )
+    assert response.status_code == 302
+    assert get_updates(queries) == []
+
+
+def test_update__changed_by_view__saved(add_url, client, user_owner, user_other):
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        success_url = "/"
+        success_message = ""
+
+        def form_valid(self, form):
+            form.instance.author = user_other
+            return super().form_valid(form)
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    entry = Entry.objects.create(title="before", author=user_owner)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(f"/{entry.pk}/", {"title": "after"})
+    assert response.status_code == 302
+
+    updates = get_updates(queries)
+    assert len(updates) == 1
+    assert '"author_id"' in updates[0]
+    entry.refresh_from_db()
+    assert (entry.title, entry.author) == ("after", user_other)
+
+
+def test_update__form_overrides_save__full_save(add_url, client, user_owner):
+    class EntryForm(ModelForm):
+        def save(self, commit=True):
+            self.instance.title = self.instance.title.upper()
+            return super().save(commit)
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        form_class = EntryForm
+        fields = ["title"]
+        success_url = "/"
+        success_message = ""
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    entry = Entry.objects.create(title="before", author=user_owner)
+    response = client.post(f"/{entry.pk}/", {"title": "after"})
+    assert response.status_code == 302
+    entry.refresh_from_db()
+    assert entry.title == "AFTER"
+
+
+def test_create__user_supplied_pk__saved(add_url, client, db):
+    class CreateLabel(CreateView):
+        model = Label
+        permission = permissions.Public()
+        fields = ["code", "name"]
+        success_url = "/"
+        success_message = ""
+
+    add_url("", CreateLabel.as_view())
+    response = client.post("/", {"code": "new", "name": "New"})
+    assert response.status_code == 302
+    assert Label.objects.get(code="new").name == "New"
+
+
+def test_form_partial_save__adding__created(db):
+    class LabelForm(InlineParentModelForm):
+        class Meta:
+            model = Label
+            fields = ["code", "name"]
+
+    form = LabelForm({"code": "new", "name": "New"})
+    form.partial_save = True
+    assert form.is_valid()
+    form.save()
+    assert Label.objects.get(code="new").name == "New"
+
+
+@pytest.fixture
+def update_entry_locked(add_url):
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title", "author"]
+        success_url = "/"
+        success_message = ""
+        optimistic_lock = True
+        version_field = "updated"
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    return UpdateEntry
+
+
+def get_post_data(response):
+    form = response.context_data["form"]
+    return {name: form[name].value() for name in form.fields}
+
+
+def test_optimistic_lock__current_version__saved(
+    update_entry_locked, client, user_owner
+):
+    entry = Entry.objects.create(title="before", author=user_owner)
+    data = get_post_data(client.get(f"/{entry.pk}/"))
+    assert data[VERSION_FIELD_NAME] == entry.updated.isoformat()
+
+    data["title"] = "after"
+    response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 302
+    updated = Entry.objects.get(pk=entry.pk)
+    assert updated.title == "after"
+    assert updated.updated > entry.updated
+
+
+def test_optimistic_lock__unchanged__not_claimed(add_url, client, user_owner):
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title", "author"]
+        success_url = "/"
+        success_message = ""
+        optimistic_lock = True
+        version_field = "updated"
+        cache_objects = True
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    entry = Entry.objects.create(title="before", author=user_owner)
+
+    data = get_post_data(client.get(f"/{entry.pk}/"))
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 302
+    assert get_updates(queries) == []
+
+    # The cached object still has the current version
+    data = get_post_data(client.get(f"/{entry.pk}/"))
+    data["title"] = "after"
+    response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 302
+    assert Entry.objects.get(pk=entry.pk).title == "after"
+
+
+def test_optimistic_lock__stale_version__not_saved(
+    update_entry_locked, client, user_owner
+):
+    entry = Entry.objects.create(title="before", author=user_owner)
+    data = get_post_data(client.get(f"/{entry.pk}/"))
+    Entry.objects.get(pk=entry.pk).save()
+
+    data["title"] = "after"
+    response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 200
+    assert response.context_data["form"].errors["__all__"] == [CONFLICT_MESSAGE]
+    assert Entry.objects.get(pk=entry.pk).title == "before"
+
+
+def test_optimistic_lock__changed_during_save__conflict(
+    update_entry_locked, rf, user_owner
+):
+    entry = Entry.objects.create(title="before", author=user_owner)
+    data = {
+        "title": "after",
+        "author": user_owner.pk,
+        VERSION_FIELD_NAME: entry.updated.isoformat(),
+    }
+    view = update_entry_locked()
+    view.setup(rf.post("/", data), pk=entry.pk)
+    view.object = Entry.objects.get(pk=entry.pk)
+    form = view.get_form()
+    assert form.is_valid()
+
+    # Another request saves between validation and save
+    Entry.objects.get(pk=entry.pk).save()
+    response = view.form_valid(form)
+    assert response.status_code == 200
+    assert form.errors["__all__"] == [CONFLICT_MESSAGE]
+    assert Entry.objects.get(pk=entry.pk).title == "before"
+
+
+def test_update__m2m__saves_difference(add_url, client, user_owner):
+    class UpdateUser(UpdateView):
+        model = User
+        permission = permissions.Public()
+        fields = ["username", "groups"]
+        success_url = "/"
+        success_message = ""
+
+    add_url("<int:pk>/", UpdateUser.as_view())
+    keep, remove, add = [Group.objects.create(name=name) for name in "abc"]
+    user_owner.groups.add(keep, remove)
+
+    changes = []
+
+    def receiver(action, pk_set, **kwargs):
+        changes.append((action, pk_set))
+
+    m2m_changed.connect(receiver, sender=User.groups.through)
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                f"/{user_owner.pk}/",
+                {"username": "owner", "groups": [keep.pk, add.pk]},
+            )
+    finally:
+        m2m_changed.disconnect(receiver, sender=User.groups.through)
+
+    assert response.status_code == 302
+    assert set(user_owner.groups.all()) == {keep, add}
+    through_queries = [
+        query["sql"].split()[0]
+        for query in queries.captured_queries
+        if 'FROM "auth_user_groups"' in query["sql"]
+        or 'INTO "auth_user_groups"' in query["sql"]
+    ]
+    assert through_queries == ["SELECT", "DELETE", "INSERT"]
+    assert changes == [
+        ("pre_remove", {remove.pk}),
+        ("post_remove", {remove.pk}),
+        ("pre_add", {add.pk}),
+        ("post_add", {add.pk}),
+    ]
+
+
+def test_update__symmetrical_m2m__saves_both_directions(add_url, client, db):
+    class UpdateTag(UpdateView):
+        model = Tag
+        permission = permissions.Public()
+        fields = ["name", "related"]
+        success_url = "/"
+        success_message = ""
+
+    add_url("<int:pk>/", UpdateTag.as_view())
+    tag, keep, remove, add = [Tag.objects.create(name=name) for name in "abcd"]
+    tag.related.add(keep, remove)
+
+    response = client.post(f"/{tag.pk}/", {"name": "a", "related": [keep.pk, add.pk]})
+
+    assert response.status_code == 302
+    assert set(tag.related.all()) == {keep, add}
+    assert set(add.related.all()) == {tag}
+    assert set(remove.related.all()) == set()
@@ -0,0 +1,90 @@
+"""
+Test fastview/views/imports.py
+"""
+from django.contrib.auth.models import AnonymousUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from fastview import permissions
+from fastview.viewgroups import ModelViewGroup
+from fastview.views.imports import ImportView
+
+from .app.models import Entry
+
+
+class EntryImport(ImportView):
+    model = Entry
+    permission = permissions.Public()
+    fields = ["title", "author"]
+
+
+def upload(content, name="entries.csv"):
+    return SimpleUploadedFile(name, content.encode())
+
+
+def test_import_csv__valid_rows_created_in_batches(add_url, client, user_owner):
+    add_url("", EntryImport.config(batch_size=2).as_view())
+    pk = user_owner.pk
+    content = f"title,author\none,{pk}\ntwo,{pk}\n,{pk}\nthree,{pk}\nfour,0\n"
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post("/", {"file": upload(content), "format": "csv"})
+
+    assert response.status_code == 200
+    result = response.context["result"]
+    assert result.created == 3
+    assert result.failed == 2
+    assert [number for number, messages in result.errors] == [3, 5]
+    assert result.errors[0][1] == ["title: This field is required."]
+    assert list(Entry.objects.order_by("pk").values_list("title", flat=True)) == [
+        "one",
+        "two",
+        "three",
+    ]
+    inserts = [q for q in queries.captured_queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 2
+
+
+def test_import_json__errors_bounded(add_url, client, user_owner):
+    add_url("", EntryImport.config(max_errors=1).as_view())
+    content = "\n".join(
+        [
+            f'{{"title": "one", "author": {user_owner.pk}}}',
+            "not json",
+            "[]",
+            "",
+        ]
+    )
+
+    response = client.post(
+        "/", {"file": upload(content, "entries.jsonl"), "format": "json"}
+    )
+
+    result = response.context["result"]
+    assert result.created == 1
+    assert result.failed == 2
+    assert result.errors == [(2, ["Invalid JSON"])]
+    assert result.errors_truncated
+    assert b"Only the first 1 errors are shown" in response.content
+
+
+def test_import__viewgroup__uses_create_permission(rf, user_owner):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        create_view = dict(permission=permissions.Login())
+        import_view = ImportView
+
+    content = f"title,author\none,{user_owner.pk}\n"
+    request = rf.post("/", {"file": upload(content), "format": "csv"})
+    request.user = AnonymousUser()
+    response = EntryViews().views["import"].as_view()(request)
+    assert response.status_code == 302
+    assert not Entry.objects.exists()
+
+    request = rf.post("/", {"file": upload(content), "format": "csv"})
+    request.user = user_owner
+    response = EntryViews().views["import"].as_view()(request)
+    assert response.status_code == 200
+    assert Entry.objects.count() == 1
@@ -1,8 +1,16 @@
 """
 Test viewgroup
 """
+from django import forms
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
 from fastview import permissions
-from fastview.forms import InlineParentModelForm
+from fastview.forms import InlineChildModelForm, InlineParentModelForm
 from fastview.views.generic import UpdateView
 from fastview.views.inlines import Inline
 
@@ -37,3 +45,322 @@ def test_inline_formset__formset_has_data(add_url, client, user_owner):
     assert formset.forms[2]["id"].value() is None
     assert formset.forms[3]["id"].value() is None
     assert formset.forms[4]["id"].value() is None
+
+
+def test_inline_formset__classes_reused(rf, user_owner):
+    class InlineComment(Inline):
+        model = Comment
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        inlines = [InlineComment]
+
+    entry = Entry.objects.create(author=user_owner)
+    forms = []
+    for _ in range(2):
+        view = UpdateEntry()
+        view.setup(rf.get("/"), pk=entry.pk)
+        view.object = entry
+        forms.append(view.get_form())
+
+    assert forms[0].__class__ is forms[1].__class__
+    assert forms[0].formsets[0].__class__ is forms[1].formsets[0].__class__
+
+
+def test_form_class__dynamic_fields__not_shared(rf):
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+
+        def get_fields(self):
+            return ["title"] if self.request.GET.get("short") else ["title", "author"]
+
+    classes = []
+    for url in ["/", "/?short=1", "/"]:
+        view = UpdateEntry()
+        view.setup(rf.get(url))
+        classes.append(view.get_form_class())
+
+    assert classes[0] is classes[2]
+    assert classes[0] is not classes[1]
+    assert list(classes[1].base_fields) == ["title"]
+
+
+def test_inline_formset__choices_shared(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class CommentForm(InlineChildModelForm):
+        reviewer = forms.ModelChoiceField(User.objects.all(), required=False)
+
+    class InlineComment(Inline):
+        model = Comment
+        form = CommentForm
+        fields = ["message"]
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title", "author"]
+        inlines = [InlineComment]
+
+    entry = Entry.objects.create(author=user_owner)
+    Comment.objects.create(entry=entry, message="test 1")
+    add_url("<int:pk>/", UpdateEntry.as_view())
+
+    # Entry, comments, and a single query for the user choices
+    with django_assert_num_queries(3):
+        response = client.get(f"/{entry.pk}/")
+    content = response.content.decode()
+    assert content.count(f'<option value="{user_owner.pk}"') == 6
+
+
+def _comment_formset_data(entry, comments):
+    """
+    Build POST data for an UpdateEntry form with the InlineComment formset
+    """
+    prefix = "None__formset_0"
+    data = {
+        "title": entry.title,
+        f"{prefix}-TOTAL_FORMS": len(comments),
+        f"{prefix}-INITIAL_FORMS": sum(1 for pk, _, _ in comments if pk),
+        f"{prefix}-MIN_NUM_FORMS": 0,
+        f"{prefix}-MAX_NUM_FORMS": 1000,
+    }
+    for index, (pk, message, delete) in enumerate(comments):
+        data[f"{prefix}-{index}-id"] = pk or ""
+        data[f"{prefix}-{index}-entry"] = entry.pk
+        data[f"{prefix}-{index}-message"] = message
+        if delete:
+            data[f"{prefix}-{index}-DELETE"] = "on"
+    return data
+
+
+@pytest.fixture
+def update_entry_comments(add_url):
+    class InlineComment(Inline):
+        model = Comment
+        fields = ["message"]
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        inlines = [InlineComment]
+        success_message = ""
+        success_url = "/"
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+
+
+def test_inline_formset__save__bulk_queries(update_entry_comments, client, user_owner):
+    entry = Entry.objects.create(author=user_owner)
+    comments = [
+        Comment.objects.create(entry=entry, message=f"test {i}") for i in range(4)
+    ]
+    data = _comment_formset_data(
+        entry,
+        [
+            (comments[0].pk, "changed 0", False),
+            (comments[1].pk, "changed 1", False),
+            (comments[2].pk, "test 2", True),
+            (comments[3].pk, "test 3", True),
+            (None, "new 1", False),
+            (None, "new 2", False),
+            (None, "Comment", False),  # Unchanged extra form
+        ],
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 302
+
+    statements = [query["sql"].split()[0] for query in queries.captured_queries]
+    assert statements.count("INSERT") == 1
+    assert statements.count("UPDATE") == 1  # Entry is unchanged, so not saved
+    assert statements.count("DELETE") == 1
+    assert sorted(entry.comment_set.values_list("message", flat=True)) == [
+        "changed 0",
+        "changed 1",
+        "new 1",
+        "new 2",
+    ]
+
+
+def test_inline_formset__save__receiver__saves_per_row(
+    update_entry_comments, client, user_owner
+):
+    saved = []
+
+    def receiver(sender, instance, **kwargs):
+        saved.append(instance.message)
+
+    entry = Entry.objects.create(author=user_owner)
+    comment = Comment.objects.create(entry=entry, message="test")
+    data = _comment_formset_data(
+        entry, [(comment.pk, "changed", False), (None, "new", False)]
+    )
+
+    post_save.connect(receiver, sender=Comment)
+    try:
+        response = client.post(f"/{entry.pk}/", data)
+    finally:
+        post_save.disconnect(receiver, sender=Comment)
+
+    assert response.status_code == 302
+    assert saved == ["changed", "new"]
+
+
+def test_inline_formset__form_overrides_save__saves_per_row(
+    add_url, client, user_owner
+):
+    class CommentForm(InlineChildModelForm):
+        def save(self, commit=True):
+            self.instance.message = self.instance.message.upper()
+            return super().save(commit)
+
+    class InlineComment(Inline):
+        model = Comment
+        form = CommentForm
+        fields = ["message"]
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        inlines = [InlineComment]
+        success_message = ""
+        success_url = "/"
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+    entry = Entry.objects.create(author=user_owner)
+    comment = Comment.objects.create(entry=entry, message="test")
+    data = _comment_formset_data(
+        entry, [(comment.pk, "changed", False), (None, "new", False)]
+    )
+
+    response = client.post(f"/{entry.pk}/", data)
+    assert response.status_code == 302
+    assert sorted(entry.comment_set.values_list("message", flat=True)) == [
+        "CHANGED",
+        "NEW",
+    ]
+
+
+@pytest.fixture
+def update_entry_window(add_url):
+    class InlineComment(Inline):
+        model = Comment
+        fields = ["message"]
+        page_size = 2
+        ordering = ["-message"]
+        search_fields = ["message"]
+        extra = 1
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        inlines = [InlineComment]
+        success_message = ""
+        success_url = "/"
+
+    add_url("<int:pk>/", UpdateEntry.as_view())
+
+
+def test_inline_formset__window__renders_page(update_entry_window, client, user_owner):
+    entry = Entry.objects.create(author=user_owner)
+    for message in ["a", "b", "c", "d", "e"]:
+        Comment.objects.create(entry=entry, message=message)
+
+    response = client.get(f"/{entry.pk}/?None__formset_0-page=2")
+    formset = response.context_data["form"].formsets[0]
+    assert [form.instance.message for form in formset.initial_forms] == ["c", "b"]
+    assert formset.management_form["INITIAL_FORMS"].value() == 2
+    assert len(formset.forms) == 3
+    content = response.content.decode()
+    assert "Page 2 of 3" in content
+    assert "None__formset_0-page=1" in content
+    assert "None__formset_0-page=3" in content
+
+    response = client.get(f"/{entry.pk}/?None__formset_0-q=d")
+    formset = response.context_data["form"].formsets[0]
+    assert [form.instance.message for form in formset.initial_forms] == ["d"]
+
+
+def test_inline_formset__window__saves_submitted_rows(
+    update_entry_window, client, user_owner
+):
+    entry = Entry.objects.create(author=user_owner)
+    comments = [
+        Comment.objects.create(entry=entry, message=message) for message in "abcde"
+    ]
+    # Submit the second page, after "f" was added
+    Comment.objects.create(entry=entry, message="f")
+    data = _comment_formset_data(
+        entry,
+        [
+            (comments[2].pk, "c changed", False),
+            (comments[1].pk, "b", True),
+            (None, "Comment", False),
+        ],
+    )
+
+    response = client.post(f"/{entry.pk}/?None__formset_0-page=2", data)
+    assert response.status_code == 302
+    assert sorted(entry.comment_set.values_list("message", flat=True)) == [
+        "a",
+        "c changed",
+        "d",
+        "e",
+        "f",
+    ]
+
+
+def test_inline_formset__omitted_forms__not_loaded_or_saved(rf, user_owner):
+    class InlineComment(Inline):
+        model = Comment
+        fields = ["message"]
+
+    class UpdateEntry(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        inlines = [InlineComment]
+
+    entry = Entry.objects.create(author=user_owner)
+    comments = [
+        Comment.objects.create(entry=entry, message=message) for message in "abc"
+    ]
+    # The formset JavaScript left out the unchanged "a" and "c" forms
+    data = _comment_formset_data(entry, [(comments[1].pk, "b changed", False)])
+    data["None__formset_0-OMITTED_FORMS"] = 2
+
+    view = UpdateEntry()
+    view.setup(rf.post("/", data), pk=entry.pk)
+    view.object = entry
+    form = view.get_form()
+    formset = form.formsets[0]
+    assert formset.omitted_form_count() == 2
+    assert list(formset.get_queryset()) == [comments[1]]
+    assert form.is_valid()
+    form.save()
+    assert sorted(entry.comment_set.values_list("message", flat=True)) == [
+        "a",
+        "b changed",
+        "c",
+    ]
+
+
+def test_inline_formset__window_search__keeps_other_params(
+    update_entry_window, client, user_owner
+):
+    entry = Entry.objects.create(author=user_owner)
+    response = client.get(
+        f"/{entry.pk}/?other=1&other=2&None__formset_0-page=2&None__formset_0-q=x"
+    )
+    formset = response.context_data["form"].formsets[0]
+    assert formset.window_search_params == [("other", "1"), ("other", "2")]
+    content = response.content.decode()
+    assert '<input type="hidden" name="other" value="2">' in content
+    assert 'type="hidden" name="None__formset_0-page"' not in content
@@ -0,0 +1,106 @@
+"""
+Test fastview/views/actions.py
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from fastview import permissions
+from fastview.viewgroups import ModelViewGroup
+from fastview.views.actions import DeleteAction, UpdateAction
+from fastview.views.generic import ListView
+
+from .app.models import Entry
+
+
+@pytest.fixture
+def entry_list(urlpatterns):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        update_view = dict(permission=permissions.Owner("author"))
+        delete_view = dict(permission=permissions.Owner("author"))
+        index_view = dict(
+            search_fields=["title"],
+            bulk_actions=[
+                DeleteAction(batch_size=1, success_message=""),
+                UpdateAction(
+                    "rename",
+                    "Rename",
+                    values={"title": "renamed"},
+                    batch_size=2,
+                    success_message="",
+                ),
+            ],
+        )
+
+    return EntryViews().index_view.as_view()
+
+
+def test_delete__select_all__filtered_and_permitted(
+    rf, entry_list, user_owner, user_other
+):
+    Entry.objects.create(title="x1", author=user_owner)
+    Entry.objects.create(title="x2", author=user_owner)
+    Entry.objects.create(title="y1", author=user_owner)
+    Entry.objects.create(title="x3", author=user_other)
+
+    request = rf.post("/?q=x", {"action": "delete", "select_all": "1"})
+    request.user = user_owner
+    response = entry_list(request)
+
+    assert response.status_code == 302
+    assert response["Location"] == "/?q=x"
+    assert sorted(Entry.objects.values_list("title", flat=True)) == ["x3", "y1"]
+
+
+def test_update__selected__batched_set_based(rf, entry_list, user_owner, user_other):
+    owned = [Entry.objects.create(title=str(i), author=user_owner) for i in range(3)]
+    other = Entry.objects.create(title="other", author=user_other)
+    selected = [entry.pk for entry in owned] + [other.pk, "invalid"]
+
+    request = rf.post("/", {"action": "rename", "selected": selected})
+    request.user = user_owner
+    with CaptureQueriesContext(connection) as queries:
+        entry_list(request)
+
+    updates = [q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 2
+    assert Entry.objects.filter(title="renamed").count() == 3
+    other.refresh_from_db()
+    assert other.title == "other"
+
+
+def test_post__no_actions_or_editable_fields__not_allowed(rf, db, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+
+    request = rf.post("/", {"action": "delete"})
+    request.user = user_owner
+    response = EntryList.as_view()(request)
+    assert response.status_code == 405
+
+
+def test_render__form_id__unique_per_view(rf, db, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        bulk_actions = [DeleteAction()]
+
+    class OtherList(EntryList):
+        pass
+
+    Entry.objects.create(author=user_owner)
+    form_ids = []
+    for view in [EntryList, OtherList]:
+        request = rf.get("/")
+        request.user = user_owner
+        response = view.as_view()(request)
+        content = response.render().content.decode()
+        form_id = response.context_data["bulk_actions_id"]
+        assert f'id="{form_id}"' in content
+        assert f'form="{form_id}"' in content
+        form_ids.append(form_id)
+    assert form_ids[0] != form_ids[1]
@@ -0,0 +1,73 @@
+"""
+Test ListView result caching
+"""
+from django.template import Context, Template
+from django.urls import path
+
+from fastview import permissions
+from fastview.views.generic import ListView
+
+from .app.models import Entry
+
+
+def test_list_cache__hit_skips_count_and_filter(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        paginate_by = 2
+        cache_results = True
+
+    for title in ["1", "2", "3"]:
+        Entry.objects.create(title=title, author=user_owner)
+
+    add_url("", EntryList.as_view())
+    with django_assert_num_queries(2):
+        response = client.get("/?o=-title")
+    assert [obj.title for obj in response.context_data["object_list"]] == ["3", "2"]
+
+    # Hit fetches the page by pk, and doesn't count
+    with django_assert_num_queries(1):
+        response = client.get("/?o=-title")
+    assert [obj.title for obj in response.context_data["object_list"]] == ["3", "2"]
+    assert response.context_data["paginator"].count == 3
+
+
+def test_list_cache__save_invalidates(add_url, client, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        cache_results = True
+
+    Entry.objects.create(title="1", author=user_owner)
+    add_url("", EntryList.as_view())
+    response = client.get("/")
+    assert len(response.context_data["object_list"]) == 1
+
+    Entry.objects.create(title="2", author=user_owner)
+    response = client.get("/")
+    assert len(response.context_data["object_list"]) == 2
+
+
+def test_list_cache__fragment_rendered_once(
+    urlpatterns, rf, user_owner, django_assert_num_queries
+):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_results = True
+
+    Entry.objects.create(title="cached", author=user_owner)
+    urlpatterns.append(path("", EntryList.as_view(), name="entries"))
+
+    template = Template('{% load fastview %}{% fragment "entries" %}')
+    context = Context({"request": rf.get("/")})
+    with django_assert_num_queries(1):
+        first = template.render(context)
+    with django_assert_num_queries(0):
+        second = template.render(context)
+    assert "cached" in first
+    assert first == second
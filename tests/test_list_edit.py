@@ -0,0 +1,76 @@
+"""
+Test ListView.editable_fields
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from fastview import permissions
+from fastview.viewgroups import ModelViewGroup
+
+from .app.models import Entry
+
+
+def _edit_data(rows):
+    data = {
+        "edit-TOTAL_FORMS": str(len(rows)),
+        "edit-INITIAL_FORMS": str(len(rows)),
+    }
+    for index, (pk, title) in enumerate(rows):
+        data[f"edit-{index}-id"] = str(pk)
+        data[f"edit-{index}-title"] = title
+    return data
+
+
+def test_editable__changed_permitted_rows_bulk_updated(
+    rf, urlpatterns, user_owner, user_other
+):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        update_view = dict(permission=permissions.Owner("author"))
+        index_view = dict(editable_fields=["title"])
+
+    changed = Entry.objects.create(title="changed", author=user_owner)
+    unchanged = Entry.objects.create(title="unchanged", author=user_owner)
+    other = Entry.objects.create(title="other", author=user_other)
+
+    request = rf.post(
+        "/",
+        _edit_data(
+            [
+                (changed.pk, "new"),
+                (unchanged.pk, "unchanged"),
+                (other.pk, "not permitted"),
+            ]
+        ),
+    )
+    request.user = user_owner
+    with CaptureQueriesContext(connection) as queries:
+        response = EntryViews().index_view.as_view()(request)
+
+    assert response.status_code == 302
+    sql = [query["sql"] for query in queries.captured_queries]
+    assert len([query for query in sql if query.startswith("SELECT")]) == 2
+    assert len([query for query in sql if query.startswith("UPDATE")]) == 1
+    assert sorted(Entry.objects.values_list("title", flat=True)) == [
+        "new",
+        "other",
+        "unchanged",
+    ]
+
+
+def test_editable__invalid__shows_errors(add_url, client, user_owner):
+    class EntryViews(ModelViewGroup):
+        model = Entry
+        permission = permissions.Public()
+        index_view = dict(editable_fields=["title"])
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    add_url("entries/", EntryViews().include(namespace="entries"))
+    assert b'name="edit-0-title"' in client.get("/entries/").content
+
+    response = client.post("/entries/", _edit_data([(entry.pk, "x" * 300)]))
+    assert response.status_code == 200
+    assert b"Ensure this value has at most 255 characters" in response.content
+    entry.refresh_from_db()
+    assert entry.title == "entry"
@@ -0,0 +1,72 @@
+"""
+Test fastview/views/query.py
+"""
+from django.http import QueryDict
+from django.template import Context, Template
+
+from fastview import permissions
+from fastview.views.generic import ListView
+from fastview.views.query import ListQuery
+
+from .app.models import Entry
+
+
+def test_from_params__normalised():
+    query = ListQuery.from_params(
+        QueryDict("z=1&o=title,,-id,title&q=+term+&l=0&page=1&author=&a=2")
+    )
+    assert query.order == ("title", "-id")
+    assert query.search == "term"
+    assert query.limit == 0
+    assert query.page == ""
+    assert query.params == (("a", "2"), ("z", "1"))
+    assert query.to_querystring() == "a=2&o=title%2C-id&q=term&z=1"
+
+
+def test_from_params__equivalent_urls__equal():
+    first = ListQuery.from_params(QueryDict("q=term&author=1&l=5&l=bad"))
+    second = ListQuery.from_params(QueryDict("author=1&q=term&filter="))
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first.cache_key == second.cache_key
+
+
+def test_to_querystring__updates_normalised():
+    query = ListQuery.from_params(QueryDict("page=3&q=term&author=1"))
+    assert query.to_querystring(page=1) == "author=1&q=term"
+    assert query.to_querystring(author=None, o="-title") == "o=-title&page=3&q=term"
+
+
+def test_list_view__non_canonical__redirects(db, add_url, client):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        redirect_canonical = True
+
+    add_url("", EntryList.as_view())
+    response = client.get("/?q=&o=title&l=0")
+    assert response.status_code == 302
+    assert response["Location"] == "/?o=title"
+    assert client.get("/?o=title").status_code == 200
+
+
+def test_urlparams__uses_list_query(rf):
+    template = Template("{% load fastview %}{% urlparams page=2 %}")
+    context = Context(
+        {
+            "request": rf.get("/?b=1&a=1"),
+            "list_query": ListQuery.from_params(QueryDict("b=1&a=1&page=5")),
+        }
+    )
+    assert template.render(context) == "a=1&amp;b=1&amp;page=2"
+
+
+def test_list_view__non_canonical__not_redirected_by_default(db, add_url, client):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+
+    add_url("", EntryList.as_view())
+    assert client.get("/?q=&o=title&l=0").status_code == 200
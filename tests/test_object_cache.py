@@ -0,0 +1,59 @@
+"""
+Test the object cache
+"""
+from fastview import permissions
+from fastview.views.generic import DetailView, UpdateView
+
+from .app.models import Entry
+
+
+def test_object_cache__hit_skips_query(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_objects = True
+
+    entry = Entry.objects.create(title="cached", author=user_owner)
+    add_url("<int:pk>/", EntryDetail.as_view())
+    with django_assert_num_queries(1):
+        response = client.get(f"/{entry.pk}/")
+    assert b"cached" in response.content
+
+    with django_assert_num_queries(0):
+        response = client.get(f"/{entry.pk}/")
+    assert b"cached" in response.content
+
+
+def test_object_cache__save_invalidates(add_url, client, user_owner):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_objects = True
+
+    entry = Entry.objects.create(title="before", author=user_owner)
+    add_url("<int:pk>/", EntryDetail.as_view())
+    assert b"before" in client.get(f"/{entry.pk}/").content
+
+    entry.title = "after"
+    entry.save()
+    assert b"after" in client.get(f"/{entry.pk}/").content
+
+
+def test_object_cache__post__bypassed(rf, user_owner):
+    class EntryUpdate(UpdateView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_objects = True
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    view = EntryUpdate()
+    view.setup(rf.get("/"), pk=entry.pk)
+    assert view.is_object_cacheable()
+
+    view.setup(rf.post("/"), pk=entry.pk)
+    assert not view.is_object_cacheable()
@@ -0,0 +1,59 @@
+"""
+Test object views fetch their object once per request
+"""
+import pytest
+
+from fastview import permissions
+from fastview.views.generic import DeleteView, DetailView, UpdateView
+
+from .app.models import Entry
+
+
+def make_counting_view(view_cls, calls):
+    class CountingView(view_cls):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        success_url = "/"
+        success_message = ""
+
+        def get_object(self, queryset=None):
+            calls.append(queryset)
+            return super().get_object(queryset)
+
+    return CountingView
+
+
+@pytest.mark.parametrize(
+    "view_cls, method",
+    [
+        (DetailView, "get"),
+        (UpdateView, "get"),
+        (UpdateView, "post"),
+        (DeleteView, "get"),
+        (DeleteView, "post"),
+    ],
+)
+def test_object_view__get_object_called_once(
+    view_cls, method, add_url, client, user_owner
+):
+    calls = []
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    add_url("<int:pk>/", make_counting_view(view_cls, calls).as_view())
+    response = getattr(client, method)(f"/{entry.pk}/", {"title": "changed"})
+    assert response.status_code in (200, 302)
+    assert calls == [None]
+
+
+def test_detail_view__single_query(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    add_url("<int:pk>/", EntryDetail.as_view())
+    with django_assert_num_queries(1):
+        client.get(f"/{entry.pk}/")
@@ -0,0 +1,75 @@
+"""
+Test the shared page cache
+"""
+from django.contrib.auth.models import AnonymousUser
+
+from fastview import permissions
+from fastview.views.generic import DetailView, ListView
+
+from .app.models import Entry
+
+
+def test_page_cache__anonymous_hit_skips_view(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_pages = True
+        cache_timeout = 60
+
+    Entry.objects.create(title="cached", author=user_owner)
+    add_url("", EntryList.as_view())
+    first = client.get("/?b=2&a=1")
+    assert b"cached" in first.content
+    assert first["Vary"] == "Cookie"
+    assert "Cache-Control" not in first
+
+    # Same canonical URL
+    with django_assert_num_queries(0):
+        second = client.get("/?a=1&b=2")
+    assert second.content == first.content
+
+
+def test_page_cache__save_invalidates(add_url, client, user_owner):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        cache_pages = True
+
+    entry = Entry.objects.create(title="before", author=user_owner)
+    add_url("<int:pk>/", EntryDetail.as_view())
+    assert b"before" in client.get(f"/{entry.pk}/").content
+
+    entry.title = "after"
+    entry.save()
+    assert b"after" in client.get(f"/{entry.pk}/").content
+
+
+def test_page_cache__not_public__not_cached(rf):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Login()
+        cache_pages = True
+
+    view = EntryList()
+    view.setup(rf.get("/"))
+    assert not view.is_page_cacheable()
+
+
+def test_page_cache__authenticated__not_cached(rf, user_owner):
+    class EntryList(ListView):
+        model = Entry
+        permission = permissions.Public()
+        cache_pages = True
+
+    request = rf.get("/")
+    request.user = user_owner
+    view = EntryList()
+    view.setup(request)
+    assert not view.is_page_cacheable()
+
+    request.user = AnonymousUser()
+    assert view.is_page_cacheable()
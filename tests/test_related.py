@@ -0,0 +1,60 @@
+"""
+Test fastview/views/related.py
+"""
+from fastview import permissions
+from fastview.views.generic import DetailView
+from fastview.views.related import RelatedSection
+
+from .app.models import Comment, Entry
+
+
+def test_related_section__rows_prefetched(
+    add_url, client, user_owner, django_assert_num_queries
+):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        related_sections = [
+            RelatedSection("comment_set", fields=["message"], ordering=["-message"])
+        ]
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    for message in ["first", "second"]:
+        Comment.objects.create(entry=entry, message=message)
+    add_url("<int:pk>/", EntryDetail.as_view())
+
+    with django_assert_num_queries(2):
+        response = client.get(f"/{entry.pk}/")
+    section = response.context_data["related_sections"][0]
+    assert section.get_label() == "Comments"
+    assert section.labels == ["Message"]
+    assert section.rows == [["second"], ["first"]]
+    assert b"<td>second</td>" in response.content
+
+
+def test_related_section__limit(add_url, client, user_owner, django_assert_num_queries):
+    class EntryDetail(DetailView):
+        model = Entry
+        permission = permissions.Public()
+        fields = ["title"]
+        related_sections = [
+            RelatedSection(
+                "comment_set", fields=["message"], ordering=["message"], limit=2
+            )
+        ]
+
+    entry = Entry.objects.create(title="entry", author=user_owner)
+    for message in ["a", "b", "c"]:
+        Comment.objects.create(entry=entry, message=message)
+    add_url("<int:pk>/", EntryDetail.as_view())
+
+    with django_assert_num_queries(2):
+        response = client.get(f"/{entry.pk}/")
+    assert response.context_data["related_sections"][0].rows == [["a"], ["b"]]
+
+
+def test_related_section__related_model():
+    assert RelatedSection("comment_set").get_related_model(Entry) == Comment
+    user_model = Entry._meta.get_field("author").related_model
+    assert RelatedSection("entry_set").get_related_model(user_model) == Entry
@@ -0,0 +1,87 @@
+"""
+Test URL reversing
+"""
+from django.conf.urls.i18n import i18n_patterns
+from django.urls import clear_script_prefix, path, reverse, set_script_prefix
+from django.utils import translation
+
+from fastview import permissions
+from fastview.urls import cached_reverse
+from fastview.viewgroups import ModelViewGroup
+
+from .app.models import Entry
+
+
+class Entries(ModelViewGroup):
+    permission = permissions.Public()
+    model = Entry
+
+
+def test_cached_reverse__matches_reverse(add_url):
+    add_url("entries/", Entries().include(namespace="entries"))
+
+    assert cached_reverse("entries:index") == reverse("entries:index")
+    for pk in [1, 7, 1234567]:
+        for name in ["detail", "update", "delete"]:
+            assert cached_reverse(f"entries:{name}", pk) == reverse(
+                f"entries:{name}", args=[pk]
+            )
+
+
+def test_cached_reverse__script_prefix(add_url):
+    add_url("entries/", Entries().include(namespace="entries"))
+
+    assert cached_reverse("entries:update", 3) == "/entries/3/update/"
+    try:
+        set_script_prefix("/mount/")
+        assert cached_reverse("entries:update", 3) == "/mount/entries/3/update/"
+        assert cached_reverse("entries:update", 3) == reverse(
+            "entries:update", args=[3]
+        )
+        assert cached_reverse("entries:index") == "/mount/entries/"
+    finally:
+        clear_script_prefix()
+
+    assert cached_reverse("entries:update", 3) == "/entries/3/update/"
+
+
+def test_cached_reverse__other_pks_use_reverse(add_url):
+    add_url("entries/", Entries().include(namespace="entries"))
+
+    assert cached_reverse("entries:detail", "12") == reverse(
+        "entries:detail", args=["12"]
+    )
+
+
+def test_action_links__use_cached_urls(add_url, client, user_owner):
+    entry = Entry.objects.create(author=user_owner)
+    add_url("entries/", Entries().include(namespace="entries"))
+
+    # The test client does not set the script prefix from SCRIPT_NAME
+    try:
+        set_script_prefix("/mount/")
+        response = client.get("/entries/")
+    finally:
+        clear_script_prefix()
+    content = response.content.decode()
+    assert f'href="/mount/entries/{entry.pk}/update/"' in content
+    assert 'href="/mount/entries/create/"' in content
+
+    response = client.get("/entries/")
+    content = response.content.decode()
+    assert f'href="/entries/{entry.pk}/update/"' in content
+    assert 'href="/entries/create/"' in content
+
+
+def test_cached_reverse__language_prefix(urlpatterns):
+    urlpatterns += i18n_patterns(
+        path("entries/", Entries().include(namespace="entries"))
+    )
+
+    for language in ["en", "fr", "en"]:
+        with translation.override(language):
+            assert cached_reverse("entries:index") == f"/{language}/entries/"
+            assert cached_reverse("entries:update", 3) == reverse(
+                "entries:update", args=[3]
+            )
+            assert cached_reverse("entries:update", 3).startswith(f"/{language}/")
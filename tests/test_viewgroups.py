@@ -44,3 +44,43 @@ def test_modelviewgroup_index__index_lists(add_url, client, user_owner):
     add_url("", Entries().include(namespace="entries"))
     response = client.get("/")
     assert len(response.context_data["object_list"]) == 2
+
+
+def test_modelviewgroup_links__views_partitioned_and_sorted_once():
+    class Entries(ModelViewGroup):
+        permission = permissions.Public()
+        model = Entry
+        action_links = ["delete", "update", "index"]
+
+    entries = Entries()
+    assert set(entries.get_basic_views()) == {"index", "create", "autocomplete"}
+    assert set(entries.get_object_views()) == {"detail", "update", "delete"}
+
+    # Autocomplete is not linked to, and links follow action_links
+    assert [link.name for link in entries.get_basic_links()] == ["create", "index"]
+    links = entries.get_object_links(["delete", "update"])
+    assert [link.name for link in links] == ["delete", "update"]
+    assert entries.get_object_links(["delete", "update"]) is links
+
+
+def test_modelviewgroup_links__context_links_resolved(add_url, client, user_owner):
+    class Entries(ModelViewGroup):
+        permission = permissions.Public()
+        model = Entry
+
+    entry = Entry.objects.create(author=user_owner)
+    add_url("", Entries().include(namespace="entries"))
+    response = client.get("/")
+
+    context = response.context_data
+    assert context["can_create"]() is True
+    assert context["get_create_url"]() == "/create/"
+    assert context["action_links"]() == [("Add", "/create/")]
+
+    annotated = next(iter(context["annotated_object_list"]()))
+    assert annotated.can_update() is True
+    assert annotated.get_update_url() == f"/{entry.pk}/update/"
+    assert annotated.action_links() == [
+        ("Change", f"/{entry.pk}/update/"),
+        ("Delete", f"/{entry.pk}/delete/"),
+    ]